@@ -1,6 +1,13 @@
 from .client import AsyncClient, Client
 from .core import ApiError, BinaryResponse
 from .environment import Environment
+from .warm_up import warm_up
 
-
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BinaryResponse",
+    "Client",
+    "Environment",
+    "warm_up",
+]
@@ -0,0 +1,5 @@
+"""
+Benchmarks for the SDK request/response pipeline.
+
+Run `python -m local_api_21_py.bench --help` to list the available benchmarks.
+"""
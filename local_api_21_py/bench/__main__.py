@@ -0,0 +1,44 @@
+import argparse
+import sys
+import typing
+
+from local_api_21_py.bench import (
+    compression,
+    imports,
+    load,
+    micro,
+    pool,
+    sse,
+    upload,
+    validation,
+)
+
+BENCHMARKS: typing.Dict[str, typing.Tuple[typing.Any, str]] = {
+    "validation": (validation, "validated vs. trusted response model construction"),
+    "sse": (sse, "SSE decoding of large and tiny events"),
+    "pool": (pool, "connection pool sizing and warm-up against a loopback server"),
+    "upload": (upload, "peak memory of buffered vs. streamed spec uploads"),
+    "compression": (compression, "upload throughput with request compression"),
+    "micro": (micro, "ops/sec and allocations of the core request/response pipeline"),
+    "imports": (imports, "cold start cost of importing and constructing the client"),
+    "load": (
+        load,
+        "latency, throughput, CPU and RSS of sync, threaded and async clients",
+    ),
+}
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m local_api_21_py.bench")
+    subparsers = parser.add_subparsers(dest="benchmark", metavar="BENCHMARK")
+    subparsers.required = True
+    for name, (module, help_text) in BENCHMARKS.items():
+        module.add_arguments(subparsers.add_parser(name, help=help_text))
+
+    args = parser.parse_args(argv)
+    module, _ = BENCHMARKS[args.benchmark]
+    return module.run(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
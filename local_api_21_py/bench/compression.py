@@ -0,0 +1,87 @@
+import argparse
+import gzip
+import time
+import typing
+
+import httpx
+
+from local_api_21_py.bench.fixtures import example_for, openapi_document
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.client import Client
+from local_api_21_py.core import RequestCompression, compression
+from local_api_21_py.types import models
+
+"""
+Measures `lint.run` upload throughput of a generated OpenAPI document sent
+uncompressed, gzip and (when `zstandard` is installed) zstd compressed.
+
+The loopback server holds every response for the time the received bytes
+would take on a link of `--bandwidth` Mbit/s, approximating a CI runner whose
+uploads are bandwidth bound. Pass `--bandwidth 0` for raw loopback speed,
+where compression only costs CPU time.
+"""
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--size-mb", type=int, default=16, help="size of the uploaded spec"
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=100.0, help="simulated link in Mbit/s"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="uploads per encoding")
+
+
+def _decompress(request: httpx.Request) -> bytes:
+    encoding = request.headers.get("content-encoding")
+    if encoding == "gzip":
+        return gzip.decompress(request.content)
+    if encoding == "zstd":
+        return (
+            compression.zstandard.ZstdDecompressor()
+            .decompressobj()
+            .decompress(request.content)
+        )
+    return request.content
+
+
+def run(args: argparse.Namespace) -> int:
+    spec = openapi_document(args.size_mb * 1024 * 1024)
+    report = example_for(models.LintReport, list_size=0)
+    received: typing.List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        wire = len(request.content)
+        if len(_decompress(request)) < len(spec):
+            return httpx.Response(400)
+        received.append(wire)
+        if args.bandwidth > 0:
+            time.sleep(wire * 8 / (args.bandwidth * 1e6))
+        return httpx.Response(200, json=report)
+
+    encodings: typing.List[typing.Tuple[str, typing.Optional[RequestCompression]]] = [
+        ("identity", None),
+        ("gzip level 1", RequestCompression("gzip", level=1)),
+        ("gzip level 6", RequestCompression("gzip", level=6)),
+    ]
+    if compression.zstd_available():
+        encodings.append(("zstd level 3", RequestCompression("zstd", level=3)))
+
+    with LocalServer(handler) as server:
+        print(
+            f"{args.size_mb} MB spec, {args.bandwidth:g} Mbit/s link, "
+            f"best of {args.repeat}"
+        )
+        for label, settings in encodings:
+            client = Client(base_url=server.base_url, compression=settings)
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                client.lint.run(openapi=("openapi.yaml", spec, "application/yaml"))
+                best = min(best, time.perf_counter() - start)
+            ratio = len(spec) / received[-1]
+            rate = args.size_mb / best
+            print(
+                f"{label:<14} {best * 1e3:9.1f} ms {rate:8.1f} MB/s  ratio {ratio:5.1f}x"
+            )
+    return 0
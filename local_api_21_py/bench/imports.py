@@ -0,0 +1,77 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import typing
+
+"""
+Measures the cold start cost of the SDK in fresh interpreters: importing the
+package, constructing a `Client` and reaching `client.health`, compared with
+"eager", which resolves every resource, model and param module up front the
+way the package did before sub-clients and types were imported lazily.
+"""
+
+_PRELUDE = """
+import json, sys, time
+start = time.perf_counter()
+"""
+
+_REPORT = """
+modules = [m for m in sys.modules if m.startswith("local_api_21_py")]
+print(json.dumps({"ms": (time.perf_counter() - start) * 1e3, "modules": len(modules)}))
+"""
+
+_EAGER = """
+import local_api_21_py
+from local_api_21_py.types import models, params
+models._types_namespace
+for name in params.__all__:
+    getattr(params, name)
+
+def touch(owner):
+    for name, attr in vars(type(owner)).items():
+        if isinstance(attr, local_api_21_py.core.LazyClient):
+            touch(getattr(owner, name))
+
+touch(local_api_21_py.Client(api_key="key"))
+"""
+
+SCENARIOS: typing.List[typing.Tuple[str, str]] = [
+    ("import", "import local_api_21_py"),
+    (
+        "import + Client()",
+        "import local_api_21_py\nlocal_api_21_py.Client(api_key='key')",
+    ),
+    (
+        "client.health",
+        "import local_api_21_py\nlocal_api_21_py.Client(api_key='key').health",
+    ),
+    ("eager (previous behavior)", _EAGER),
+]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--repeat", type=int, default=15, help="fresh interpreters per scenario"
+    )
+
+
+def _measure(code: str) -> typing.Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + code + _REPORT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(args: argparse.Namespace) -> int:
+    print(f"median of {args.repeat} fresh interpreters")
+    for label, code in SCENARIOS:
+        samples = [_measure(code) for _ in range(args.repeat)]
+        median = statistics.median(s["ms"] for s in samples)
+        modules = int(samples[-1]["modules"])
+        print(f"{label:<26} {median:8.1f} ms  {modules:4d} package modules")
+    return 0
@@ -0,0 +1,348 @@
+import argparse
+import asyncio
+import concurrent.futures
+import functools
+import json
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import typing
+
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.bench.standin import StandIn
+from local_api_21_py.client import AsyncClient, Client
+from local_api_21_py.core import AsyncBaseClient, SyncBaseClient
+
+"""
+Load generator comparing `Client` called serially, `Client` shared by a
+thread pool and `AsyncClient`, to size worker fleets.
+
+A weighted mix of operations is sent to a `StandIn` served over a loopback
+socket, either closed-loop (`--concurrency` callers back to back) or
+open-loop at `--rate` requests per second, where latencies are measured from
+the scheduled start so a saturated client shows up as queueing delay:
+
+```sh
+python -m local_api_21_py.bench load --concurrency 32 --requests 5000
+python -m local_api_21_py.bench load --rate 500 --mix health.ping=3,doc.deployment.list=1
+```
+
+Every mode runs in a fresh interpreter, so its CPU time and peak RSS only
+cover the client while the server stays in this process. CPU time spent in
+`build_request` and `process_response` is reported as serialization, the
+rest of the client's CPU time (transport, connection pool, event loop) as
+I/O.
+"""
+
+MODES: typing.Dict[str, str] = {
+    "serial": "Client, serial",
+    "threaded": "Client, thread pool",
+    "async": "AsyncClient",
+}
+
+OPERATIONS: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+    "health.ping": {},
+    "asset.list": {},
+    "doc.deployment.list": {"doc_name": "docs"},
+    "doc.deployment.get": {"doc_name": "docs", "deployment_id": "deployment"},
+    "doc.deployment.trigger": {"doc_name": "docs", "target": "Preview"},
+    "api.spec.get_openapi": {"api_name": "api", "api_version": "latest"},
+}
+"""Operations available to `--mix` and their arguments"""
+
+DEFAULT_MIX = (
+    "health.ping=4,doc.deployment.list=2,doc.deployment.get=2,"
+    "doc.deployment.trigger=1,api.spec.get_openapi=1"
+)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"weighted operations as name=weight, from: {', '.join(OPERATIONS)}",
+    )
+    parser.add_argument(
+        "--modes",
+        default=",".join(MODES),
+        help=f"comma separated modes to run, from: {', '.join(MODES)}",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="requests sent per mode"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="requests in flight for the threaded and async modes",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="open-loop target in requests per second (default: closed loop)",
+    )
+    parser.add_argument(
+        "--list-size", type=int, default=20, help="items of list responses"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="server latency in seconds"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the mix")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--child", choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+
+
+def parse_mix(mix: str) -> typing.List[typing.Tuple[str, float]]:
+    """Parses `name=weight,...`, a missing weight counts as 1"""
+    parsed = []
+    for entry in filter(None, (e.strip() for e in mix.split(","))):
+        name, _, weight = entry.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"unknown operation {name!r}")
+        parsed.append((name, float(weight or 1)))
+    return parsed
+
+
+def schedule(
+    mix: typing.List[typing.Tuple[str, float]], requests: int, seed: int
+) -> typing.List[str]:
+    """Operation of every request, the same for every mode"""
+    names, weights = zip(*mix)
+    return random.Random(seed).choices(names, weights=weights, k=requests)
+
+
+class _CpuMeter:
+    """Sums the CPU time threads spend in the wrapped methods"""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def wrap(
+        self, fn: typing.Callable[..., typing.Any]
+    ) -> typing.Callable[..., typing.Any]:
+        @functools.wraps(fn)
+        def timed(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            start = time.thread_time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - start
+                with self._lock:
+                    self.seconds += elapsed
+
+        return timed
+
+    def instrument(
+        self, base_client: typing.Union[SyncBaseClient, AsyncBaseClient]
+    ) -> None:
+        # instance attributes shadow the methods for this client only
+        base_client.build_request = self.wrap(base_client.build_request)  # type: ignore[method-assign]
+        base_client.process_response = self.wrap(base_client.process_response)  # type: ignore[method-assign]
+
+
+def _operation(client: typing.Any, name: str) -> typing.Callable[[], typing.Any]:
+    method = functools.reduce(getattr, name.split("."), client)
+    return functools.partial(method, **OPERATIONS[name])
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _client_kwargs(concurrency: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "max_connections": concurrency,
+        "max_keepalive_connections": concurrency,
+    }
+
+
+def _run_sync(
+    url: str, names: typing.List[str], concurrency: int, rate: typing.Optional[float]
+) -> typing.Tuple[typing.List[float], int, float]:
+    client = Client(base_url=url, **_client_kwargs(concurrency))
+    meter = _CpuMeter()
+    meter.instrument(client._base_client)
+    calls = {name: _operation(client, name) for name in set(names)}
+    latencies: typing.List[float] = []
+    errors = 0
+    jobs = iter(enumerate(names))
+    jobs_lock = threading.Lock()
+    start = time.perf_counter()
+
+    def worker() -> None:
+        nonlocal errors
+        while True:
+            with jobs_lock:
+                job = next(jobs, None)
+            if job is None:
+                return
+            index, name = job
+            begin = time.perf_counter()
+            if rate:
+                begin = start + index / rate
+                time.sleep(max(0.0, begin - time.perf_counter()))
+            try:
+                calls[name]()
+            except Exception:
+                with jobs_lock:
+                    errors += 1
+            latency = time.perf_counter() - begin
+            with jobs_lock:
+                latencies.append(latency)
+
+    if concurrency == 1:
+        worker()
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+    return latencies, errors, meter.seconds
+
+
+def _run_async(
+    url: str, names: typing.List[str], concurrency: int, rate: typing.Optional[float]
+) -> typing.Tuple[typing.List[float], int, float]:
+    async def main() -> typing.Tuple[typing.List[float], int, float]:
+        client = AsyncClient(base_url=url, **_client_kwargs(concurrency))
+        meter = _CpuMeter()
+        meter.instrument(client._base_client)
+        calls = {name: _operation(client, name) for name in set(names)}
+        latencies: typing.List[float] = []
+        errors = 0
+        jobs = iter(enumerate(names))
+        start = time.perf_counter()
+
+        async def worker() -> None:
+            nonlocal errors
+            for index, name in jobs:
+                begin = time.perf_counter()
+                if rate:
+                    begin = start + index / rate
+                    await asyncio.sleep(max(0.0, begin - time.perf_counter()))
+                try:
+                    await calls[name]()
+                except Exception:
+                    errors += 1
+                latencies.append(time.perf_counter() - begin)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return latencies, errors, meter.seconds
+
+    return asyncio.run(main())
+
+
+def run_mode(
+    mode: str,
+    url: str,
+    names: typing.List[str],
+    concurrency: int,
+    rate: typing.Optional[float] = None,
+) -> typing.Dict[str, float]:
+    """
+    Sends the scheduled requests to `url` and summarizes them.
+
+    Args:
+        mode: One of `MODES`, `serial` ignores `concurrency`
+        url: Base URL of the server
+        names: Operation of every request, see `schedule`
+        concurrency: Requests in flight
+        rate: Open-loop requests per second, closed loop when not given
+
+    Returns:
+        Latency percentiles in seconds, throughput in requests per second,
+        CPU seconds of serialization and I/O, and the peak RSS in MB
+    """
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    if mode == "async":
+        latencies, errors, serialize = _run_async(url, names, concurrency, rate)
+    else:
+        workers = 1 if mode == "serial" else concurrency
+        latencies, errors, serialize = _run_sync(url, names, workers, rate)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    cuts = (
+        statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    )
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / wall,
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "cpu_serialize": serialize,
+        "cpu_io": max(0.0, cpu - serialize),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    names = schedule(parse_mix(args.mix), args.requests, args.seed)
+    if args.child:
+        result = run_mode(args.child, args.url, names, args.concurrency, args.rate)
+        print(json.dumps(result))
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    for mode in modes:
+        if mode not in MODES:
+            raise SystemExit(f"unknown mode {mode!r}, choose from {', '.join(MODES)}")
+
+    stand_in = StandIn(list_size=args.list_size, latency=args.latency)
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+    pacing = f"{args.rate:g} req/s" if args.rate else "closed loop"
+    print(
+        f"{args.requests} requests per mode, concurrency {args.concurrency}, {pacing}"
+    )
+    print(
+        f"{'mode':<22}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'ser cpu s':>11}{'io cpu s':>10}{'rss MB':>9}{'errors':>8}"
+    )
+    with LocalServer(stand_in.handler) as server:
+        for mode in modes:
+            argv = [sys.executable, "-m", "local_api_21_py.bench", "load"]
+            argv += ["--child", mode, "--url", server.base_url, "--mix", args.mix]
+            argv += ["--requests", str(args.requests), "--seed", str(args.seed)]
+            argv += ["--concurrency", str(args.concurrency)]
+            if args.rate:
+                argv += ["--rate", str(args.rate)]
+            output = subprocess.run(
+                argv, check=True, capture_output=True, text=True
+            ).stdout
+            result = results[mode] = json.loads(output)
+            print(
+                f"{MODES[mode]:<22}{result['throughput']:>9.0f}"
+                f"{result['p50'] * 1e3:>9.2f}{result['p95'] * 1e3:>9.2f}"
+                f"{result['p99'] * 1e3:>9.2f}{result['cpu_serialize']:>11.2f}"
+                f"{result['cpu_io']:>10.2f}{result['peak_rss_mb']:>9.1f}"
+                f"{result['errors']:>8}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "settings": {
+                        "mix": args.mix,
+                        "requests": args.requests,
+                        "concurrency": args.concurrency,
+                        "rate": args.rate,
+                        "latency": args.latency,
+                        "list_size": args.list_size,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    return 0
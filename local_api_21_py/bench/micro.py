@@ -0,0 +1,288 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+import typing
+
+import httpx
+
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.bench.validation import MODEL_FAMILIES
+from local_api_21_py.client import Client
+from local_api_21_py.core import (
+    AuthKey,
+    SSEDecoder,
+    SyncBaseClient,
+    default_request_options,
+    encode_query_param,
+    filter_not_given,
+    from_encodable,
+    to_encodable,
+    type_utils,
+)
+from local_api_21_py.types import models, params
+
+"""
+Microbenchmarks of the request/response pipeline, run fully offline.
+
+Every case is timed with `timeit` (best of `--repeat` runs of an
+auto-ranged loop) and run once more under `tracemalloc` to record the peak
+memory it allocates. `--json` writes the results for a later `--compare`,
+which exits with status 1 when a case lost more than `--max-regression` of
+its throughput, so a CI job can gate on it:
+
+```sh
+python -m local_api_21_py.bench micro --json baseline.json
+python -m local_api_21_py.bench micro --compare baseline.json --max-regression 0.2
+```
+"""
+
+Case = typing.Tuple[str, typing.Callable[[], typing.Any]]
+
+BASE_URL = "https://bench.invalid/v1"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--items", type=int, default=50, help="items per list response")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timing repetitions (best is kept)"
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run cases whose name contains this"
+    )
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument(
+        "--compare", metavar="PATH", help="JSON results of a baseline run"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="tolerated relative ops/sec loss against --compare",
+    )
+
+
+def _base_client() -> SyncBaseClient:
+    client = SyncBaseClient(base_url=BASE_URL, httpx_client=httpx.Client())
+    client.register_auth(
+        "ApiKeyAuth", AuthKey(name="x-sideko-key", location="header", val="key")
+    )
+    return client
+
+
+def _json_response(payload: typing.Any) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=json.dumps(payload).encode(),
+        headers={"content-type": "application/json"},
+        request=httpx.Request("GET", BASE_URL),
+    )
+
+
+def build_cases(items: int) -> typing.List[Case]:
+    """Creates the benchmark cases, each a zero-argument callable"""
+    base = _base_client()
+    options = default_request_options()
+    body = example_for(params._SerializerNewApiLink)
+    cases: typing.List[Case] = [
+        (
+            "build_request.get",
+            lambda: base.build_request(
+                method="GET",
+                path="/doc_project/my-project/deployment",
+                auth_names=["ApiKeyAuth"],
+                query_params={"limit": 10, "target": "Preview"},
+                request_options=options,
+            ),
+        ),
+        (
+            "build_request.json",
+            lambda: base.build_request(
+                method="POST",
+                path="/api_link",
+                auth_names=["ApiKeyAuth"],
+                json=body,
+                request_options=options,
+            ),
+        ),
+    ]
+
+    for label, cast_to in MODEL_FAMILIES:
+        response = _json_response(example_for(cast_to, list_size=items))
+        cases.append(
+            (
+                f"process_response.{label}",
+                lambda r=response, t=cast_to: base.process_response(
+                    response=r, cast_to=t
+                ),
+            )
+        )
+
+    deployments = example_for(typing.List[models.Deployment], list_size=items)
+    cases += [
+        (
+            "from_encodable.List[Deployment]",
+            lambda: from_encodable(
+                data=deployments, load_with=typing.List[models.Deployment]
+            ),
+        ),
+        (
+            "to_encodable.NewApiLink",
+            lambda: to_encodable(item=body, dump_with=params._SerializerNewApiLink),
+        ),
+        ("to_encodable.primitive", lambda: to_encodable(item=10, dump_with=int)),
+    ]
+
+    values = {
+        "list": ["a", "b", "c", "d"],
+        "object": {"role": "admin", "first_name": "Alex"},
+    }
+    for style in ("form", "spaceDelimited", "pipeDelimited", "deepObject"):
+        for explode in (True, False):
+            for kind, value in values.items():
+                if style == "deepObject" and kind == "list":
+                    continue
+                cases.append(
+                    (
+                        f"encode_query_param.{style}.{kind}.explode={explode}",
+                        lambda s=style, e=explode, v=value: encode_query_param(
+                            {}, "param", v, style=s, explode=e  # type: ignore[arg-type]
+                        ),
+                    )
+                )
+
+    events = b"".join(
+        b'event: progress\nid: %d\ndata: {"done": %d}\n\n' % (i, i)
+        for i in range(items)
+    )
+    cases.append(("sse.decode", lambda: SSEDecoder().feed(events)))
+
+    spec = b"openapi: 3.0.0\n" + b"x" * 64 * 1024
+    lint = {"api_name": "my-api", "api_version": type_utils.NOT_GIVEN, "openapi": spec}
+
+    def multipart() -> bytes:
+        data = to_encodable(item=lint, dump_with=params._SerializerNewLint)
+        files = params._SerializerNewLint.get_files_from_typed_dict(
+            filter_not_given(lint)
+        )
+        cfg = base.build_request(
+            method="POST",
+            path="/lint",
+            auth_names=["ApiKeyAuth"],
+            data=data,
+            files=files,
+            request_options=options,
+        )
+        return httpx.Request(**cfg).read()  # type: ignore[arg-type]
+
+    cases.append(("multipart.lint", multipart))
+
+    nested = {
+        "name": "name",
+        "limit": type_utils.NOT_GIVEN,
+        "settings": {
+            "metadata": {"title": "t", "description": type_utils.NOT_GIVEN},
+            "links": [{"url": "u", "label": type_utils.NOT_GIVEN}] * 5,
+        },
+    }
+    cases.append(("filter_not_given", lambda: filter_not_given(nested)))
+
+    payload = json.dumps(deployments).encode()
+    client = Client(
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=payload, headers={"content-type": "application/json"}
+                )
+            )
+        )
+    )
+    cases.append(
+        (
+            "roundtrip.doc.deployment.list",
+            lambda: client.doc.deployment.list(doc_name="my-project", limit=items),
+        )
+    )
+    return cases
+
+
+def measure(
+    fn: typing.Callable[[], typing.Any], repeat: int
+) -> typing.Dict[str, float]:
+    """Throughput and peak allocated bytes of a single call"""
+    fn()  # compile caches and adapters outside of the measurement
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops_per_sec": 1 / best,
+        "ns_per_op": best * 1e9,
+        "peak_bytes": peak - baseline,
+    }
+
+
+def compare(
+    results: typing.Dict[str, typing.Dict[str, float]],
+    baseline: typing.Dict[str, typing.Dict[str, float]],
+    max_regression: float,
+) -> typing.List[str]:
+    """Names of the cases slower than `baseline` by more than `max_regression`"""
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline
+        and result["ops_per_sec"] < baseline[name]["ops_per_sec"] * (1 - max_regression)
+    ]
+
+
+def run(args: argparse.Namespace) -> int:
+    baseline: typing.Dict[str, typing.Dict[str, float]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+    print(f"{'case':<56}{'ops/sec':>14}{'ns/op':>12}{'peak KiB':>10}")
+    for name, fn in build_cases(args.items):
+        if args.filter not in name:
+            continue
+        result = results[name] = measure(fn, args.repeat)
+        line = (
+            f"{name:<56}{result['ops_per_sec']:>14,.0f}"
+            f"{result['ns_per_op']:>12,.0f}{result['peak_bytes'] / 1024:>10.1f}"
+        )
+        if name in baseline:
+            change = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+            line += f"  {change:+.1%}"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "python": sys.version.split()[0],
+                        "implementation": platform.python_implementation(),
+                        "platform": platform.platform(),
+                        "items": args.items,
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    regressions = compare(results, baseline, args.max_regression)
+    for name in regressions:
+        print(f"regression: {name} lost more than {args.max_regression:.0%} ops/sec")
+    return 1 if regressions else 0
@@ -0,0 +1,79 @@
+import argparse
+import concurrent.futures
+import threading
+import time
+import typing
+
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.client import Client
+
+"""
+Measures `health.ping` throughput against a loopback server for the default
+connection pool and a pool sized for the number of concurrent callers, and
+the latency of a first burst of requests with and without `warm_connections`.
+"""
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--threads", type=int, default=64, help="concurrent calling threads"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=3.0, help="seconds per throughput run"
+    )
+
+
+def _throughput(client: Client, threads: int, duration: float) -> float:
+    deadline = time.perf_counter() + duration
+    counts = [0] * threads
+
+    def worker(index: int) -> None:
+        while time.perf_counter() < deadline:
+            client.health.ping()
+            counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return sum(counts) / duration
+
+
+def _first_burst(client: Client, threads: int) -> float:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        list(pool.map(lambda _: client.health.ping(), range(threads)))
+        return time.perf_counter() - start
+
+
+def run(args: argparse.Namespace) -> int:
+    with LocalServer() as server:
+        configs: typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]] = [
+            ("default pool", {}),
+            (
+                "tuned pool",
+                {
+                    "max_connections": args.threads,
+                    "max_keepalive_connections": args.threads,
+                    "keepalive_expiry": 30.0,
+                },
+            ),
+        ]
+        for label, kwargs in configs:
+            client = Client(base_url=server.base_url, **kwargs)
+            rate = _throughput(client, args.threads, args.duration)
+            print(f"{label:<24} {rate:10.0f} req/s")
+
+        for warm in (False, True):
+            client = Client(
+                base_url=server.base_url,
+                max_connections=args.threads,
+                max_keepalive_connections=args.threads,
+            )
+            if warm:
+                client.warm_connections(connections=args.threads)
+            secs = _first_burst(client, args.threads)
+            label = "first burst (warmed)" if warm else "first burst (cold)"
+            print(f"{label:<24} {secs * 1e3:10.2f} ms for {args.threads} requests")
+    return 0
@@ -0,0 +1,107 @@
+import http.server
+import socketserver
+import threading
+import typing
+
+import httpx
+
+"""
+Serves an HTTPX-style handler (the same callable `httpx.MockTransport`
+accepts) over a real loopback socket with HTTP/1.1 keep-alive, so benchmarks
+can exercise connection pooling, compression and the TCP stack.
+"""
+
+Handler = typing.Callable[[httpx.Request], httpx.Response]
+
+
+def ping_handler(request: httpx.Request) -> httpx.Response:
+    """Answers every request like `GET /_ping`"""
+    return httpx.Response(200, json={"ok": True})
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, avoid the delayed-ACK stall
+    disable_nagle_algorithm = True
+    handler: Handler
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    # discard trailers up to the terminating blank line
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+
+        length = int(self.headers.get("content-length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self) -> None:
+        request = httpx.Request(
+            self.command,
+            f"http://{self.headers.get('host', 'localhost')}{self.path}",
+            headers=[
+                (k, v)
+                for k, v in self.headers.items()
+                if k.lower() != "transfer-encoding"
+            ],
+            content=self._read_body(),
+        )
+        response = type(self).handler(request)
+        body = response.read()
+
+        self.send_response(response.status_code)
+        for key, value in response.headers.multi_items():
+            if key.lower() not in ("content-length", "transfer-encoding"):
+                self.send_header(key, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+
+class LocalServer:
+    """
+    Runs a handler on a loopback port in a background thread.
+
+    Examples:
+    ```py
+    with LocalServer(ping_handler) as server:
+        client = Client(base_url=server.base_url)
+    ```
+    """
+
+    def __init__(self, handler: Handler = ping_handler, port: int = 0) -> None:
+        request_handler = type(
+            "RequestHandler", (_RequestHandler,), {"handler": staticmethod(handler)}
+        )
+        self._server = _ThreadingServer(("127.0.0.1", port), request_handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,53 @@
+import argparse
+import time
+import typing
+
+from local_api_21_py.core import SSEDecoder
+
+"""
+Measures SSE decoding throughput for one very large event delivered in small
+chunks and for a large number of tiny events.
+"""
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--event-bytes", type=int, default=1024 * 1024, help="size of the large event"
+    )
+    parser.add_argument(
+        "--tiny-events", type=int, default=100_000, help="number of tiny events"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=1024, help="bytes per received chunk"
+    )
+
+
+def _chunked(payload: bytes, size: int) -> typing.List[bytes]:
+    return [payload[i : i + size] for i in range(0, len(payload), size)]
+
+
+def _decode(chunks: typing.List[bytes]) -> typing.Tuple[int, float]:
+    decoder = SSEDecoder()
+    events = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        events += len(decoder.feed(chunk))
+    events += len(decoder.flush())
+    return events, time.perf_counter() - start
+
+
+def run(args: argparse.Namespace) -> int:
+    large = b"data: " + b"x" * args.event_bytes + b"\n\n"
+    tiny = b"".join(
+        b'id: %d\ndata: {"data": %d}\n\n' % (i, i) for i in range(args.tiny_events)
+    )
+
+    for label, payload in [("large event", large), ("tiny events", tiny)]:
+        chunks = _chunked(payload, args.chunk_size)
+        events, secs = _decode(chunks)
+        print(
+            f"{label:<12} {len(payload) / 1e6:8.2f} MB in {len(chunks):>7} chunks: "
+            f"{secs * 1e3:9.2f}ms, {len(payload) / 1e6 / secs:8.1f} MB/s, "
+            f"{events / secs:12.0f} events/s"
+        )
+    return 0
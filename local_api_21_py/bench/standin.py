@@ -0,0 +1,303 @@
+import asyncio
+import collections
+import gzip
+import io
+import json
+import random
+import re
+import tarfile
+import threading
+import time
+import typing
+
+import httpx
+
+from local_api_21_py.bench.fixtures import example_for, openapi_document
+from local_api_21_py.client import AsyncClient, Client
+from local_api_21_py.core import BinaryResponse
+from local_api_21_py.operations import OPERATIONS
+
+"""
+In-process stand-in for the API, serving every operation of `resources/*`
+without the external mock server.
+
+Routes are read from the operation table of the resource clients
+(`local_api_21_py.operations`) and answered with fixtures built from the
+`cast_to` type of each operation. Latency and error
+injection are driven by a seeded random generator, so retry, cache and
+throughput measurements are repeatable:
+
+```py
+stand_in = StandIn(list_size=1000, latency=0.005, error_rate=0.01, seed=1)
+client = stand_in.client(retry=RetryPolicy(base_delay=0))
+client.doc.deployment.list(doc_name="my-project")
+```
+
+The stand-in is an `httpx.MockTransport` handler (`handler` and
+`async_handler`) and an ASGI application, and `LocalServer(stand_in.handler)`
+serves it over a loopback socket.
+"""
+
+BASE_URL = "http://stand-in.invalid"
+
+LARGE_LIST = 1000
+"""`list_size` of the large-list variant"""
+
+LARGE_SPEC = 8 * 1024 * 1024
+"""`spec_size` of the large-spec variant"""
+
+_SPEC_FIELDS = frozenset({"openapi"})
+
+
+class Route:
+    """An operation served by the stand-in"""
+
+    def __init__(self, method: str, path: str, operation: str, cast_to: typing.Any):
+        """
+        Args:
+            method: HTTP method
+            path: Path template such as `/doc_project/{doc_name}`
+            operation: Dotted path of the operation from the client
+            cast_to: Response type of the operation
+        """
+        self.method = method
+        self.path = path
+        self.operation = operation
+        self.cast_to = cast_to
+        self.params = re.findall(r"\{(\w+)\}", path)
+        pattern = "".join(
+            f"(?P<{part[1:-1]}>[^/]+)" if part.startswith("{") else re.escape(part)
+            for part in re.split(r"(\{\w+\})", path)
+        )
+        self.pattern = re.compile(pattern + "$")
+
+    def __repr__(self) -> str:
+        return f"Route({self.method} {self.path} -> {self.operation})"
+
+
+def discover_routes() -> typing.List[Route]:
+    """
+    Lists the operations of `OPERATIONS`.
+
+    Operations sharing a route are served by the first one declared, so every
+    route maps to a single response type.
+    """
+    routes: typing.Dict[typing.Tuple[str, str], Route] = {}
+    for name, operation in OPERATIONS.items():
+        key = (operation.method, operation.path)
+        if key not in routes:
+            routes[key] = Route(*key, name, operation.cast_to)
+    return list(routes.values())
+
+
+class StandIn:
+    """
+    Serves fixtures for every API operation with injectable latency and
+    errors.
+
+    Attributes:
+        routes: Served operations
+        calls: Requests received per route, as `"METHOD /path"`
+        injected_errors: Error responses returned by the error injection
+    """
+
+    def __init__(
+        self,
+        *,
+        list_size: int = 3,
+        spec_size: int = 4 * 1024,
+        binary_size: int = 64 * 1024,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: typing.Sequence[int] = (500, 503),
+        retry_after: typing.Optional[float] = None,
+        seed: typing.Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            list_size: Items of every list in a response, see `LARGE_LIST`
+            spec_size: Bytes of every OpenAPI document in a response, see
+                `LARGE_SPEC`
+            binary_size: Bytes of the file in binary (SDK archive) responses
+            latency: Seconds every response is delayed by
+            latency_jitter: Additional random delay of up to this many seconds
+            error_rate: Fraction of requests answered with an error status
+            error_statuses: Statuses injected errors are drawn from
+            retry_after: `Retry-After` seconds sent with injected errors
+            seed: Seed of the latency and error generator
+        """
+        self.list_size = list_size
+        self.spec_size = spec_size
+        self.binary_size = binary_size
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.routes = discover_routes()
+        self.calls: typing.Counter[str] = collections.Counter()
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies: typing.Dict[typing.Tuple[str, str], bytes] = {}
+        self._spec: typing.Optional[str] = None
+        self._archive: typing.Optional[bytes] = None
+        # literal paths are matched before templates, templates with fewer
+        # parameters before more generic ones
+        self._routes = sorted(self.routes, key=lambda r: (len(r.params), -len(r.path)))
+
+    def client(self, **kwargs: typing.Any) -> Client:
+        """`Client` sending its requests to the stand-in"""
+        return Client(
+            base_url=BASE_URL,
+            httpx_client=httpx.Client(transport=httpx.MockTransport(self.handler)),
+            **kwargs,
+        )
+
+    def async_client(self, **kwargs: typing.Any) -> AsyncClient:
+        """`AsyncClient` sending its requests to the stand-in"""
+        return AsyncClient(
+            base_url=BASE_URL,
+            httpx_client=httpx.AsyncClient(
+                transport=httpx.MockTransport(self.async_handler)
+            ),
+            **kwargs,
+        )
+
+    def match(self, method: str, path: str) -> typing.Optional[Route]:
+        """Route serving a request"""
+        for route in self._routes:
+            if route.method == method and route.pattern.match(path):
+                return route
+        return None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """`httpx.MockTransport` handler, latency blocks the calling thread"""
+        response, delay = self._respond(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        """`httpx.MockTransport` handler for `httpx.AsyncClient`"""
+        response, delay = self._respond(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    async def __call__(
+        self,
+        scope: typing.Dict[str, typing.Any],
+        receive: typing.Callable[[], typing.Awaitable[typing.Dict[str, typing.Any]]],
+        send: typing.Callable[[typing.Dict[str, typing.Any]], typing.Awaitable[None]],
+    ) -> None:
+        """ASGI application, e.g. for `httpx.ASGITransport(app=stand_in)`"""
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        query = scope.get("query_string", b"").decode()
+        request = httpx.Request(
+            scope["method"],
+            f"{BASE_URL}{scope['path']}" + (f"?{query}" if query else ""),
+            headers=[(k.decode(), v.decode()) for k, v in scope["headers"]],
+            content=body,
+        )
+        response = await self.async_handler(request)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (k.encode(), v.encode()) for k, v in response.headers.multi_items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+    def _respond(self, request: httpx.Request) -> typing.Tuple[httpx.Response, float]:
+        request.read()
+        route = self.match(request.method, request.url.path)
+        with self._lock:
+            delay = self.latency
+            if self.latency_jitter > 0:
+                delay += self._random.uniform(0, self.latency_jitter)
+            inject = self.error_rate > 0 and self._random.random() < self.error_rate
+            status = self._random.choice(self.error_statuses) if inject else 0
+            if route is not None:
+                self.calls[f"{route.method} {route.path}"] += 1
+            if inject:
+                self.injected_errors += 1
+
+        if route is None:
+            return httpx.Response(404, json={"detail": "no such route"}), delay
+        if inject:
+            headers = {}
+            if self.retry_after is not None:
+                headers["retry-after"] = f"{self.retry_after:g}"
+            return (
+                httpx.Response(status, json={"detail": "injected"}, headers=headers),
+                delay,
+            )
+        if route.cast_to is type(None):
+            return httpx.Response(204), delay
+        if route.cast_to is httpx.Response:
+            # raw responses, e.g. acknowledged webhooks
+            return httpx.Response(202, json={}), delay
+        if route.cast_to is BinaryResponse:
+            return (
+                httpx.Response(
+                    200,
+                    content=self._binary(),
+                    headers={"content-type": "application/gzip"},
+                ),
+                delay,
+            )
+        return (
+            httpx.Response(
+                200,
+                content=self._body(route),
+                headers={"content-type": "application/json"},
+            ),
+            delay,
+        )
+
+    def _body(self, route: Route) -> bytes:
+        key = (route.method, route.path)
+        body = self._bodies.get(key)
+        if body is None:
+            payload = example_for(route.cast_to, list_size=self.list_size)
+            body = json.dumps(self._with_specs(payload)).encode()
+            self._bodies[key] = body
+        return body
+
+    def _with_specs(self, payload: typing.Any) -> typing.Any:
+        if isinstance(payload, list):
+            return [self._with_specs(item) for item in payload]
+        if isinstance(payload, dict):
+            return {
+                k: (self._spec_text() if k in _SPEC_FIELDS else self._with_specs(v))
+                for k, v in payload.items()
+            }
+        return payload
+
+    def _spec_text(self) -> str:
+        if self._spec is None:
+            self._spec = openapi_document(self.spec_size).decode()
+        return self._spec
+
+    def _binary(self) -> bytes:
+        if self._archive is None:
+            data = openapi_document(self.binary_size)
+            buffer = io.BytesIO()
+            with tarfile.open(fileobj=buffer, mode="w") as archive:
+                info = tarfile.TarInfo("sdk/openapi.yaml")
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+            self._archive = gzip.compress(buffer.getvalue(), compresslevel=1)
+        return self._archive
@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import typing
+
+import httpx
+
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.client import AsyncClient, Client
+from local_api_21_py.core import FileStream
+from local_api_21_py.types import models
+
+"""
+Measures the peak memory of uploading a large spec with `lint.run`.
+
+Every mode runs in a fresh interpreter so that its peak RSS (a high-water
+mark) is not shadowed by an earlier run, the loopback server runs in this
+process. Reported is the growth of the peak RSS over the RSS of the client
+before the upload.
+"""
+
+MODES: typing.Dict[str, str] = {
+    "buffered": "file read into memory",
+    "handle": "open file handle",
+    "filestream": "FileStream (mmap)",
+    "async-handle": "open file handle, AsyncClient",
+}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--size-mb", type=int, default=64, help="size of the uploaded spec"
+    )
+    parser.add_argument("--child", choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _upload(mode: str, url: str, path: str) -> float:
+    if mode == "async-handle":
+        async_client = AsyncClient(base_url=url)
+        before = _peak_rss_mb()
+        with open(path, "rb") as f:
+            asyncio.run(async_client.lint.run(openapi=f))
+        return _peak_rss_mb() - before
+
+    client = Client(base_url=url)
+    before = _peak_rss_mb()
+    if mode == "buffered":
+        with open(path, "rb") as f:
+            client.lint.run(openapi=("openapi.yaml", f.read()))
+    elif mode == "handle":
+        with open(path, "rb") as f:
+            client.lint.run(openapi=f)
+    else:
+        with FileStream(path) as stream:
+            client.lint.run(openapi=stream)
+    return _peak_rss_mb() - before
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=example_for(models.LintReport, list_size=0))
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.child:
+        print(f"{_upload(args.child, args.url, args.file):.1f}")
+        return 0
+
+    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as spec:
+        line = b"  /pets/{petId}: {get: {operationId: showPetById}}\n"
+        spec.write(b"openapi: 3.0.0\npaths:\n")
+        for _ in range(args.size_mb * 1024 * 1024 // len(line)):
+            spec.write(line)
+    try:
+        with LocalServer(_handler) as server:
+            print(f"upload of a {args.size_mb} MB spec, peak RSS growth")
+            for mode, label in MODES.items():
+                output = subprocess.run(
+                    [sys.executable, "-m", "local_api_21_py.bench", "upload"]
+                    + ["--child", mode, "--url", server.base_url, "--file", spec.name],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                print(f"{label:<32} {float(output):8.1f} MB")
+    finally:
+        os.unlink(spec.name)
+    return 0
@@ -0,0 +1,67 @@
+import argparse
+import json
+import timeit
+import typing
+
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.core import construct_encodable, from_encodable, from_json
+from local_api_21_py.types import models
+
+"""
+Compares the ways a JSON response body can be loaded into response models:
+`json.loads` followed by validation, single-pass `validate_json` (the default
+path of `process_response`) and trusted `validate_response=False` construction.
+"""
+
+MODEL_FAMILIES: typing.List[typing.Tuple[str, typing.Any]] = [
+    ("List[Deployment]", typing.List[models.Deployment]),
+    ("List[ApiLink]", typing.List[models.ApiLink]),
+    ("ListAssetsPage", models.ListAssetsPage),
+    ("List[GuideWithChildren]", typing.List[models.GuideWithChildren]),
+    ("List[SdkGeneration]", typing.List[models.SdkGeneration]),
+    ("DocProject", models.DocProject),
+]
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--items", type=int, default=500, help="items per list response"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timing repetitions (best is kept)"
+    )
+
+
+def _best_per_call(fn: typing.Callable[[], typing.Any], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(args: argparse.Namespace) -> int:
+    print(f"{'model':<26}{'loads+validate':>16}{'validate_json':>16}{'trusted':>16}")
+    for label, load_with in MODEL_FAMILIES:
+        content = json.dumps(example_for(load_with, list_size=args.items)).encode()
+
+        # warm the caches so schema and constructor compilation is not measured
+        validated = from_json(content=content, load_with=load_with)
+        trusted = construct_encodable(data=json.loads(content), load_with=load_with)
+        assert type(validated) is type(trusted)
+
+        timings = [
+            _best_per_call(
+                lambda: from_encodable(data=json.loads(content), load_with=load_with),
+                args.repeat,
+            ),
+            _best_per_call(
+                lambda: from_json(content=content, load_with=load_with), args.repeat
+            ),
+            _best_per_call(
+                lambda: construct_encodable(
+                    data=json.loads(content), load_with=load_with
+                ),
+                args.repeat,
+            ),
+        ]
+        print(f"{label:<26}" + "".join(f"{t * 1e3:>14.3f}ms" for t in timings))
+    return 0
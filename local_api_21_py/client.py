@@ -1,28 +1,81 @@
+import asyncio
+import concurrent.futures
 import httpx
+import threading
 import typing
 
-from local_api_21_py.core import AsyncBaseClient, AuthKey, SyncBaseClient
-from local_api_21_py.environment import Environment, _get_base_url
-from local_api_21_py.resources.api import ApiClient, AsyncApiClient
-from local_api_21_py.resources.api_link import ApiLinkClient, AsyncApiLinkClient
-from local_api_21_py.resources.asset import AssetClient, AsyncAssetClient
-from local_api_21_py.resources.auth import AsyncAuthClient, AuthClient
-from local_api_21_py.resources.cli import AsyncCliClient, CliClient
-from local_api_21_py.resources.doc import AsyncDocClient, DocClient
-from local_api_21_py.resources.health import AsyncHealthClient, HealthClient
-from local_api_21_py.resources.lint import AsyncLintClient, LintClient
-from local_api_21_py.resources.org import AsyncOrgClient, OrgClient
-from local_api_21_py.resources.role import AsyncRoleClient, RoleClient
-from local_api_21_py.resources.sdk import AsyncSdkClient, SdkClient
-from local_api_21_py.resources.service_account import (
-    AsyncServiceAccountClient,
-    ServiceAccountClient,
+from local_api_21_py.core import (
+    AsyncBaseClient,
+    AsyncRateLimiter,
+    AuthKey,
+    BatchResult,
+    CircuitBreaker,
+    CoalescingStats,
+    LazyClient,
+    RequestCompression,
+    RequestOptions,
+    ResponseCache,
+    RetryMetrics,
+    RetryPolicy,
+    SyncBaseClient,
+    TimingHook,
+    build_async_httpx_client,
+    build_httpx_client,
+    http_client,
+)
+from local_api_21_py.core.batch import BatchCall, iter_batch, run_batch
+from local_api_21_py.core.raw_response import (
+    AsyncRawResponseBaseClient,
+    RawResponseBaseClient,
 )
-from local_api_21_py.resources.user import AsyncUserClient, UserClient
-from local_api_21_py.resources.webhook import AsyncWebhookClient, WebhookClient
+from local_api_21_py.environment import Environment, _get_base_url
+
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.api import ApiClient, AsyncApiClient
+    from local_api_21_py.resources.api_link import ApiLinkClient, AsyncApiLinkClient
+    from local_api_21_py.resources.asset import AssetClient, AsyncAssetClient
+    from local_api_21_py.resources.auth import AsyncAuthClient, AuthClient
+    from local_api_21_py.resources.cli import AsyncCliClient, CliClient
+    from local_api_21_py.resources.doc import AsyncDocClient, DocClient
+    from local_api_21_py.resources.health import AsyncHealthClient, HealthClient
+    from local_api_21_py.resources.lint import AsyncLintClient, LintClient
+    from local_api_21_py.resources.org import AsyncOrgClient, OrgClient
+    from local_api_21_py.resources.role import AsyncRoleClient, RoleClient
+    from local_api_21_py.resources.sdk import AsyncSdkClient, SdkClient
+    from local_api_21_py.resources.service_account import (
+        AsyncServiceAccountClient,
+        ServiceAccountClient,
+    )
+    from local_api_21_py.resources.user import AsyncUserClient, UserClient
+    from local_api_21_py.resources.webhook import AsyncWebhookClient, WebhookClient
+
+T = typing.TypeVar("T")
 
 
 class Client:
+    api = LazyClient["ApiClient"]("local_api_21_py.resources.api", "ApiClient")
+    api_link = LazyClient["ApiLinkClient"](
+        "local_api_21_py.resources.api_link", "ApiLinkClient"
+    )
+    doc = LazyClient["DocClient"]("local_api_21_py.resources.doc", "DocClient")
+    asset = LazyClient["AssetClient"]("local_api_21_py.resources.asset", "AssetClient")
+    role = LazyClient["RoleClient"]("local_api_21_py.resources.role", "RoleClient")
+    service_account = LazyClient["ServiceAccountClient"](
+        "local_api_21_py.resources.service_account", "ServiceAccountClient"
+    )
+    health = LazyClient["HealthClient"](
+        "local_api_21_py.resources.health", "HealthClient"
+    )
+    auth = LazyClient["AuthClient"]("local_api_21_py.resources.auth", "AuthClient")
+    cli = LazyClient["CliClient"]("local_api_21_py.resources.cli", "CliClient")
+    org = LazyClient["OrgClient"]("local_api_21_py.resources.org", "OrgClient")
+    sdk = LazyClient["SdkClient"]("local_api_21_py.resources.sdk", "SdkClient")
+    user = LazyClient["UserClient"]("local_api_21_py.resources.user", "UserClient")
+    lint = LazyClient["LintClient"]("local_api_21_py.resources.lint", "LintClient")
+    webhook = LazyClient["WebhookClient"](
+        "local_api_21_py.resources.webhook", "WebhookClient"
+    )
+
     def __init__(
         self,
         *,
@@ -32,14 +85,78 @@ class Client:
         environment: Environment = Environment.PRODUCTION,
         api_key: typing.Optional[str] = None,
         api_key_1: typing.Optional[str] = None,
+        validate_response: bool = True,
+        max_connections: typing.Optional[int] = http_client.DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[
+            int
+        ] = http_client.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = http_client.DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        host_limits: typing.Optional[typing.Dict[str, httpx.Limits]] = None,
+        retry: typing.Optional[RetryPolicy] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        cache: typing.Optional[ResponseCache] = None,
+        compression: typing.Optional[RequestCompression] = None,
+        max_workers: typing.Optional[int] = None,
+        timing_hooks: typing.Optional[typing.List[TimingHook]] = None,
     ):
-        """Initialize root client"""
+        """Initialize root client
+
+        Connection pool arguments (`max_connections`, `max_keepalive_connections`,
+        `keepalive_expiry`, `http2` and `host_limits`) configure the HTTPX client
+        created when `httpx_client` is not provided, see `core.http_client`.
+
+        `retry` sets the default retry policy for transient failures, see
+        `core.retry.RetryPolicy`. Requests are not retried unless it is set.
+
+        `circuit_breaker` fails requests fast with `CircuitOpenError` while a
+        service is degraded, see `core.circuit_breaker.CircuitBreaker`.
+
+        `coalesce_requests` lets identical concurrent GETs share a single
+        in-flight request, see `core.coalesce`.
+
+        `cache` caches responses of read operations, see `core.cache.ResponseCache`.
+
+        `compression` compresses large request bodies such as spec uploads, see
+        `core.compression.RequestCompression`.
+
+        `max_workers` sizes the thread pool of `submit` and `map`, it defaults to
+        `max_keepalive_connections` so every worker can keep a connection open.
+
+        `timing_hooks` are called with the `RequestTimings` (auth, build,
+        connection acquire, time to first byte, body read and deserialization)
+        of every request, see `core.timing`.
+        """
         self._base_client = SyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.Client(timeout=timeout)
+            httpx_client=build_httpx_client(
+                timeout=timeout,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+                host_limits=host_limits,
+            )
             if httpx_client is None
             else httpx_client,
+            validate_response=validate_response,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            compression=compression,
+            timing_hooks=timing_hooks,
+        )
+        self._owns_httpx_client = httpx_client is None
+        self._max_workers = (
+            max_workers
+            or max_keepalive_connections
+            or http_client.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
         )
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._raw_client: typing.Optional["Client"] = None
         self._base_client.register_auth(
             "ApiKeyAuth", AuthKey(name="x-sideko-key", location="header", val=api_key)
         )
@@ -47,23 +164,206 @@ class Client:
             "CookieAuth",
             AuthKey(name="SIDEKO_SESSION", location="cookie", val=api_key_1),
         )
-        self.api = ApiClient(base_client=self._base_client)
-        self.api_link = ApiLinkClient(base_client=self._base_client)
-        self.doc = DocClient(base_client=self._base_client)
-        self.asset = AssetClient(base_client=self._base_client)
-        self.role = RoleClient(base_client=self._base_client)
-        self.service_account = ServiceAccountClient(base_client=self._base_client)
-        self.health = HealthClient(base_client=self._base_client)
-        self.auth = AuthClient(base_client=self._base_client)
-        self.cli = CliClient(base_client=self._base_client)
-        self.org = OrgClient(base_client=self._base_client)
-        self.sdk = SdkClient(base_client=self._base_client)
-        self.user = UserClient(base_client=self._base_client)
-        self.lint = LintClient(base_client=self._base_client)
-        self.webhook = WebhookClient(base_client=self._base_client)
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """Attempt and retry counters of the requests sent by this client"""
+        return self._base_client.retry_metrics
+
+    @property
+    def circuit_breaker(self) -> typing.Optional[CircuitBreaker]:
+        """Circuit breaker of this client, `snapshot()` reports each service's state"""
+        return self._base_client.circuit_breaker
+
+    @property
+    def coalescing_stats(self) -> CoalescingStats:
+        """Counters of requests saved by coalescing identical in-flight GETs"""
+        return self._base_client.coalescer.stats
+
+    @property
+    def timing_hooks(self) -> typing.List[TimingHook]:
+        """Hooks called with the `RequestTimings` of every request, may be modified"""
+        return self._base_client.timing_hooks
+
+    @property
+    def with_raw_response(self) -> "Client":
+        """
+        View of this client whose operations return a `RawResponse` holding
+        the HTTP response and the request's timings next to the parsed result.
+
+        The view shares the connection pool, auth and configuration of this
+        client. Helpers sending several requests, such as `iter_all` and
+        `wait_for`, are only available on the regular client.
+
+        Examples:
+        ```py
+        raw = client.with_raw_response.health.ping()
+        print(raw.status_code, raw.timings.ttfb, raw.parsed.ok)
+        ```
+        """
+        if self._raw_client is None:
+            raw = Client.__new__(Client)
+            raw._base_client = RawResponseBaseClient(self._base_client)  # type: ignore[assignment]
+            raw._owns_httpx_client = False
+            raw._max_workers = self._max_workers
+            raw._executor = None
+            raw._executor_lock = threading.Lock()
+            raw._raw_client = raw
+            self._raw_client = raw
+        return self._raw_client
+
+    def warm_connections(
+        self,
+        *,
+        connections: int = 4,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> int:
+        """
+        Pre-opens pooled connections by sending concurrent `health.ping` requests.
+
+        Call after startup so the first burst of traffic does not pay for TCP
+        and TLS handshakes. Idle connections beyond `max_keepalive_connections`
+        are closed by the pool.
+
+        Args:
+            connections: Number of connections to open, nothing is sent when
+                it is not positive
+            request_options: Additional options to customize the ping requests
+
+        Returns:
+            Number of successful pings
+        """
+        if connections <= 0:
+            return 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=connections) as pool:
+            futures = [
+                pool.submit(self.health.ping, request_options=request_options)
+                for _ in range(connections)
+            ]
+        return sum(1 for f in futures if f.exception() is None)
+
+    def _pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="local_api_21_py",
+                )
+            return self._executor
+
+    def submit(
+        self, fn: typing.Callable[..., T], /, *args: typing.Any, **kwargs: typing.Any
+    ) -> "concurrent.futures.Future[T]":
+        """
+        Runs an operation on the client's thread pool.
+
+        Workers share this client's connection pool, auth providers, retry
+        policy and caches. The pool is started on first use.
+
+        Args:
+            fn: Operation to call, eg `client.api_link.get`
+            *args: Positional arguments of `fn`
+            **kwargs: Keyword arguments of `fn`
+
+        Returns:
+            Future resolving to the result of the operation
+
+        Examples:
+        ```py
+        future = client.submit(client.api_link.get, id="my-link")
+        link = future.result()
+        ```
+        """
+        return self._pool().submit(fn, *args, **kwargs)
+
+    def map(
+        self,
+        fn: typing.Callable[..., T],
+        *iterables: typing.Iterable[typing.Any],
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Iterator[T]:
+        """
+        Calls `fn` for every item of `iterables` in parallel on the client's
+        thread pool, like `concurrent.futures.Executor.map`.
+
+        Results are yielded in the order of the items. The first exception
+        raised by a call is re-raised when its result is reached.
+
+        Args:
+            fn: Function calling an operation
+            *iterables: Arguments passed positionally to `fn`
+            timeout: Seconds to wait for all results
+
+        Examples:
+        ```py
+        links = list(client.map(lambda id: client.api_link.get(id=id), ids))
+        ```
+        """
+        return self._pool().map(fn, *iterables, timeout=timeout)
+
+    def close(self) -> None:
+        """
+        Waits for calls submitted to the thread pool, then shuts it down and
+        closes the connection pool created by this client.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._owns_httpx_client:
+            self._base_client.httpx_client.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
 
 
 class AsyncClient:
+    api = LazyClient["AsyncApiClient"](
+        "local_api_21_py.resources.api", "AsyncApiClient"
+    )
+    api_link = LazyClient["AsyncApiLinkClient"](
+        "local_api_21_py.resources.api_link", "AsyncApiLinkClient"
+    )
+    doc = LazyClient["AsyncDocClient"](
+        "local_api_21_py.resources.doc", "AsyncDocClient"
+    )
+    asset = LazyClient["AsyncAssetClient"](
+        "local_api_21_py.resources.asset", "AsyncAssetClient"
+    )
+    role = LazyClient["AsyncRoleClient"](
+        "local_api_21_py.resources.role", "AsyncRoleClient"
+    )
+    service_account = LazyClient["AsyncServiceAccountClient"](
+        "local_api_21_py.resources.service_account", "AsyncServiceAccountClient"
+    )
+    health = LazyClient["AsyncHealthClient"](
+        "local_api_21_py.resources.health", "AsyncHealthClient"
+    )
+    auth = LazyClient["AsyncAuthClient"](
+        "local_api_21_py.resources.auth", "AsyncAuthClient"
+    )
+    cli = LazyClient["AsyncCliClient"](
+        "local_api_21_py.resources.cli", "AsyncCliClient"
+    )
+    org = LazyClient["AsyncOrgClient"](
+        "local_api_21_py.resources.org", "AsyncOrgClient"
+    )
+    sdk = LazyClient["AsyncSdkClient"](
+        "local_api_21_py.resources.sdk", "AsyncSdkClient"
+    )
+    user = LazyClient["AsyncUserClient"](
+        "local_api_21_py.resources.user", "AsyncUserClient"
+    )
+    lint = LazyClient["AsyncLintClient"](
+        "local_api_21_py.resources.lint", "AsyncLintClient"
+    )
+    webhook = LazyClient["AsyncWebhookClient"](
+        "local_api_21_py.resources.webhook", "AsyncWebhookClient"
+    )
+
     def __init__(
         self,
         *,
@@ -73,13 +373,64 @@ class AsyncClient:
         environment: Environment = Environment.PRODUCTION,
         api_key: typing.Optional[str] = None,
         api_key_1: typing.Optional[str] = None,
+        validate_response: bool = True,
+        max_connections: typing.Optional[int] = http_client.DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[
+            int
+        ] = http_client.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = http_client.DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        host_limits: typing.Optional[typing.Dict[str, httpx.Limits]] = None,
+        retry: typing.Optional[RetryPolicy] = None,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        cache: typing.Optional[ResponseCache] = None,
+        compression: typing.Optional[RequestCompression] = None,
+        timing_hooks: typing.Optional[typing.List[TimingHook]] = None,
     ):
-        """Initialize root client"""
+        """Initialize root client
+
+        Connection pool arguments (`max_connections`, `max_keepalive_connections`,
+        `keepalive_expiry`, `http2` and `host_limits`) configure the HTTPX client
+        created when `httpx_client` is not provided, see `core.http_client`.
+
+        `retry` sets the default retry policy for transient failures, see
+        `core.retry.RetryPolicy`. Requests are not retried unless it is set.
+
+        `circuit_breaker` fails requests fast with `CircuitOpenError` while a
+        service is degraded, see `core.circuit_breaker.CircuitBreaker`.
+
+        `coalesce_requests` lets identical concurrent GETs share a single
+        in-flight request, see `core.coalesce`.
+
+        `cache` caches responses of read operations, see `core.cache.ResponseCache`.
+
+        `compression` compresses large request bodies such as spec uploads, see
+        `core.compression.RequestCompression`.
+
+        `timing_hooks` are called with the `RequestTimings` (auth, build,
+        connection acquire, time to first byte, body read and deserialization)
+        of every request, see `core.timing`.
+        """
         self._base_client = AsyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.AsyncClient(timeout=timeout)
+            httpx_client=build_async_httpx_client(
+                timeout=timeout,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+                host_limits=host_limits,
+            )
             if httpx_client is None
             else httpx_client,
+            validate_response=validate_response,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            compression=compression,
+            timing_hooks=timing_hooks,
         )
         self._base_client.register_auth(
             "ApiKeyAuth", AuthKey(name="x-sideko-key", location="header", val=api_key)
@@ -88,17 +439,137 @@ class AsyncClient:
             "CookieAuth",
             AuthKey(name="SIDEKO_SESSION", location="cookie", val=api_key_1),
         )
-        self.api = AsyncApiClient(base_client=self._base_client)
-        self.api_link = AsyncApiLinkClient(base_client=self._base_client)
-        self.doc = AsyncDocClient(base_client=self._base_client)
-        self.asset = AsyncAssetClient(base_client=self._base_client)
-        self.role = AsyncRoleClient(base_client=self._base_client)
-        self.service_account = AsyncServiceAccountClient(base_client=self._base_client)
-        self.health = AsyncHealthClient(base_client=self._base_client)
-        self.auth = AsyncAuthClient(base_client=self._base_client)
-        self.cli = AsyncCliClient(base_client=self._base_client)
-        self.org = AsyncOrgClient(base_client=self._base_client)
-        self.sdk = AsyncSdkClient(base_client=self._base_client)
-        self.user = AsyncUserClient(base_client=self._base_client)
-        self.lint = AsyncLintClient(base_client=self._base_client)
-        self.webhook = AsyncWebhookClient(base_client=self._base_client)
+        self._raw_client: typing.Optional["AsyncClient"] = None
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """Attempt and retry counters of the requests sent by this client"""
+        return self._base_client.retry_metrics
+
+    @property
+    def circuit_breaker(self) -> typing.Optional[CircuitBreaker]:
+        """Circuit breaker of this client, `snapshot()` reports each service's state"""
+        return self._base_client.circuit_breaker
+
+    @property
+    def coalescing_stats(self) -> CoalescingStats:
+        """Counters of requests saved by coalescing identical in-flight GETs"""
+        return self._base_client.coalescer.stats
+
+    @property
+    def timing_hooks(self) -> typing.List[TimingHook]:
+        """Hooks called with the `RequestTimings` of every request, may be modified"""
+        return self._base_client.timing_hooks
+
+    @property
+    def with_raw_response(self) -> "AsyncClient":
+        """
+        View of this client whose operations return a `RawResponse` holding
+        the HTTP response and the request's timings next to the parsed result.
+
+        The view shares the connection pool, auth and configuration of this
+        client. Helpers sending several requests, such as `iter_all` and
+        `wait_for`, are only available on the regular client.
+
+        Examples:
+        ```py
+        raw = await client.with_raw_response.health.ping()
+        print(raw.status_code, raw.timings.ttfb, raw.parsed.ok)
+        ```
+        """
+        if self._raw_client is None:
+            raw = AsyncClient.__new__(AsyncClient)
+            raw._base_client = AsyncRawResponseBaseClient(self._base_client)  # type: ignore[assignment]
+            raw._raw_client = raw
+            self._raw_client = raw
+        return self._raw_client
+
+    async def warm_connections(
+        self,
+        *,
+        connections: int = 4,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> int:
+        """
+        Pre-opens pooled connections by sending concurrent `health.ping` requests.
+
+        Call after startup so the first burst of traffic does not pay for TCP
+        and TLS handshakes. Idle connections beyond `max_keepalive_connections`
+        are closed by the pool.
+
+        Args:
+            connections: Number of connections to open, nothing is sent when
+                it is not positive
+            request_options: Additional options to customize the ping requests
+
+        Returns:
+            Number of successful pings
+        """
+        if connections <= 0:
+            return 0
+        results = await asyncio.gather(
+            *[
+                self.health.ping(request_options=request_options)
+                for _ in range(connections)
+            ],
+            return_exceptions=True,
+        )
+        return sum(1 for r in results if not isinstance(r, BaseException))
+
+    async def batch(
+        self,
+        calls: typing.Iterable[BatchCall[T]],
+        *,
+        concurrency: int = 10,
+        rate_limit: typing.Union[float, AsyncRateLimiter, None] = None,
+        fail_fast: bool = True,
+    ) -> typing.List[typing.Any]:
+        """
+        Runs many operation calls with bounded concurrency, see `core.batch`.
+
+        Args:
+            calls: Zero-argument callables returning the awaitable of an
+                operation (eg `lambda: client.api_link.get(id=id)`), or awaitables
+            concurrency: Maximum number of calls in flight
+            rate_limit: Maximum calls started per second, or a limiter shared
+                between batches
+            fail_fast: Raise the first error and cancel the remaining calls,
+                otherwise exceptions are returned in place of failed results
+
+        Returns:
+            Results in the order of `calls`
+
+        Examples:
+        ```py
+        links = await client.batch(
+            [lambda i=i: client.api_link.get(id=i) for i in ids],
+            concurrency=20,
+            rate_limit=50,
+        )
+        ```
+        """
+        return await run_batch(
+            calls, concurrency=concurrency, rate_limit=rate_limit, fail_fast=fail_fast
+        )
+
+    def batch_as_completed(
+        self,
+        calls: typing.Iterable[BatchCall[T]],
+        *,
+        concurrency: int = 10,
+        rate_limit: typing.Union[float, AsyncRateLimiter, None] = None,
+        fail_fast: bool = True,
+    ) -> typing.AsyncIterator[BatchResult[T]]:
+        """
+        Like `batch`, but yields a `BatchResult` for every call as it completes.
+
+        Examples:
+        ```py
+        async for result in client.batch_as_completed(calls, fail_fast=False):
+            if result.ok:
+                print(result.index, result.value)
+        ```
+        """
+        return iter_batch(
+            calls, concurrency=concurrency, rate_limit=rate_limit, fail_fast=fail_fast
+        )
@@ -1,3 +1,4 @@
+from . import batch, http_client
 from .api_error import ApiError
 from .auth import (
     AuthKey,
@@ -9,9 +10,35 @@ from .auth import (
     OAuth2ClientCredentials,
     OAuth2Password,
 )
+from .cache import (
+    CachedResponse,
+    CacheStorage,
+    MemoryCacheStorage,
+    ResponseCache,
+    versioned_ttl,
+)
+from .disk_cache import DiskCacheStorage
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .compression import CompressedStream, RequestCompression
+from .coalesce import AsyncRequestCoalescer, CoalescingStats, RequestCoalescer
+from .construct import (
+    ConstructorRegistry,
+    construct_encodable,
+    constructors,
+)
+from .batch import AsyncRateLimiter, BatchResult, RateLimiter
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
-from .binary_response import BinaryResponse
+from .http_client import build_async_httpx_client, build_httpx_client
+from .binary_response import (
+    AsyncStreamingBinaryResponse,
+    BinaryResponse,
+    StreamingBinaryResponse,
+)
+from .lazy import LazyClient
+from .pagination import apaginate, paginate
+from .polling import PollPolicy, PollTimeout, apoll_until, poll_until
 from .query import encode_query_param, QueryParams
+from .raw_response import RawResponse
 from .request import (
     filter_not_given,
     to_content,
@@ -19,14 +46,22 @@ from .request import (
     to_form_urlencoded,
     RequestOptions,
     default_request_options,
+    request_adapters,
 )
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .response import from_encodable, from_json, AsyncStreamResponse, StreamResponse
+from .retry import RetryMetrics, RetryPolicy
+from .sse import ServerSentEvent, SSEDecoder
+from .timing import RequestTimings, TimingHook
+from .upload import AsyncChunkReader, FileStream
+from .type_adapters import TypeAdapterRegistry, response_adapters
 
 __all__ = [
     "ApiError",
     "AsyncBaseClient",
     "BaseClient",
     "BinaryResponse",
+    "StreamingBinaryResponse",
+    "AsyncStreamingBinaryResponse",
     "RequestOptions",
     "default_request_options",
     "SyncBaseClient",
@@ -42,9 +77,51 @@ __all__ = [
     "to_form_urlencoded",
     "filter_not_given",
     "to_content",
+    "FileStream",
+    "AsyncChunkReader",
     "encode_query_param",
     "from_encodable",
+    "from_json",
     "AsyncStreamResponse",
     "StreamResponse",
     "QueryParams",
+    "ServerSentEvent",
+    "SSEDecoder",
+    "TypeAdapterRegistry",
+    "response_adapters",
+    "request_adapters",
+    "build_httpx_client",
+    "build_async_httpx_client",
+    "ConstructorRegistry",
+    "construct_encodable",
+    "constructors",
+    "RetryMetrics",
+    "RetryPolicy",
+    "LazyClient",
+    "paginate",
+    "apaginate",
+    "PollPolicy",
+    "PollTimeout",
+    "poll_until",
+    "apoll_until",
+    "batch",
+    "AsyncRateLimiter",
+    "BatchResult",
+    "RateLimiter",
+    "RequestCompression",
+    "CompressedStream",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "AsyncRequestCoalescer",
+    "CoalescingStats",
+    "RequestCoalescer",
+    "CachedResponse",
+    "CacheStorage",
+    "MemoryCacheStorage",
+    "ResponseCache",
+    "versioned_ttl",
+    "DiskCacheStorage",
+    "RawResponse",
+    "RequestTimings",
+    "TimingHook",
 ]
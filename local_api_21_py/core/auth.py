@@ -1,7 +1,9 @@
 """Generated by Sideko (sideko.dev)"""
 
 import abc
+import asyncio
 import datetime
+import threading
 from typing import Any, Dict, TypedDict, Optional, List, Tuple, Literal, Union, cast
 
 import jsonpointer  # type: ignore
@@ -38,6 +40,22 @@ class AuthProvider(abc.ABC):
             val: Authentication value to set
         """
 
+    def prepare(self, httpx_client: httpx.Client) -> None:
+        """
+        Performs any I/O the provider needs before `add_to_request` is called.
+
+        Args:
+            httpx_client: The client's pooled HTTPX client
+        """
+
+    async def prepare_async(self, httpx_client: httpx.AsyncClient) -> None:
+        """
+        Asynchronous version of `prepare`, must not block the event loop.
+
+        Args:
+            httpx_client: The client's pooled asynchronous HTTPX client
+        """
+
 
 class AuthBasic(AuthProvider):
     """
@@ -208,6 +226,21 @@ class OAuth2(AuthProvider):
     Implements OAuth2 token retrieval and refreshing.
     Currently supports `password` and `client_credentials`
     grant types.
+
+    When used by an asynchronous client, token requests go through the
+    client's connection pool, concurrent requests share a single in-flight
+    refresh and the token is refreshed in the background once it is within
+    `refresh_window` seconds of expiring, so requests only wait when no
+    usable token exists.
+
+    Synchronous clients may share the provider between threads, a lock
+    ensures only one thread fetches a token while the others wait for it.
+
+    Tokens are only fetched while requests are sent, through the HTTPX client
+    of the client they are sent with: nothing refreshes a token in the
+    background while a client is idle, so the first request after the token
+    expired waits for a new one. Services with long idle periods that cannot
+    afford this wait can call `prepare` / `prepare_async` on a schedule.
     """
 
     # OAuth2 provider configuration
@@ -230,6 +263,7 @@ class OAuth2(AuthProvider):
     # access_token storage
     access_token: Optional[str]
     expires_at: Optional[datetime.datetime]
+    refresh_window: datetime.timedelta
 
     def __init__(
         self,
@@ -242,6 +276,7 @@ class OAuth2(AuthProvider):
         body_content: BodyContent,
         request_mutator: AuthProvider,
         form: Optional[Union[OAuth2Password, OAuth2ClientCredentials]] = None,
+        refresh_window: float = 30,
     ):
         super().__init__()
 
@@ -271,8 +306,15 @@ class OAuth2(AuthProvider):
 
         self.access_token = None
         self.expires_at = None
-
-    def _refresh(self) -> Tuple[str, datetime.datetime]:
+        self.refresh_window = datetime.timedelta(seconds=refresh_window)
+        self._refresh_task: Optional["asyncio.Future[None]"] = None
+        self._lock = threading.RLock()
+        # HTTPX client of the synchronous client last prepared with, None
+        # when the provider was last prepared by an asynchronous client
+        self._httpx_client: Optional[httpx.Client] = None
+        self._prepared_async = False
+
+    def _token_request(self) -> Dict[str, Any]:
         # build token url using base_url if relative
         url = self.token_url
         if url.startswith("/"):
@@ -306,8 +348,11 @@ class OAuth2(AuthProvider):
             req_cfg["data"] = req_data
             req_cfg["headers"] = {"content-type": "application/x-www-form-urlencoded"}
 
-        # make access token request
-        token_res = httpx.post(**req_cfg)
+        return req_cfg
+
+    def _parse_token_response(
+        self, token_res: httpx.Response
+    ) -> Tuple[str, datetime.datetime]:
         token_res.raise_for_status()
 
         # retrieve access token & optional expiry seconds
@@ -329,26 +374,109 @@ class OAuth2(AuthProvider):
 
         return (access_token, expires_at)
 
-    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
-        if (
+    def _refresh(
+        self, httpx_client: Optional[httpx.Client] = None
+    ) -> Tuple[str, datetime.datetime]:
+        post = httpx.post if httpx_client is None else httpx_client.post
+        return self._parse_token_response(post(**self._token_request()))
+
+    async def _refresh_async(
+        self, httpx_client: httpx.AsyncClient
+    ) -> Tuple[str, datetime.datetime]:
+        token_res = await httpx_client.post(**self._token_request())
+        return self._parse_token_response(token_res)
+
+    def _is_configured(self) -> bool:
+        return not (
             self.username is None
             and self.password is None
             and self.client_id is None
             and self.client_secret is None
-        ):
+        )
+
+    def _has_valid_token(self) -> bool:
+        return self.access_token is not None and (
+            self.expires_at is None or self.expires_at > datetime.datetime.now()
+        )
+
+    def _expires_soon(self) -> bool:
+        return (
+            self.expires_at is not None
+            and self.expires_at - self.refresh_window <= datetime.datetime.now()
+        )
+
+    def prepare(self, httpx_client: httpx.Client) -> None:
+        """
+        Refreshes a missing or expired token through the client's connection pool.
+        """
+        self._httpx_client = httpx_client
+        self._prepared_async = False
+        if not self._is_configured() or self._has_valid_token():
+            return
+        with self._lock:
+            # another thread may have refreshed while this one waited
+            if not self._has_valid_token():
+                self.access_token, self.expires_at = self._refresh(httpx_client)
+
+    async def prepare_async(self, httpx_client: httpx.AsyncClient) -> None:
+        """
+        Ensures a usable token without blocking the event loop.
+
+        A token about to expire is refreshed in the background while the
+        current one keeps being used. Without a usable token the caller
+        waits for the single in-flight refresh shared by all requests.
+        """
+        self._httpx_client = None
+        self._prepared_async = True
+        if not self._is_configured():
+            return
+
+        if self._has_valid_token():
+            if self._expires_soon() and self._refresh_task is None:
+                self._start_refresh(httpx_client)
+            return
+
+        refresh_task = self._refresh_task or self._start_refresh(httpx_client)
+        # shield the shared refresh from cancellation of a single waiter
+        await asyncio.shield(refresh_task)
+
+    def _start_refresh(self, httpx_client: httpx.AsyncClient) -> "asyncio.Future[None]":
+        self._refresh_task = asyncio.ensure_future(self._run_refresh(httpx_client))
+        # background refresh failures are retried by the next request, mark
+        # them retrieved so they are not reported as unhandled
+        self._refresh_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+        return self._refresh_task
+
+    async def _run_refresh(self, httpx_client: httpx.AsyncClient) -> None:
+        try:
+            self.access_token, self.expires_at = await self._refresh_async(httpx_client)
+        finally:
+            self._refresh_task = None
+
+    def _needs_blocking_refresh(self) -> bool:
+        if self._has_valid_token():
+            return False
+        # the token `prepare_async` just checked expired since, `expires_at`
+        # keeps a minute of margin so it is still accepted and the next
+        # `prepare_async` refreshes it without blocking the event loop
+        return not (self._prepared_async and self.access_token is not None)
+
+    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+        if not self._is_configured():
             # provider is not configured to make an oauth token request
             return cfg
 
-        token_expired = (
-            self.expires_at is not None and self.expires_at <= datetime.datetime.now()
-        )
-        if self.access_token is None or token_expired:
-            access_token, expires_at = self._refresh()
-            self.expires_at = expires_at
-            self.access_token = access_token
+        with self._lock:
+            if self._needs_blocking_refresh():
+                # through the pool of the synchronous client last prepared
+                # with, a standalone request when the provider never was
+                self.access_token, self.expires_at = self._refresh(self._httpx_client)
 
-        self.request_mutator.set_value(self.access_token)
-        return self.request_mutator.add_to_request(cfg)
+            # the mutator is shared, set and apply the token as one step
+            self.request_mutator.set_value(self.access_token)
+            return self.request_mutator.add_to_request(cfg)
 
     def set_value(self, _val: Optional[str]) -> None:
         raise NotImplementedError("an OAuth2 auth provider cannot be a request_mutator")
@@ -1,14 +1,21 @@
 from typing import (
     Any,
+    Hashable,
+    Iterable,
     List,
     TypeVar,
     Dict,
     Optional,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
 )
 from typing_extensions import TypeGuard
+import asyncio
+import threading
+import time
 
 import httpx
 from pydantic import BaseModel
@@ -16,9 +23,26 @@ from pydantic import BaseModel
 from .api_error import ApiError
 from .auth import AuthProvider
 from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .response import from_json, AsyncStreamResponse, StreamResponse
+from .construct import construct_encodable
+from .cache import CachedResponse, ResponseCache
+from .compression import CompressedStream, RequestCompression
+from .coalesce import AsyncRequestCoalescer, RequestCoalescer, coalescing_key
+from .circuit_breaker import (
+    UNTRACKED,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitPermit,
+)
+from .retry import RetryMetrics, RetryPolicy, RetryState, body_rewinder, is_replayable
+from .timing import TimingHook, active_timer, start_timer
+from .upload import AsyncChunkReader, FileStream
 from .utils import get_response_type, filter_binary_response
-from .binary_response import BinaryResponse
+from .binary_response import (
+    AsyncStreamingBinaryResponse,
+    BinaryResponse,
+    StreamingBinaryResponse,
+)
 
 NoneType = type(None)
 T = TypeVar(
@@ -36,9 +60,27 @@ class BaseClient:
 
     Attributes:
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        validate_response: Whether response bodies are validated by default
+        retry: Default retry policy for requests, a single attempt unless set
+        retry_metrics: Attempt and retry counters of all requests
+        circuit_breaker: Per-service circuit breaker, None when disabled
+        coalesce_requests: Whether identical concurrent GETs share one request
+        cache: Response cache for read operations, None when disabled
+        compression: Request body compression, None when disabled
+        timing_hooks: Called with the `RequestTimings` of every request
     """
 
-    def __init__(self, base_url: Union[str, Dict[str, str]]):
+    def __init__(
+        self,
+        base_url: Union[str, Dict[str, str]],
+        validate_response: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        compression: Optional[RequestCompression] = None,
+        timing_hooks: Optional[List[TimingHook]] = None,
+    ):
         """Initialize the base client"""
         self._base_url = (
             base_url
@@ -46,6 +88,14 @@ class BaseClient:
             else {_DEFAULT_SERVICE_NAME: base_url}
         )
         self._auths: Dict[str, AuthProvider] = {}
+        self.validate_response = validate_response
+        self.retry = retry if retry is not None else RetryPolicy(max_attempts=1)
+        self.retry_metrics = RetryMetrics()
+        self.circuit_breaker = circuit_breaker
+        self.coalesce_requests = coalesce_requests
+        self.cache = cache
+        self.compression = compression
+        self.timing_hooks: List[TimingHook] = list(timing_hooks or [])
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -202,6 +252,31 @@ class BaseClient:
 
         return cfg
 
+    def _apply_compression(
+        self,
+        *,
+        cfg: RequestConfig,
+        opts: RequestOptions,
+    ) -> RequestConfig:
+        """Compress the request body when enabled for the client or request.
+
+        Args:
+            cfg: Request configuration to modify
+            opts: Request options that may enable or disable compression
+
+        Returns:
+            Request configuration with a compressed body, or `cfg` unchanged
+        """
+        compress = opts.get("compress", None)
+        compression = self.compression
+        if compress is False:
+            return cfg
+        if compress and compression is None:
+            compression = RequestCompression()
+        if compression is None:
+            return cfg
+        return compression.apply(cfg)
+
     def _apply_body(
         self,
         *,
@@ -287,20 +362,145 @@ class BaseClient:
             cfg=req_cfg, data=data, files=files, json=json, content=content
         )
         req_cfg = self._apply_timeout(cfg=req_cfg, opts=opts)
+        # last, so the uncompressed fallback is the complete configuration
+        req_cfg = self._apply_compression(cfg=req_cfg, opts=opts)
 
         return req_cfg
 
+    def _should_validate(self, opts: Optional[RequestOptions]) -> bool:
+        """Resolves the response validation setting for a request"""
+        if opts is not None:
+            return opts.get("validate_response", self.validate_response)
+        return self.validate_response
+
+    def _streams_binary(
+        self, cast_to: Union[Type[T], Any], opts: Optional[RequestOptions]
+    ) -> bool:
+        """Whether a binary download should be returned without buffering"""
+        return cast_to is BinaryResponse and bool((opts or {}).get("stream"))
+
+    def _start_retry(
+        self, *, req_cfg: RequestConfig, opts: Optional[RequestOptions]
+    ) -> RetryState:
+        """Begins tracking the attempts of a request under its retry policy"""
+        policy = (opts or {}).get("retry") or self.retry
+        content = req_cfg.get("content")
+        return policy.start(
+            method=req_cfg["method"],
+            rewind=body_rewinder(content),
+            replayable=is_replayable(content),
+            metrics=self.retry_metrics,
+        )
+
+    def _coalescing_key(
+        self, *, req_cfg: RequestConfig, opts: Optional[RequestOptions]
+    ) -> Optional[Hashable]:
+        """Key shared by identical requests, None if the request is not coalesced"""
+        if not (opts or {}).get("coalesce", self.coalesce_requests):
+            return None
+        return coalescing_key(req_cfg)
+
+    def _cache_lookup(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        opts: Optional[RequestOptions],
+        path: Optional[str],
+    ) -> Optional[Tuple[str, float]]:
+        """Cache key and TTL of a cacheable request, None if it is not cached"""
+        if self.cache is None or path is None or not (opts or {}).get("cache", True):
+            return None
+        ttl = self.cache.ttl_for(req_cfg["method"], path)
+        if ttl is None:
+            return None
+        key = self.cache.key_for(req_cfg, path)
+        return None if key is None else (key, ttl)
+
+    def _conditional(
+        self, req_cfg: RequestConfig, entry: Optional[CachedResponse]
+    ) -> RequestConfig:
+        """Adds the validators of an expired cache entry to a request"""
+        validators = entry.validators() if entry is not None else None
+        if not validators:
+            return req_cfg
+        headers = {**req_cfg.get("headers", {}), **validators}
+        return cast(RequestConfig, {**req_cfg, "headers": headers})
+
+    def _cache_update(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        path: Optional[str],
+        lookup: Optional[Tuple[str, float]],
+        response: httpx.Response,
+        entry: Optional[CachedResponse] = None,
+    ) -> httpx.Response:
+        """
+        Stores cacheable responses and invalidates reads after mutations.
+
+        Returns the response to process, which is rebuilt from the cached body
+        when the server answered a conditional request with `304 Not Modified`.
+        """
+        if self.cache is None or path is None:
+            return response
+        if lookup is not None:
+            key, ttl = lookup
+            if response.status_code == 304 and entry is not None:
+                entry = self.cache.revalidated(key, entry, response, ttl)
+                return entry.to_response(req_cfg)
+            self.cache.store(key, response, ttl)
+        elif response.is_success and req_cfg["method"].upper() not in (
+            "GET",
+            "HEAD",
+            "OPTIONS",
+        ):
+            self.cache.invalidate(path)
+        return response
+
+    def _compression_fallback(
+        self, *, req_cfg: RequestConfig, response: httpx.Response
+    ) -> Optional[RequestConfig]:
+        """
+        Returns the uncompressed request when the server rejected a compressed
+        body with 415 Unsupported Media Type, None otherwise
+        """
+        if response.status_code != 415:
+            return None
+        content = req_cfg.get("content")
+        if isinstance(content, AsyncChunkReader):
+            content = content.chunks
+        if not isinstance(content, CompressedStream):
+            return None
+        content.compression.reject(req_cfg["url"])
+        return content.uncompressed()
+
+    def _attempt_config(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        state: RetryState,
+        default_timeout: httpx.Timeout,
+    ) -> RequestConfig:
+        """Limits the timeout of the next attempt to the remaining deadline"""
+        timeout = state.timeout(req_cfg.get("timeout", default_timeout))
+        if timeout is None:
+            return req_cfg
+        return cast(RequestConfig, {**req_cfg, "timeout": timeout})
+
     def process_response(
         self,
         *,
         response=httpx.Response,
         cast_to: Union[Type[T], Any],
+        validate: bool = True,
     ) -> T:
         """Process an HTTP response and convert it to the desired type.
 
         Args:
             response: HTTP response to process
             cast_to: Type to cast the response data to
+            validate: Validate JSON bodies with pydantic, when False models are
+                constructed from the trusted data without validation
 
         Returns:
             Processed response data of the specified type
@@ -322,9 +522,10 @@ class BaseClient:
         if response_type == "json":
             if cast_to is type(Any):
                 return response.json()
-            return from_encodable(
-                data=response.json(), load_with=filter_binary_response(cast_to=cast_to)
-            )
+            load_with = filter_binary_response(cast_to=cast_to)
+            if not validate:
+                return construct_encodable(data=response.json(), load_with=load_with)
+            return from_json(content=response.content, load_with=load_with)
         elif response_type == "text":
             return cast(T, response.text)
         else:
@@ -345,14 +546,260 @@ class SyncBaseClient(BaseClient):
         *,
         base_url: Union[str, Dict[str, str]],
         httpx_client: httpx.Client,
+        validate_response: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        compression: Optional[RequestCompression] = None,
+        timing_hooks: Optional[List[TimingHook]] = None,
     ):
         """Initialize the synchronous client.
 
         Args:
             httpx_client: Synchronous HTTPX client instance
+            validate_response: Whether response bodies are validated by default
+            retry: Default retry policy, requests are not retried if omitted
+            circuit_breaker: Fail fast while a service is degraded
+            coalesce_requests: Share one in-flight request between identical GETs
+            cache: Cache responses of read operations
+            compression: Compress request bodies above a size threshold
+            timing_hooks: Called with the phase timings of every request
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            validate_response=validate_response,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            compression=compression,
+            timing_hooks=timing_hooks,
+        )
         self.httpx_client = httpx_client
+        self.coalescer = RequestCoalescer()
+
+    def _prepare_auth(self, auth_names: Optional[List[str]]) -> None:
+        """Lets auth providers perform I/O (eg token refreshes) through the pool"""
+        for auth_name in auth_names or []:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                auth_provider.prepare(self.httpx_client)
+
+    def _acquire_circuit(self, service_name: Optional[str]) -> CircuitPermit:
+        """Asks the circuit breaker to send a request, probing half-open circuits"""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return UNTRACKED
+        name = service_name or _DEFAULT_SERVICE_NAME
+        permit = breaker.acquire(name)
+        while permit.probe and breaker.probe_path is not None:
+            try:
+                probe = self.httpx_client.get(
+                    self.build_url(breaker.probe_path, service_name=service_name),
+                    headers=self.default_headers(),
+                )
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                raise CircuitOpenError(
+                    service_name=name, retry_in=breaker.open_duration
+                ) from e
+            except BaseException:
+                permit.release()
+                raise
+            if permit.record_response(probe, require_success=True):
+                raise CircuitOpenError(
+                    service_name=name, retry_in=breaker.open_duration
+                )
+            permit = breaker.acquire(name)
+        return permit
+
+    def _fetch(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        Sends a request, serving it from the response cache and sharing
+        identical in-flight GETs when enabled
+        """
+        lookup = self._cache_lookup(req_cfg=req_cfg, opts=request_options, path=path)
+        if lookup is None or self.cache is None:
+            response = self._exchange(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            )
+            return self._cache_update(
+                req_cfg=req_cfg, path=path, lookup=lookup, response=response
+            )
+
+        entry, serve, refresh = self.cache.lookup(lookup[0])
+        if entry is not None and serve:
+            if refresh:
+                refresh_kwargs: Dict[str, Any] = dict(
+                    req_cfg=req_cfg,
+                    request_options=request_options,
+                    service_name=service_name,
+                    path=path,
+                    lookup=lookup,
+                    entry=entry,
+                )
+                threading.Thread(
+                    target=self._refresh_cached, kwargs=refresh_kwargs, daemon=True
+                ).start()
+            return entry.to_response(req_cfg)
+
+        response = self._exchange(
+            req_cfg=self._conditional(req_cfg, entry),
+            request_options=request_options,
+            service_name=service_name,
+        )
+        return self._cache_update(
+            req_cfg=req_cfg, path=path, lookup=lookup, response=response, entry=entry
+        )
+
+    def _refresh_cached(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str],
+        path: str,
+        lookup: Tuple[str, float],
+        entry: CachedResponse,
+    ) -> None:
+        """Revalidates a stale cache entry that was served to a caller"""
+        try:
+            response = self._exchange(
+                req_cfg=self._conditional(req_cfg, entry),
+                request_options=request_options,
+                service_name=service_name,
+            )
+            self._cache_update(
+                req_cfg=req_cfg,
+                path=path,
+                lookup=lookup,
+                response=response,
+                entry=entry,
+            )
+        except Exception:
+            # the stale entry stays in place and is revalidated by a later call
+            pass
+        finally:
+            if self.cache is not None:
+                self.cache.finish_refresh(lookup[0])
+
+    def _exchange(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> httpx.Response:
+        """Sends a request, sharing identical in-flight GETs when enabled"""
+        key = self._coalescing_key(req_cfg=req_cfg, opts=request_options)
+        if key is None:
+            return self._send(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            )
+        return self.coalescer.run(
+            key,
+            lambda: self._send(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            ),
+        )
+
+    def _send(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> httpx.Response:
+        """Sends a request, retrying transient failures per the retry policy"""
+        state = self._start_retry(req_cfg=req_cfg, opts=request_options)
+        timer = active_timer()
+        while True:
+            state.begin_attempt()
+            cfg = self._attempt_config(
+                req_cfg=req_cfg, state=state, default_timeout=self.httpx_client.timeout
+            )
+            permit = self._acquire_circuit(service_name)
+            if timer is not None:
+                cfg = timer.attempt(cfg, timer.trace)
+            try:
+                response = self.httpx_client.request(**cfg)
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            except BaseException:
+                permit.release()
+                raise
+            else:
+                if timer is not None:
+                    timer.received()
+                permit.record_response(response)
+                fallback = self._compression_fallback(
+                    req_cfg=req_cfg, response=response
+                )
+                if fallback is not None:
+                    response.close()
+                    req_cfg = fallback
+                    continue
+                delay = state.on_response(response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    def _open_stream(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> Any:
+        """Opens a streaming response, retrying failures before the body is read"""
+        state = self._start_retry(req_cfg=req_cfg, opts=request_options)
+        timer = active_timer()
+        while True:
+            state.begin_attempt()
+            cfg = self._attempt_config(
+                req_cfg=req_cfg, state=state, default_timeout=self.httpx_client.timeout
+            )
+            permit = self._acquire_circuit(service_name)
+            if timer is not None:
+                cfg = timer.attempt(cfg, timer.trace)
+            context = self.httpx_client.stream(**cfg)
+            try:
+                response = context.__enter__()
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            except BaseException:
+                permit.release()
+                raise
+            else:
+                if timer is not None:
+                    timer.received()
+                permit.record_response(response)
+                delay = state.on_response(response)
+                if delay is None:
+                    return response, context
+                context.__exit__(None, None, None)
+            time.sleep(delay)
 
     def request(
         self,
@@ -394,29 +841,70 @@ class SyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
-            method=method,
-            path=path,
-            service_name=service_name,
-            auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
-            request_options=request_options,
-        )
-        response = self.httpx_client.request(**req_cfg)
+        timer = start_timer(method=method, path=path, hooks=self.timing_hooks)
+        try:
+            self._prepare_auth(auth_names)
+            if timer is not None:
+                timer.lap("auth")
+            req_cfg = self.build_request(
+                method=method,
+                path=path,
+                service_name=service_name,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            if timer is not None:
+                timer.lap("build")
+            if self._streams_binary(cast_to, request_options):
+                response, context = self._open_stream(
+                    req_cfg=req_cfg,
+                    request_options=request_options,
+                    service_name=service_name,
+                )
+                if timer is not None:
+                    timer.fetched(response)
+                if not response.is_success:
+                    response.read()
+                    context.__exit__(None, None, None)
+                    raise ApiError(response=response)
+                return cast(
+                    T,
+                    StreamingBinaryResponse(response=response, stream_context=context),
+                )
+
+            response = self._fetch(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+                path=path,
+            )
+            if timer is not None:
+                timer.fetched(response)
 
-        if not response.is_success:
-            raise ApiError(response=response)
+            if not response.is_success:
+                raise ApiError(response=response)
 
-        if self._cast_to_raw_response(res=response, cast_to=cast_to):
-            return response
+            if self._cast_to_raw_response(res=response, cast_to=cast_to):
+                return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+            result = self.process_response(
+                response=response,
+                cast_to=cast_to,
+                validate=self._should_validate(request_options),
+            )
+            if timer is not None:
+                timer.lap("deserialize")
+            return result
+        finally:
+            if timer is not None:
+                timer.finish()
 
     def stream_request(
         self,
@@ -458,6 +946,7 @@ class SyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        self._prepare_auth(auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
@@ -472,8 +961,9 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = context.__enter__()
+        response, context = self._open_stream(
+            req_cfg=req_cfg, request_options=request_options, service_name=service_name
+        )
         return StreamResponse(response, context, cast_to)
 
 
@@ -488,14 +978,304 @@ class AsyncBaseClient(BaseClient):
         *,
         base_url: Union[str, Dict[str, str]],
         httpx_client: httpx.AsyncClient,
+        validate_response: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+        compression: Optional[RequestCompression] = None,
+        timing_hooks: Optional[List[TimingHook]] = None,
     ):
         """Initialize the asynchronous client.
 
         Args:
             httpx_client: Asynchronous HTTPX client instance
+            validate_response: Whether response bodies are validated by default
+            retry: Default retry policy, requests are not retried if omitted
+            circuit_breaker: Fail fast while a service is degraded
+            coalesce_requests: Share one in-flight request between identical GETs
+            cache: Cache responses of read operations
+            compression: Compress request bodies above a size threshold
+            timing_hooks: Called with the phase timings of every request
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            validate_response=validate_response,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+            compression=compression,
+            timing_hooks=timing_hooks,
+        )
         self.httpx_client = httpx_client
+        self.coalescer = AsyncRequestCoalescer()
+        self._background: Set[asyncio.Future] = set()
+
+    async def _prepare_auth(self, auth_names: Optional[List[str]]) -> None:
+        """Lets auth providers perform non-blocking I/O (eg token refreshes)"""
+        for auth_name in auth_names or []:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                await auth_provider.prepare_async(self.httpx_client)
+
+    def _nonblocking_body(self, req_cfg: RequestConfig) -> RequestConfig:
+        """
+        Moves reading of file-backed bodies off the event loop.
+
+        HTTPX reads files and multipart uploads synchronously while sending,
+        those bodies are re-encoded as an `AsyncChunkReader` with the length
+        and content type HTTPX would have sent. Compressed bodies are also
+        compressed in the executor.
+        """
+        content = req_cfg.get("content")
+        if req_cfg.get("files"):
+            encoded = httpx.Request(
+                req_cfg["method"],
+                req_cfg["url"],
+                data=req_cfg.get("data"),
+                files=req_cfg["files"],
+            )
+            body: Iterable[bytes] = cast(Iterable[bytes], encoded.stream)
+            body_headers = {
+                k: v
+                for k, v in encoded.headers.items()
+                if k in ("content-type", "content-length")
+            }
+        elif isinstance(content, CompressedStream):
+            body = content
+            body_headers = {}
+        elif isinstance(content, FileStream):
+            body = content
+            body_headers = (
+                {"content-length": str(content.size)}
+                if content.size is not None
+                else {}
+            )
+        else:
+            return req_cfg
+
+        cfg = {
+            k: v for k, v in req_cfg.items() if k not in ("data", "files", "content")
+        }
+        cfg["headers"] = {**req_cfg.get("headers", {}), **body_headers}
+        cfg["content"] = AsyncChunkReader(body)
+        return cast(RequestConfig, cfg)
+
+    async def _acquire_circuit(self, service_name: Optional[str]) -> CircuitPermit:
+        """Asks the circuit breaker to send a request, probing half-open circuits"""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return UNTRACKED
+        name = service_name or _DEFAULT_SERVICE_NAME
+        permit = breaker.acquire(name)
+        while permit.probe and breaker.probe_path is not None:
+            try:
+                probe = await self.httpx_client.get(
+                    self.build_url(breaker.probe_path, service_name=service_name),
+                    headers=self.default_headers(),
+                )
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                raise CircuitOpenError(
+                    service_name=name, retry_in=breaker.open_duration
+                ) from e
+            except BaseException:
+                permit.release()
+                raise
+            if permit.record_response(probe, require_success=True):
+                raise CircuitOpenError(
+                    service_name=name, retry_in=breaker.open_duration
+                )
+            permit = breaker.acquire(name)
+        return permit
+
+    async def _fetch(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        Sends a request, serving it from the response cache and sharing
+        identical in-flight GETs when enabled
+        """
+        lookup = self._cache_lookup(req_cfg=req_cfg, opts=request_options, path=path)
+        if lookup is None or self.cache is None:
+            response = await self._exchange(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            )
+            return self._cache_update(
+                req_cfg=req_cfg, path=path, lookup=lookup, response=response
+            )
+
+        entry, serve, refresh = self.cache.lookup(lookup[0])
+        if entry is not None and serve:
+            if refresh:
+                refresh_kwargs: Dict[str, Any] = dict(
+                    req_cfg=req_cfg,
+                    request_options=request_options,
+                    service_name=service_name,
+                    path=path,
+                    lookup=lookup,
+                    entry=entry,
+                )
+                task = asyncio.ensure_future(self._refresh_cached(**refresh_kwargs))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return entry.to_response(req_cfg)
+
+        response = await self._exchange(
+            req_cfg=self._conditional(req_cfg, entry),
+            request_options=request_options,
+            service_name=service_name,
+        )
+        return self._cache_update(
+            req_cfg=req_cfg, path=path, lookup=lookup, response=response, entry=entry
+        )
+
+    async def _refresh_cached(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str],
+        path: str,
+        lookup: Tuple[str, float],
+        entry: CachedResponse,
+    ) -> None:
+        """Revalidates a stale cache entry that was served to a caller"""
+        try:
+            response = await self._exchange(
+                req_cfg=self._conditional(req_cfg, entry),
+                request_options=request_options,
+                service_name=service_name,
+            )
+            self._cache_update(
+                req_cfg=req_cfg,
+                path=path,
+                lookup=lookup,
+                response=response,
+                entry=entry,
+            )
+        except Exception:
+            # the stale entry stays in place and is revalidated by a later call
+            pass
+        finally:
+            if self.cache is not None:
+                self.cache.finish_refresh(lookup[0])
+
+    async def _exchange(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> httpx.Response:
+        """Sends a request, sharing identical in-flight GETs when enabled"""
+        key = self._coalescing_key(req_cfg=req_cfg, opts=request_options)
+        if key is None:
+            return await self._send(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            )
+        return await self.coalescer.run(
+            key,
+            lambda: self._send(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+            ),
+        )
+
+    async def _send(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> httpx.Response:
+        """Sends a request, retrying transient failures per the retry policy"""
+        state = self._start_retry(req_cfg=req_cfg, opts=request_options)
+        timer = active_timer()
+        while True:
+            state.begin_attempt()
+            cfg = self._attempt_config(
+                req_cfg=req_cfg, state=state, default_timeout=self.httpx_client.timeout
+            )
+            permit = await self._acquire_circuit(service_name)
+            if timer is not None:
+                cfg = timer.attempt(cfg, timer.atrace)
+            try:
+                response = await self.httpx_client.request(**cfg)
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            except BaseException:
+                permit.release()
+                raise
+            else:
+                if timer is not None:
+                    timer.received()
+                permit.record_response(response)
+                fallback = self._compression_fallback(
+                    req_cfg=req_cfg, response=response
+                )
+                if fallback is not None:
+                    await response.aclose()
+                    req_cfg = self._nonblocking_body(fallback)
+                    continue
+                delay = state.on_response(response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _open_stream(
+        self,
+        *,
+        req_cfg: RequestConfig,
+        request_options: Optional[RequestOptions],
+        service_name: Optional[str] = None,
+    ) -> Any:
+        """Opens a streaming response, retrying failures before the body is read"""
+        state = self._start_retry(req_cfg=req_cfg, opts=request_options)
+        timer = active_timer()
+        while True:
+            state.begin_attempt()
+            cfg = self._attempt_config(
+                req_cfg=req_cfg, state=state, default_timeout=self.httpx_client.timeout
+            )
+            permit = await self._acquire_circuit(service_name)
+            if timer is not None:
+                cfg = timer.attempt(cfg, timer.atrace)
+            context = self.httpx_client.stream(**cfg)
+            try:
+                response = await context.__aenter__()
+            except httpx.TransportError as e:
+                permit.record_error(e)
+                delay = state.on_error(e)
+                if delay is None:
+                    raise
+            except BaseException:
+                permit.release()
+                raise
+            else:
+                if timer is not None:
+                    timer.received()
+                permit.record_response(response)
+                delay = state.on_response(response)
+                if delay is None:
+                    return response, context
+                await context.__aexit__(None, None, None)
+            await asyncio.sleep(delay)
 
     async def request(
         self,
@@ -537,29 +1317,73 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
-        req_cfg = self.build_request(
-            method=method,
-            path=path,
-            service_name=service_name,
-            auth_names=auth_names,
-            query_params=query_params,
-            headers=headers,
-            data=data,
-            files=files,
-            json=json,
-            content_type=content_type,
-            content=content,
-            request_options=request_options,
-        )
-        response = await self.httpx_client.request(**req_cfg)
+        timer = start_timer(method=method, path=path, hooks=self.timing_hooks)
+        try:
+            await self._prepare_auth(auth_names)
+            if timer is not None:
+                timer.lap("auth")
+            req_cfg = self.build_request(
+                method=method,
+                path=path,
+                service_name=service_name,
+                auth_names=auth_names,
+                query_params=query_params,
+                headers=headers,
+                data=data,
+                files=files,
+                json=json,
+                content_type=content_type,
+                content=content,
+                request_options=request_options,
+            )
+            req_cfg = self._nonblocking_body(req_cfg)
+            if timer is not None:
+                timer.lap("build")
+            if self._streams_binary(cast_to, request_options):
+                response, context = await self._open_stream(
+                    req_cfg=req_cfg,
+                    request_options=request_options,
+                    service_name=service_name,
+                )
+                if timer is not None:
+                    timer.fetched(response)
+                if not response.is_success:
+                    await response.aread()
+                    await context.__aexit__(None, None, None)
+                    raise ApiError(response=response)
+                return cast(
+                    T,
+                    AsyncStreamingBinaryResponse(
+                        response=response, stream_context=context
+                    ),
+                )
+
+            response = await self._fetch(
+                req_cfg=req_cfg,
+                request_options=request_options,
+                service_name=service_name,
+                path=path,
+            )
+            if timer is not None:
+                timer.fetched(response)
 
-        if not response.is_success:
-            raise ApiError(response=response)
+            if not response.is_success:
+                raise ApiError(response=response)
 
-        if self._cast_to_raw_response(res=response, cast_to=cast_to):
-            return response
+            if self._cast_to_raw_response(res=response, cast_to=cast_to):
+                return response
 
-        return self.process_response(response=response, cast_to=cast_to)
+            result = self.process_response(
+                response=response,
+                cast_to=cast_to,
+                validate=self._should_validate(request_options),
+            )
+            if timer is not None:
+                timer.lap("deserialize")
+            return result
+        finally:
+            if timer is not None:
+                timer.finish()
 
     async def stream_request(
         self,
@@ -601,6 +1425,7 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        await self._prepare_auth(auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
@@ -615,6 +1440,8 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = await context.__aenter__()
+        req_cfg = self._nonblocking_body(req_cfg)
+        response, context = await self._open_stream(
+            req_cfg=req_cfg, request_options=request_options, service_name=service_name
+        )
         return AsyncStreamResponse(response, context, cast_to)
@@ -0,0 +1,225 @@
+import asyncio
+import inspect
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+"""
+Bounded-concurrency execution of many API calls.
+
+A batch is an iterable of calls, each either a zero-argument callable
+returning an awaitable (preferred, the request is only created when a worker
+picks it up) or an awaitable. A fixed number of workers pull calls in order,
+so thousands of calls never become thousands of concurrent tasks, and an
+optional token bucket caps the rate at which calls are started.
+
+```py
+ids = [...]
+links = await client.batch([lambda i=i: client.api_link.get(id=i) for i in ids])
+```
+"""
+
+T = TypeVar("T")
+
+BatchCall = Union[Callable[[], Awaitable[T]], Awaitable[T]]
+
+
+class RateLimiter:
+    """
+    Token bucket starting at most `rate` operations per second on average,
+    with bursts of up to `burst` operations.
+
+    Thread safe, waiters are served in arrival order. Share an instance to
+    apply one cap to several batches.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Args:
+            rate: Sustained operations per second
+            burst: Operations that may start back to back after an idle period
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returning the seconds to wait until it is valid"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Blocks until the next operation may start"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """`RateLimiter` whose `acquire` waits without blocking the event loop"""
+
+    async def acquire(self) -> None:  # type: ignore[override]
+        """Waits until the next operation may start"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class BatchResult(Generic[T]):
+    """Outcome of one call of a batch"""
+
+    __slots__ = ("index", "value", "error")
+
+    def __init__(
+        self,
+        index: int,
+        value: Optional[T] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Args:
+            index: Position of the call in the batch
+            value: Result of the call when it succeeded
+            error: Exception raised by the call when it failed
+        """
+        self.index = index
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded"""
+        return self.error is None
+
+    def result(self) -> T:
+        """Returns the value of the call, raising its exception if it failed"""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"value={self.value!r}"
+        return f"BatchResult(index={self.index}, {outcome})"
+
+
+def _limiter(
+    rate_limit: Union[float, AsyncRateLimiter, None],
+) -> Optional[AsyncRateLimiter]:
+    if rate_limit is None or isinstance(rate_limit, AsyncRateLimiter):
+        return rate_limit
+    return AsyncRateLimiter(rate_limit)
+
+
+async def iter_batch(
+    calls: Iterable[BatchCall[T]],
+    *,
+    concurrency: int = 10,
+    rate_limit: Union[float, AsyncRateLimiter, None] = None,
+    fail_fast: bool = True,
+) -> AsyncIterator[BatchResult[T]]:
+    """
+    Runs calls with bounded concurrency, yielding results as they complete.
+
+    Args:
+        calls: Calls to run, consumed lazily
+        concurrency: Maximum number of calls in flight
+        rate_limit: Maximum calls started per second, or a shared limiter
+        fail_fast: Raise the first error and cancel the remaining calls,
+            otherwise errors are yielded as failed `BatchResult`s
+
+    Yields:
+        A `BatchResult` per call in completion order
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    limiter = _limiter(rate_limit)
+    pending: Iterator[Tuple[int, BatchCall[T]]] = iter(enumerate(calls))
+    finished: "asyncio.Queue[Optional[BatchResult[T]]]" = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for index, call in pending:
+                if limiter is not None:
+                    await limiter.acquire()
+                try:
+                    awaitable = call() if not inspect.isawaitable(call) else call
+                    value = await awaitable  # type: ignore[misc]
+                except Exception as e:
+                    finished.put_nowait(BatchResult(index, error=e))
+                else:
+                    finished.put_nowait(BatchResult(index, value=value))
+        finally:
+            finished.put_nowait(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result = await finished.get()
+            if result is None:
+                running -= 1
+                continue
+            if fail_fast and result.error is not None:
+                raise result.error
+            yield result
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if isinstance(calls, (list, tuple)):
+            # close coroutines that were created up front but never started
+            for _, call in pending:
+                if inspect.iscoroutine(call):
+                    call.close()
+
+
+async def run_batch(
+    calls: Iterable[BatchCall[T]],
+    *,
+    concurrency: int = 10,
+    rate_limit: Union[float, AsyncRateLimiter, None] = None,
+    fail_fast: bool = True,
+) -> List[Any]:
+    """
+    Runs calls with bounded concurrency and returns their results in order.
+
+    Args:
+        calls: Calls to run
+        concurrency: Maximum number of calls in flight
+        rate_limit: Maximum calls started per second, or a shared limiter
+        fail_fast: Raise the first error and cancel the remaining calls,
+            otherwise the exception of a failed call takes its place in the
+            returned list, like `asyncio.gather(..., return_exceptions=True)`
+
+    Returns:
+        Results of the calls in the order of `calls`
+    """
+    outcomes: List[BatchResult[T]] = []
+    async for result in iter_batch(
+        calls, concurrency=concurrency, rate_limit=rate_limit, fail_fast=fail_fast
+    ):
+        outcomes.append(result)
+    outcomes.sort(key=lambda r: r.index)
+    return [r.error if r.error is not None else r.value for r in outcomes]
@@ -1,5 +1,18 @@
+import asyncio
+import io
+import os
+import queue
+import tarfile
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Union
+
+import httpx
 from httpx._models import Headers
 
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""Called with the number of bytes received so far and the total, if known"""
+
+_CHUNK_SIZE = 64 * 1024
+
 
 class BinaryResponse:
     """
@@ -21,3 +34,339 @@ class BinaryResponse:
         """
         self.content = content
         self.headers = headers
+
+
+def _total_bytes(response: httpx.Response) -> Optional[int]:
+    """Size of the body on the wire, as reported by `Content-Length`"""
+    length = response.headers.get("content-length")
+    return int(length) if length is not None and length.isdigit() else None
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks"""
+
+    def __init__(self, next_chunk: Callable[[], Optional[bytes]]) -> None:
+        self._next_chunk = next_chunk
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+def _iterator_reader(chunks: Iterator[bytes]) -> io.BufferedReader:
+    return io.BufferedReader(_ChunkReader(lambda: next(chunks, None)), _CHUNK_SIZE)
+
+
+def _queue_reader(chunks: "queue.Queue[Union[bytes, BaseException, None]]") -> Any:
+    def next_chunk() -> Optional[bytes]:
+        chunk = chunks.get()
+        if isinstance(chunk, BaseException):
+            raise chunk
+        return chunk
+
+    return io.BufferedReader(_ChunkReader(next_chunk), _CHUNK_SIZE)
+
+
+def _extract_stream(fileobj: Any, directory: str) -> List[str]:
+    """
+    Extracts a (compressed) tar stream member by member as it is read.
+
+    Uses the `data` extraction filter where available (Python 3.8.17+,
+    3.9.17+, 3.10.12+, 3.11.4+, 3.12), rejecting absolute paths, members
+    escaping the directory and special files. Older versions apply the
+    equivalent path checks here.
+    """
+    os.makedirs(directory, exist_ok=True)
+    root = os.path.realpath(directory)
+    names: List[str] = []
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+        for member in tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extract(member, root, filter="data")
+            else:
+                target = os.path.realpath(os.path.join(root, member.name))
+                if os.path.commonpath([root, target]) != root:
+                    raise tarfile.TarError(f"unsafe path in archive: {member.name}")
+                if member.issym() or member.islnk() or member.isdev():
+                    raise tarfile.TarError(f"unsafe member in archive: {member.name}")
+                tar.extract(member, root)
+            names.append(member.name)
+    return names
+
+
+class StreamingBinaryResponse(BinaryResponse):
+    """
+    Binary response whose body is read from the network as it is consumed.
+
+    Returned instead of `BinaryResponse` when a request is made with
+    `request_options={"stream": True}`, so large downloads such as generated
+    SDK archives never have to be held in memory. The connection is released
+    once the body is fully consumed or `close` is called.
+
+    Examples:
+    ```py
+    with client.sdk.generate(..., request_options={"stream": True}) as archive:
+        archive.extract_to("./sdk")
+    ```
+    """
+
+    def __init__(self, *, response: httpx.Response, stream_context: Any) -> None:
+        """
+        Args:
+            response: Streaming HTTPX response with an unread body
+            stream_context: Context manager the response was opened with
+        """
+        self.response = response
+        self.headers = response.headers
+        self._context = stream_context
+        self._content: Optional[bytes] = None
+        self._closed = False
+
+    @property
+    def total_bytes(self) -> Optional[int]:
+        """Size of the body on the wire, None if the server did not send it"""
+        return _total_bytes(self.response)
+
+    @property
+    def content(self) -> bytes:  # type: ignore[override]
+        """The whole body, read into memory on first access"""
+        if self._content is None:
+            self._content = b"".join(self.iter_bytes())
+        return self._content
+
+    def iter_bytes(
+        self,
+        chunk_size: int = _CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[bytes]:
+        """
+        Yields the decoded body in chunks.
+
+        Args:
+            chunk_size: Size of the yielded chunks
+            progress: Called after every chunk with bytes received and total
+        """
+        total = self.total_bytes
+        try:
+            for chunk in self.response.iter_bytes(chunk_size):
+                if progress is not None:
+                    progress(self.response.num_bytes_downloaded, total)
+                yield chunk
+        finally:
+            self.close()
+
+    def write_to(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        chunk_size: int = _CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """
+        Writes the body to a file with constant memory use.
+
+        The file is written next to `path` and moved into place once
+        complete, so readers never see a partial download.
+
+        Returns:
+            Number of bytes written
+        """
+        tmp_path = f"{os.fspath(path)}.part"
+        written = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in self.iter_bytes(chunk_size, progress):
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return written
+
+    def extract_to(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[str]:
+        """
+        Extracts a tar archive (optionally gzip, bz2 or xz compressed) into a
+        directory while it is being downloaded.
+
+        Returns:
+            Names of the extracted members
+        """
+        reader = _iterator_reader(iter(self.iter_bytes(progress=progress)))
+        try:
+            return _extract_stream(reader, os.fspath(directory))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Releases the connection, discarding any unread body"""
+        if not self._closed:
+            self._closed = True
+            self._context.__exit__(None, None, None)
+
+    def __enter__(self) -> "StreamingBinaryResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncStreamingBinaryResponse(BinaryResponse):
+    """
+    Asynchronous version of `StreamingBinaryResponse`.
+
+    File writes and archive extraction run in the default executor so the
+    event loop is never blocked by disk I/O. `content` is only available
+    after `await aread()`.
+    """
+
+    def __init__(self, *, response: httpx.Response, stream_context: Any) -> None:
+        """
+        Args:
+            response: Streaming HTTPX response with an unread body
+            stream_context: Async context manager the response was opened with
+        """
+        self.response = response
+        self.headers = response.headers
+        self._context = stream_context
+        self._content: Optional[bytes] = None
+        self._closed = False
+
+    @property
+    def total_bytes(self) -> Optional[int]:
+        """Size of the body on the wire, None if the server did not send it"""
+        return _total_bytes(self.response)
+
+    @property
+    def content(self) -> bytes:  # type: ignore[override]
+        """The whole body, see `aread`"""
+        if self._content is None:
+            raise RuntimeError("call `await response.aread()` to read the body")
+        return self._content
+
+    async def aread(self) -> bytes:
+        """Reads the whole body into memory"""
+        if self._content is None:
+            self._content = b"".join([chunk async for chunk in self.aiter_bytes()])
+        return self._content
+
+    async def aiter_bytes(
+        self,
+        chunk_size: int = _CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the decoded body in chunks.
+
+        Args:
+            chunk_size: Size of the yielded chunks
+            progress: Called after every chunk with bytes received and total
+        """
+        total = self.total_bytes
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size):
+                if progress is not None:
+                    progress(self.response.num_bytes_downloaded, total)
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def write_to(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        chunk_size: int = _CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """
+        Writes the body to a file with constant memory use.
+
+        Returns:
+            Number of bytes written
+        """
+        loop = asyncio.get_running_loop()
+        tmp_path = f"{os.fspath(path)}.part"
+        written = 0
+        f = await loop.run_in_executor(None, open, tmp_path, "wb")
+        try:
+            async for chunk in self.aiter_bytes(chunk_size, progress):
+                await loop.run_in_executor(None, f.write, chunk)
+                written += len(chunk)
+            await loop.run_in_executor(None, f.close)
+            await loop.run_in_executor(None, os.replace, tmp_path, path)
+        except BaseException:
+            f.close()
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return written
+
+    async def extract_to(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[str]:
+        """
+        Extracts a tar archive into a directory while it is being downloaded.
+
+        Chunks are handed to an extraction thread through a bounded queue.
+
+        Returns:
+            Names of the extracted members
+        """
+        loop = asyncio.get_running_loop()
+        chunks: "queue.Queue[Union[bytes, BaseException, None]]" = queue.Queue(16)
+        extraction = loop.run_in_executor(
+            None, _extract_stream, _queue_reader(chunks), os.fspath(directory)
+        )
+
+        async def put(item: Union[bytes, BaseException, None]) -> None:
+            while not extraction.done():
+                try:
+                    chunks.put_nowait(item)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(0.001)
+
+        try:
+            async for chunk in self.aiter_bytes(progress=progress):
+                await put(chunk)
+                if extraction.done():
+                    break
+            await put(None)
+        except BaseException as e:
+            await put(e)
+            raise
+        finally:
+            await self.aclose()
+        return await extraction
+
+    async def aclose(self) -> None:
+        """Releases the connection, discarding any unread body"""
+        if not self._closed:
+            self._closed = True
+            await self._context.__aexit__(None, None, None)
+
+    async def __aenter__(self) -> "AsyncStreamingBinaryResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,480 @@
+import abc
+import collections
+import hashlib
+import math
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+from .coalesce import coalescing_key
+from .request import RequestConfig
+
+"""
+Response caching for read endpoints.
+
+Successful GET responses of configured operations are stored as raw bytes and
+replayed through the normal `process_response` path, so every caller gets
+freshly deserialized objects. Cache keys are hashes of the full request,
+including the auth headers, so responses are never shared between
+credentials. A successful mutation (POST, PUT, PATCH, DELETE) of a path
+invalidates cached reads of the path itself and of its parent collection.
+
+Responses carrying validators (`ETag`, `Last-Modified`) are kept after they
+expire and revalidated with a conditional request, a `304 Not Modified`
+answer is served from the cached body. Operations with a TTL of 0 are always
+revalidated, which suits large payloads polled for changes.
+"""
+
+# a TTL in seconds, or a function of the operation's path parameters
+TTL = Union[float, Callable[[Dict[str, str]], float]]
+
+_SEMVER = re.compile(
+    r"v?\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?", re.ASCII
+)
+
+
+def versioned_ttl(
+    param: str, *, latest: float = 30
+) -> Callable[[Dict[str, str]], float]:
+    """
+    TTL caching concrete semantic versions forever.
+
+    Published versions never change, while aliases such as `latest` resolve
+    to a new version over time and are cached for `latest` seconds.
+
+    Args:
+        param: Name of the path parameter holding the version
+        latest: Seconds to cache versions which are not a semantic version
+    """
+
+    def ttl(params: Dict[str, str]) -> float:
+        return math.inf if _SEMVER.fullmatch(params.get(param, "")) else latest
+
+    return ttl
+
+
+# reads which are called constantly but change rarely
+DEFAULT_TTLS: Dict[str, TTL] = {
+    "GET /organization": 60,
+    "GET /role": 60,
+    "GET /api_link": 60,
+    "GET /doc_project/{doc_name}/version": 60,
+    "GET /doc_project/{doc_name}/theme": 60,
+    # published spec versions are immutable
+    "GET /api/{api_name}/spec/{api_version}/openapi": versioned_ttl("api_version"),
+    # large payloads, always revalidated with a conditional request
+    "GET /doc_project/{doc_name}/version/{doc_version}/guide/{guide_id}/content": 0,
+}
+
+# headers describing the encoding of the received bytes, the cache stores
+# decoded content
+_TRANSFER_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class CachedResponse:
+    """
+    Raw body and metadata of a cached response.
+
+    Attributes:
+        status_code: HTTP status of the response
+        headers: Response headers, without transfer encoding headers
+        content: Decoded response body
+        stored_at: Unix time the response was received
+        expires_at: Unix time after which the entry is stale
+    """
+
+    __slots__ = ("status_code", "headers", "content", "stored_at", "expires_at")
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        content: bytes,
+        stored_at: float,
+        expires_at: float,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, ttl: float) -> "CachedResponse":
+        """Captures a read response"""
+        now = time.time()
+        return cls(
+            status_code=response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.multi_items()
+                if k.lower() not in _TRANSFER_HEADERS
+            ],
+            content=response.content,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    @property
+    def size(self) -> int:
+        """Approximate memory used by the entry in bytes"""
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def _header(self, name: str) -> Optional[str]:
+        for k, v in self.headers:
+            if k.lower() == name:
+                return v
+        return None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._header("last-modified")
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers revalidating the entry"""
+        headers: Dict[str, str] = {}
+        etag = self.etag
+        if etag is not None:
+            headers["if-none-match"] = etag
+        last_modified = self.last_modified
+        if last_modified is not None:
+            headers["if-modified-since"] = last_modified
+        return headers
+
+    def revalidated(self, not_modified: httpx.Response, ttl: float) -> "CachedResponse":
+        """Copy of the entry refreshed by a `304 Not Modified` response"""
+        updated = {
+            k.lower(): v
+            for k, v in not_modified.headers.multi_items()
+            if k.lower() not in _TRANSFER_HEADERS
+        }
+        headers = [(k, v) for k, v in self.headers if k.lower() not in updated]
+        headers.extend(updated.items())
+        now = time.time()
+        return CachedResponse(
+            status_code=self.status_code,
+            headers=headers,
+            content=self.content,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    def to_response(self, req_cfg: RequestConfig) -> httpx.Response:
+        """Builds a new HTTPX response with the cached body"""
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(req_cfg["method"], req_cfg["url"]),
+        )
+
+
+class CacheStorage(abc.ABC):
+    """
+    Abstract base class for the stores backing a `ResponseCache`.
+
+    Implementations must be safe to use from multiple threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Returns the entry stored under the key, if any"""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Stores an entry, possibly evicting others"""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes an entry if present"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all entries"""
+
+    def stats(self) -> Dict[str, Any]:
+        """Storage specific counters"""
+        return {}
+
+    def generation(self, path: str) -> Optional[str]:
+        """
+        Token of the latest invalidation of a path recorded in the storage,
+        None if there was none or the storage is private to this process.
+        """
+        return None
+
+    def invalidate(self, path: str) -> None:
+        """
+        Records an invalidation of a path for the other processes sharing the
+        storage, a no-op for storages private to this process.
+        """
+
+
+class MemoryCacheStorage(CacheStorage):
+    """
+    In-process LRU store bounded by number of entries and total bytes.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, max_bytes: int = 64 << 20) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of the cached responses
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "collections.OrderedDict[str, CachedResponse]" = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+            }
+
+
+def _compile_operation(operation: str) -> Tuple[str, "re.Pattern[str]"]:
+    method, _, template = operation.strip().partition(" ")
+    parts = re.split(r"(\{[^}/]+\})", template.strip())
+    pattern = "".join(
+        f"(?P<{part[1:-1]}>[^/]+)" if part.startswith("{") else re.escape(part)
+        for part in parts
+    )
+    return method.upper(), re.compile(pattern)
+
+
+class CacheLookup(NamedTuple):
+    """
+    Result of looking up a request in a `ResponseCache`.
+
+    Attributes:
+        entry: Cached response, possibly expired, None on a miss
+        serve: Whether the entry may be returned without a request
+        refresh: Whether the caller must revalidate the served stale entry
+            in the background, see `ResponseCache.finish_refresh`
+    """
+
+    entry: Optional[CachedResponse]
+    serve: bool
+    refresh: bool
+
+
+def _parent(path: str) -> str:
+    return path.rstrip("/").rsplit("/", 1)[0] or "/"
+
+
+class ResponseCache:
+    """
+    Caches successful responses of read operations for a configurable TTL.
+
+    Operations are given as `"<METHOD> <path template>"` exactly as written
+    in the API reference, eg `"GET /doc_project/{doc_name}/theme"`.
+
+    Examples:
+    ```py
+    client = Client(cache=ResponseCache(ttls={"GET /organization": 300}))
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        storage: Optional[CacheStorage] = None,
+        ttls: Optional[Dict[str, TTL]] = None,
+        default_ttl: Optional[float] = None,
+        stale_while_revalidate: float = 0,
+    ) -> None:
+        """
+        Args:
+            storage: Where entries are kept, an in-memory LRU if omitted
+            ttls: Seconds to cache each operation, `DEFAULT_TTLS` if omitted.
+                A TTL may be a function of the path parameters, see `versioned_ttl`
+            default_ttl: Seconds to cache GETs of operations not in `ttls`,
+                None to only cache the listed operations
+            stale_while_revalidate: Seconds after expiry during which the stale
+                entry is returned immediately while it is refreshed in the
+                background
+        """
+        self.storage = storage if storage is not None else MemoryCacheStorage()
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._operations = [
+            (*_compile_operation(operation), ttl)
+            for operation, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        ]
+        self._lock = threading.Lock()
+        # bumped by mutations in this process, part of the key of reads of the
+        # same path next to the storage's generation shared across processes
+        self._generations: Dict[str, int] = {}
+        self._refreshing: Set[str] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+
+    def ttl_for(self, method: str, path: str) -> Optional[float]:
+        """Seconds responses of the operation are cached, None if not cached"""
+        method = method.upper()
+        for op_method, pattern, ttl in self._operations:
+            match = pattern.fullmatch(path) if op_method == method else None
+            if match is not None:
+                return ttl(match.groupdict()) if callable(ttl) else ttl
+        return self.default_ttl if method == "GET" else None
+
+    def key_for(self, req_cfg: RequestConfig, path: str) -> Optional[str]:
+        """Hash identifying a request and its credentials, None if not cacheable"""
+        identity = coalescing_key(req_cfg)
+        if identity is None:
+            return None
+        path = path.rstrip("/") or "/"
+        generation = (self._generations.get(path, 0), self.storage.generation(path))
+        return hashlib.sha256(repr((identity, generation)).encode()).hexdigest()
+
+    def lookup(self, key: str) -> CacheLookup:
+        """
+        Finds the entry of a request and decides whether it can be served.
+
+        Fresh entries are served. Stale entries within the
+        `stale_while_revalidate` window are served as well, and exactly one
+        caller at a time is asked to refresh them. Other expired entries are
+        returned for a conditional request.
+        """
+        entry = self.storage.get(key)
+        now = time.time()
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return CacheLookup(None, serve=False, refresh=False)
+            if entry.is_fresh(now):
+                self.hits += 1
+                return CacheLookup(entry, serve=True, refresh=False)
+            if now < entry.expires_at + self.stale_while_revalidate:
+                self.stale_hits += 1
+                refresh = key not in self._refreshing
+                self._refreshing.add(key)
+                return CacheLookup(entry, serve=True, refresh=refresh)
+            self.misses += 1
+            return CacheLookup(entry, serve=False, refresh=False)
+
+    def finish_refresh(self, key: str) -> None:
+        """Marks the background refresh of a stale entry as done"""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def store(self, key: str, response: httpx.Response, ttl: float) -> None:
+        """Caches a successful response unless the server forbids it"""
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("cache-control", ""):
+            return
+        entry = CachedResponse.from_response(response, ttl)
+        if ttl <= 0 and not entry.validators():
+            return
+        self.storage.set(key, entry)
+        with self._lock:
+            self.stores += 1
+
+    def revalidated(
+        self, key: str, entry: CachedResponse, response: httpx.Response, ttl: float
+    ) -> CachedResponse:
+        """Refreshes an entry after a `304 Not Modified` response"""
+        entry = entry.revalidated(response, ttl)
+        self.storage.set(key, entry)
+        with self._lock:
+            self.revalidations += 1
+            self.bytes_saved += len(entry.content)
+        return entry
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drops cached reads of a path and of its parent collection, in every
+        process sharing the storage when it records invalidations
+        """
+        path = path.rstrip("/") or "/"
+        paths = {path, _parent(path)}
+        with self._lock:
+            for p in paths:
+                self._generations[p] = self._generations.get(p, 0) + 1
+        for p in paths:
+            self.storage.invalidate(p)
+
+    def clear(self) -> None:
+        """Removes every cached response"""
+        self.storage.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and store counters merged with the storage's counters"""
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "revalidations": self.revalidations,
+                "bytes_saved": self.bytes_saved,
+            }
+        stats.update(self.storage.stats())
+        return stats
@@ -0,0 +1,315 @@
+import collections
+import threading
+import time
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+
+"""
+Circuit breakers failing requests fast while a backend service is degraded.
+
+Each service (base URL) of a client has its own circuit:
+
+- closed: requests flow normally while the outcomes of the most recent calls
+  are tracked, the circuit opens once their error or slow call rate exceeds
+  the configured threshold
+- open: requests are rejected with `CircuitOpenError` without touching the
+  network until `open_duration` has passed
+- half-open: a single probe at a time is let through (the next request, or a
+  GET of `probe_path` such as `/_ping`), successful probes close the circuit
+  and a failed probe opens it again
+"""
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the service's circuit is open.
+
+    Attributes:
+        service_name: Service whose circuit rejected the request
+        retry_in: Seconds until the circuit lets a probe request through
+    """
+
+    def __init__(self, *, service_name: str, retry_in: float) -> None:
+        super().__init__(service_name, retry_in)
+        self.service_name = service_name
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return (
+            f"circuit open for service {self.service_name!r}, "
+            f"retry in {self.retry_in:.1f}s"
+        )
+
+
+class _Circuit:
+    """State of the circuit of a single service, guarded by its own lock"""
+
+    def __init__(self, breaker: "CircuitBreaker", service_name: str) -> None:
+        self.breaker = breaker
+        self.service_name = service_name
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        # (failed, slow) outcomes of the most recent calls while closed
+        self.window: Deque[Tuple[bool, bool]] = collections.deque(
+            maxlen=breaker.window_size
+        )
+        self.opened_at = 0.0
+        self.probing = False
+        self.probe_successes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def acquire(self) -> "CircuitPermit":
+        breaker = self.breaker
+        with self.lock:
+            if self.state == OPEN:
+                retry_in = self.opened_at + breaker.open_duration - time.monotonic()
+                if retry_in > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        service_name=self.service_name, retry_in=retry_in
+                    )
+                self.state = HALF_OPEN
+                self.probe_successes = 0
+
+            if self.state == HALF_OPEN:
+                if self.probing:
+                    self.rejected += 1
+                    raise CircuitOpenError(service_name=self.service_name, retry_in=0)
+                self.probing = True
+                return CircuitPermit(self, probe=True)
+
+            return CircuitPermit(self, probe=False)
+
+    def record(self, permit: "CircuitPermit", *, failed: bool, slow: bool) -> None:
+        breaker = self.breaker
+        with self.lock:
+            if permit.probe:
+                self.probing = False
+                if failed or slow:
+                    self._open()
+                else:
+                    self.probe_successes += 1
+                    if self.probe_successes >= breaker.success_threshold:
+                        self.state = CLOSED
+                        self.window.clear()
+                return
+
+            if self.state != CLOSED:
+                # a call started before the circuit opened
+                return
+            self.window.append((failed, slow))
+            calls = len(self.window)
+            if calls < breaker.minimum_calls:
+                return
+            failures = sum(1 for f, _ in self.window if f)
+            slow_calls = sum(1 for _, s in self.window if s)
+            if (
+                failures / calls >= breaker.failure_rate_threshold
+                or slow_calls / calls >= breaker.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def release(self, permit: "CircuitPermit") -> None:
+        if permit.probe:
+            with self.lock:
+                self.probing = False
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.window.clear()
+        self.times_opened += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            calls = len(self.window)
+            state = self.state
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(
+                    0.0,
+                    self.opened_at + self.breaker.open_duration - time.monotonic(),
+                )
+                if retry_in == 0:
+                    # the next request will be let through as a probe
+                    state = HALF_OPEN
+            return {
+                "state": state,
+                "calls": calls,
+                "failure_rate": (
+                    sum(1 for f, _ in self.window if f) / calls if calls else 0.0
+                ),
+                "slow_call_rate": (
+                    sum(1 for _, s in self.window if s) / calls if calls else 0.0
+                ),
+                "retry_in": retry_in,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitPermit:
+    """
+    Permission to send one request through a circuit.
+
+    Exactly one of `record_response`, `record_error` or `release` must be
+    called once the attempt is over.
+
+    Attributes:
+        probe: Whether the request is the probe of a half-open circuit
+    """
+
+    def __init__(self, circuit: _Circuit, *, probe: bool) -> None:
+        self._circuit = circuit
+        self.probe = probe
+        self.started = time.monotonic()
+
+    def _slow(self) -> bool:
+        threshold = self._circuit.breaker.slow_call_threshold
+        return threshold is not None and time.monotonic() - self.started > threshold
+
+    def record_response(
+        self, response: httpx.Response, *, require_success: bool = False
+    ) -> bool:
+        """
+        Records the outcome of a response.
+
+        Args:
+            response: Response received for the request
+            require_success: Count any non-2xx status as a failure, used for
+                dedicated probe requests
+
+        Returns:
+            Whether the response counted as a failure
+        """
+        failed = self._circuit.breaker.is_failure(response) or (
+            require_success and not response.is_success
+        )
+        self._circuit.record(self, failed=failed, slow=self._slow())
+        return failed
+
+    def record_error(self, error: Exception) -> None:
+        """Records a transport error"""
+        self._circuit.record(self, failed=True, slow=self._slow())
+
+    def release(self) -> None:
+        """Gives the permit back without recording an outcome"""
+        self._circuit.release(self)
+
+
+class _UntrackedPermit(CircuitPermit):
+    """Permit used when a client has no circuit breaker"""
+
+    def __init__(self) -> None:
+        self.probe = False
+
+    def record_response(
+        self, response: httpx.Response, *, require_success: bool = False
+    ) -> bool:
+        return False
+
+    def record_error(self, error: Exception) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+
+UNTRACKED = _UntrackedPermit()
+
+
+class CircuitBreaker:
+    """
+    Per-service circuit breaker settings and state, shared by a client.
+
+    Examples:
+    ```py
+    client = Client(
+        circuit_breaker=CircuitBreaker(slow_call_threshold=5, probe_path="/_ping")
+    )
+    client.circuit_breaker.snapshot()
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        success_threshold: int = 1,
+        probe_path: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            failure_rate_threshold: Share of failed recent calls opening the circuit
+            slow_call_threshold: Seconds after which a call counts as slow,
+                None to not trip on latency
+            slow_call_rate_threshold: Share of slow recent calls opening the circuit
+            window_size: Number of recent calls the rates are computed over
+            minimum_calls: Calls required in the window before the circuit can open
+            open_duration: Seconds the circuit stays open before probing
+            success_threshold: Successful probes required to close the circuit
+            probe_path: Path requested with GET to probe a half-open circuit
+                (eg `/_ping`), when None the next real request is the probe
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.open_duration = open_duration
+        self.success_threshold = max(1, success_threshold)
+        self.probe_path = probe_path
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def is_failure(self, response: httpx.Response) -> bool:
+        """Whether a response indicates a degraded backend"""
+        return response.status_code >= 500 or response.status_code == 408
+
+    def _circuit(self, service_name: str) -> _Circuit:
+        circuit = self._circuits.get(service_name)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(
+                    service_name, _Circuit(self, service_name)
+                )
+        return circuit
+
+    def acquire(self, service_name: str) -> CircuitPermit:
+        """
+        Asks to send a request to a service.
+
+        Raises:
+            CircuitOpenError: If the service's circuit is open, or half-open
+                with a probe in flight
+        """
+        return self._circuit(service_name).acquire()
+
+    def state(self, service_name: str) -> str:
+        """Current state of a service's circuit: `closed`, `open` or `half_open`"""
+        return self._circuit(service_name).snapshot()["state"]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """State and recent call statistics of every circuit, keyed by service"""
+        with self._lock:
+            circuits = list(self._circuits.items())
+        return {name: circuit.snapshot() for name, circuit in circuits}
+
+    def reset(self, service_name: Optional[str] = None) -> None:
+        """Closes one circuit, or all circuits when no service is given"""
+        with self._lock:
+            if service_name is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(service_name, None)
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import httpx
+
+from .request import RequestConfig
+
+"""
+Single-flight coalescing of identical concurrent read requests.
+
+While a GET is in flight, identical GETs (same URL, query, headers and
+cookies, and therefore the same auth identity) wait for its response instead
+of sending their own. Callers share the raw `httpx.Response`, every caller
+deserializes the body itself so results are never shared objects.
+"""
+
+_COALESCABLE_METHODS = frozenset({"GET", "HEAD"})
+_BODY_KEYS = ("content", "data", "files", "json")
+
+
+def coalescing_key(req_cfg: RequestConfig) -> Optional[Hashable]:
+    """
+    Identifies identical requests, None when a request must not be coalesced.
+    """
+    method = req_cfg["method"].upper()
+    if method not in _COALESCABLE_METHODS or any(k in req_cfg for k in _BODY_KEYS):
+        return None
+
+    url = httpx.URL(req_cfg["url"], params=req_cfg.get("params") or None)
+    headers = tuple(
+        sorted((k.lower(), v) for k, v in (req_cfg.get("headers") or {}).items())
+    )
+    cookies = tuple(sorted((req_cfg.get("cookies") or {}).items()))
+    return (method, str(url), headers, cookies, repr(req_cfg.get("auth")))
+
+
+class CoalescingStats:
+    """
+    Thread-safe counters of a coalescer.
+
+    Attributes:
+        requests: Coalescable requests made by callers
+        sent: Requests actually sent
+        coalesced: Requests served by another caller's in-flight request
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.sent = 0
+        self.coalesced = 0
+
+    def _record(self, *, leader: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if leader:
+                self.sent += 1
+            else:
+                self.coalesced += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Returns a consistent copy of the counters"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+            }
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Shares in-flight responses between threads sending identical requests"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.stats = CoalescingStats()
+
+    def run(self, key: Hashable, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """
+        Sends the request via `send`, or waits for the identical in-flight one.
+
+        Errors raised by the sending caller are raised in every waiting caller.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        self.stats._record(leader=leader)
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response  # type: ignore[return-value]
+
+        try:
+            flight.response = send()
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncRequestCoalescer:
+    """
+    Shares in-flight responses between coroutines sending identical requests.
+
+    The request runs in its own task, so a cancelled caller does not cancel
+    it for the callers still waiting.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, "asyncio.Future[httpx.Response]"] = {}
+        self.stats = CoalescingStats()
+
+    async def run(
+        self, key: Hashable, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Sends the request via `send`, or waits for the identical in-flight one.
+        """
+        task = self._flights.get(key)
+        leader = task is None
+        if task is None:
+            task = asyncio.ensure_future(send())
+            self._flights[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        self.stats._record(leader=leader)
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # mark the error retrieved in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,208 @@
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, cast
+
+import httpx
+from typing_extensions import Protocol
+
+from .request import RequestConfig
+from .retry import body_rewinder, is_replayable
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None  # type: ignore[assignment]
+
+"""
+Opt-in compression of request bodies.
+
+Bodies are encoded exactly as HTTPX would send them (JSON, form data,
+multipart or raw content) and compressed while they are being sent, so a
+large file is never held in memory, compressed or not. Compressed bodies are
+sent with `Content-Encoding` and chunked transfer encoding.
+
+Servers that do not accept compressed bodies answer `415 Unsupported Media
+Type` (RFC 7694). The client then resends the request uncompressed and stops
+compressing requests to that origin.
+"""
+
+_BODY_KEYS = ("content", "data", "files", "json")
+
+
+class _Compressor(Protocol):
+    """Incremental compressor of `zlib` and `zstandard`"""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+def zstd_available() -> bool:
+    """Whether the optional `zstandard` package is installed"""
+    return zstandard is not None
+
+
+class RequestCompression:
+    """
+    Compresses request bodies above a size threshold.
+
+    Examples:
+    ```py
+    client = Client(compression=RequestCompression(min_size=256 * 1024))
+    client.lint.run(openapi=open("openapi.yaml", "rb"))
+    ```
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[str] = None,
+        *,
+        min_size: int = 64 * 1024,
+        level: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            encoding: `gzip` or `zstd`, defaults to `zstd` when the optional
+                `zstandard` package is installed and `gzip` otherwise
+            min_size: Bodies smaller than this many bytes are sent as is,
+                bodies of unknown length are always compressed
+            level: Compression level, defaults to 6 for gzip and 3 for zstd
+        """
+        if encoding is None:
+            encoding = "zstd" if zstd_available() else "gzip"
+        if encoding not in ("gzip", "zstd"):
+            raise ValueError(f"unsupported request encoding: {encoding}")
+        if encoding == "zstd" and not zstd_available():
+            raise ImportError(
+                "zstd request compression requires the `zstandard` package, "
+                "install local_api_21_py[zstd]"
+            )
+        self.encoding = encoding
+        self.min_size = min_size
+        self.level = level
+        self._lock = threading.Lock()
+        self._rejected: Set[str] = set()
+
+    def compressor(self) -> _Compressor:
+        """Creates a compressor for one body"""
+        if self.encoding == "zstd":
+            level = 3 if self.level is None else self.level
+            return cast(
+                _Compressor, zstandard.ZstdCompressor(level=level).compressobj()
+            )
+        level = 6 if self.level is None else self.level
+        # wbits of 16 + 15 writes a gzip header and trailer
+        return cast(_Compressor, zlib.compressobj(level, zlib.DEFLATED, 31))
+
+    def accepts(self, url: Any) -> bool:
+        """Whether the origin of `url` has not rejected compressed bodies"""
+        with self._lock:
+            return _origin(url) not in self._rejected
+
+    def reject(self, url: Any) -> None:
+        """Stops compressing bodies sent to the origin of `url`"""
+        with self._lock:
+            self._rejected.add(_origin(url))
+
+    def apply(self, req_cfg: RequestConfig) -> RequestConfig:
+        """
+        Replaces the body of a request with its compressed stream.
+
+        Returns the configuration unchanged for requests without a body,
+        bodies below `min_size`, bodies that already carry a
+        `Content-Encoding` and origins that rejected compression.
+        """
+        if not any(req_cfg.get(k) is not None for k in _BODY_KEYS):
+            return req_cfg
+        headers: Dict[str, str] = dict(req_cfg.get("headers", {}))
+        lowered = {k.lower() for k in headers}
+        if "content-encoding" in lowered or not self.accepts(req_cfg["url"]):
+            return req_cfg
+
+        encoded = httpx.Request(
+            req_cfg["method"],
+            req_cfg["url"],
+            content=req_cfg.get("content"),
+            data=req_cfg.get("data"),
+            files=req_cfg.get("files"),
+            json=req_cfg.get("json"),
+        )
+        length = encoded.headers.get("content-length")
+        if length is not None and int(length) < self.min_size:
+            return req_cfg
+
+        content = req_cfg.get("content")
+        headers = {k: v for k, v in headers.items() if k.lower() != "content-length"}
+        if "content-type" not in lowered and "content-type" in encoded.headers:
+            headers["content-type"] = encoded.headers["content-type"]
+        headers["content-encoding"] = self.encoding
+
+        cfg = {k: v for k, v in req_cfg.items() if k not in _BODY_KEYS}
+        cfg["headers"] = headers
+        cfg["content"] = CompressedStream(
+            cast(Iterable[bytes], encoded.stream),
+            compression=self,
+            rewind=body_rewinder(content),
+            replayable=is_replayable(content),
+            fallback=req_cfg,
+        )
+        return cast(RequestConfig, cfg)
+
+
+class CompressedStream:
+    """
+    Request body compressed chunk by chunk while it is iterated.
+
+    Every iteration starts over from the beginning of the body, so retries
+    resend it whenever the uncompressed body can be replayed.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[bytes],
+        *,
+        compression: RequestCompression,
+        rewind: Optional[Callable[[], None]] = None,
+        replayable: bool = True,
+        fallback: Optional[RequestConfig] = None,
+    ) -> None:
+        """
+        Args:
+            source: Uncompressed body
+            compression: Settings the body is compressed with
+            rewind: Resets a file-backed source to its start
+            replayable: Whether the source can be iterated more than once
+            fallback: Request configuration with the uncompressed body,
+                sent when the server rejects the encoding
+        """
+        self.source = source
+        self.compression = compression
+        self.replayable = replayable
+        self._fallback = fallback
+        self._rewind = rewind
+
+    def uncompressed(self) -> Optional[RequestConfig]:
+        """
+        Rewinds the body and returns the request configuration sending it
+        uncompressed, None when the body cannot be sent again.
+        """
+        if self._fallback is None or not self.replayable:
+            return None
+        if self._rewind is not None:
+            self._rewind()
+        return self._fallback
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._rewind is not None:
+            self._rewind()
+        compressor = self.compression.compressor()
+        for chunk in self.source:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+def _origin(url: Any) -> str:
+    parsed = httpx.URL(str(url))
+    return f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
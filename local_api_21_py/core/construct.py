@@ -0,0 +1,258 @@
+import datetime
+import enum
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+"""
+Builds response types from trusted data without running pydantic validation.
+
+Each target type is compiled once into a tree of small constructor callables
+that walk the decoded JSON and instantiate models with `model_construct`.
+Datetime, date and enum leaves are converted from their JSON form, so the
+result has the same types as a validated response would. Nothing else is
+checked or coerced, and values the types do not describe (eg an enum member
+added by a newer server) are kept as sent.
+
+Construction is not faster than single-pass `validate_json`, see
+`python -m local_api_21_py.bench validation`. It is for responses that must
+be accepted as sent, not a speedup.
+"""
+
+NoneType = type(None)
+_Constructor = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_PARSERS: Dict[Any, _Constructor] = {
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+
+def _is_leaf(tp: Any) -> bool:
+    return tp in _PARSERS or (isinstance(tp, type) and issubclass(tp, enum.Enum))
+
+
+def _leaf(parse: _Constructor) -> _Constructor:
+    """Converts a JSON leaf with `parse`, keeping values it rejects as sent"""
+
+    def construct_leaf(value: Any) -> Any:
+        try:
+            return parse(value)
+        except (TypeError, ValueError):
+            return value
+
+    return construct_leaf
+
+
+class _ModelConstructor:
+    """
+    Constructs a pydantic model and its nested models from a dict.
+
+    Registered before its fields are compiled so self-referencing models
+    like `GuideWithChildren.children` resolve to the same constructor.
+    """
+
+    def __init__(self, model: typing.Type[BaseModel]):
+        self.model = model
+        # (name, alias, constructor) for every field, constructor is None
+        # when the decoded value is stored unchanged
+        self.fields: List[Tuple[str, str, Optional[_Constructor]]] = []
+        self.required_aliases: typing.FrozenSet[str] = frozenset()
+
+    def matches(self, value: Dict[str, Any]) -> bool:
+        return self.required_aliases.issubset(value.keys())
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+
+        values: Dict[str, Any] = {}
+        for name, alias, construct in self.fields:
+            if alias in value:
+                field_value = value[alias]
+            elif name in value:
+                field_value = value[name]
+            else:
+                continue
+            values[name] = field_value if construct is None else construct(field_value)
+        return self.model.model_construct(**values)
+
+
+class ConstructorRegistry:
+    """
+    Thread-safe cache of compiled constructors keyed by the type they build.
+    """
+
+    def __init__(self) -> None:
+        self._constructors: Dict[Any, _Constructor] = {}
+        # constructors compiled by the lock holder but not yet published,
+        # so other threads never observe a partially compiled model
+        self._pending: Dict[Any, _Constructor] = {}
+        self._lock = threading.RLock()
+
+    def get(self, tp: Any) -> _Constructor:
+        """
+        Retrieves the constructor for a type, compiling it on first use.
+        """
+        try:
+            constructor = self._constructors.get(tp)
+        except TypeError:
+            with self._lock:
+                return self._compile_root(tp)
+
+        if constructor is not None:
+            return constructor
+
+        with self._lock:
+            constructor = self._constructors.get(tp) or self._pending.get(tp)
+            if constructor is not None:
+                return constructor
+            return self._compile_root(tp)
+
+    def _compile_root(self, tp: Any) -> _Constructor:
+        if self._pending:
+            # nested lookup while compiling another type
+            return self._compile(tp)
+
+        try:
+            constructor = self._compile(tp)
+            self._constructors.update(self._pending)
+        finally:
+            self._pending.clear()
+        return constructor
+
+    def __len__(self) -> int:
+        return len(self._constructors)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._constructors.clear()
+
+    def _compile(self, tp: Any) -> _Constructor:
+        if isinstance(tp, type) and issubclass(tp, BaseModel):
+            return self._compile_model(tp)
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        constructor: _Constructor
+        if origin in (list, tuple, set, frozenset) and args:
+            constructor = self._compile_sequence(self.get(args[0]))
+        elif origin is dict and len(args) == 2:
+            constructor = self._compile_mapping(self.get(args[1]))
+        elif origin is typing.Union:
+            constructor = self._compile_union(args)
+        elif _is_leaf(tp):
+            constructor = _leaf(_PARSERS.get(tp, tp))
+        else:
+            # primitives, Literals, Any and unresolved forward references
+            # are stored as decoded
+            constructor = _identity
+
+        self._store(tp, constructor)
+        return constructor
+
+    def _store(self, tp: Any, constructor: _Constructor) -> None:
+        try:
+            self._pending[tp] = constructor
+        except TypeError:
+            pass
+
+    def _compile_model(self, model: typing.Type[BaseModel]) -> _Constructor:
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+
+        constructor = _ModelConstructor(model)
+        self._store(model, constructor)
+
+        required = []
+        for name, field in model.model_fields.items():
+            alias = field.alias or name
+            field_constructor = self.get(field.annotation)
+            constructor.fields.append(
+                (
+                    name,
+                    alias,
+                    None if field_constructor is _identity else field_constructor,
+                )
+            )
+            if field.is_required():
+                required.append(alias)
+        constructor.required_aliases = frozenset(required)
+
+        return constructor
+
+    def _compile_sequence(self, item: _Constructor) -> _Constructor:
+        if item is _identity:
+            return _identity
+
+        def construct_sequence(value: Any) -> Any:
+            if isinstance(value, list):
+                return [item(v) for v in value]
+            return value
+
+        return construct_sequence
+
+    def _compile_mapping(self, item: _Constructor) -> _Constructor:
+        if item is _identity:
+            return _identity
+
+        def construct_mapping(value: Any) -> Any:
+            if isinstance(value, dict):
+                return {k: item(v) for k, v in value.items()}
+            return value
+
+        return construct_mapping
+
+    def _compile_union(self, args: Tuple[Any, ...]) -> _Constructor:
+        members = [self.get(a) for a in args if a is not NoneType]
+        models = [m for m in members if isinstance(m, _ModelConstructor)]
+        # strings stay strings when `str` is a member, like smart-mode validation
+        leaves = [] if str in args else [self.get(a) for a in args if _is_leaf(a)]
+        sequences = [
+            m
+            for m in members
+            if m is not _identity and m not in models and m not in leaves
+        ]
+        if not models and not sequences and not leaves:
+            return _identity
+
+        def construct_union(value: Any) -> Any:
+            if isinstance(value, dict):
+                for model in models:
+                    if model.matches(value):
+                        return model(value)
+                return value
+            if isinstance(value, list) and sequences:
+                return sequences[0](value)
+            for leaf in leaves:
+                converted = leaf(value)
+                if converted is not value:
+                    return converted
+            return value
+
+        return construct_union
+
+
+constructors = ConstructorRegistry()
+"""
+Registry of constructors used to build unvalidated responses
+"""
+
+
+def construct_encodable(*, data: Any, load_with: Any) -> Any:
+    """
+    Converts raw data into a specified type without validation.
+
+    Trusted counterpart to `from_encodable`: models (including nested and
+    recursive ones) are instantiated with `model_construct`, so field values
+    are neither coerced nor checked.
+    """
+    return constructors.get(load_with)(data)
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from typing import Any, Dict, Optional
+
+from .cache import CachedResponse, CacheStorage
+
+"""
+Persistent response cache storage shared by processes on the same host.
+
+Layout of the cache directory:
+
+    entries/<k[:2]>/<key>.json     metadata of a cached response
+    objects/<h[:2]>/<sha256>       response bodies, addressed by their hash
+    generations/<p[:2]>/<sha256>   latest invalidation of a path, by its hash
+
+Bodies are content addressed, so identical payloads (eg the same spec served
+to several tenants) are stored once. Every file is written to a temporary
+file in its final directory and moved into place with `os.replace`, which is
+atomic, so concurrent workers only ever see complete files.
+
+Mutations sent by any process sharing the directory invalidate the cached
+reads of the other processes too: every invalidation writes a random token to
+the path's generation file, which is part of the cache key of later reads.
+"""
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class DiskCacheStorage(CacheStorage):
+    """
+    Sharded directory of content-hashed files backing a `ResponseCache`.
+
+    Entries are never evicted by size, pair with TTLs so that only immutable
+    or slowly changing responses are stored, see `versioned_ttl`. Bodies no
+    longer referenced by any entry are kept until `clear` is called.
+
+    Examples:
+    ```py
+    client = Client(cache=ResponseCache(storage=DiskCacheStorage("~/.cache/sideko")))
+    ```
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Args:
+            directory: Cache directory, created if missing and shareable by
+                any number of processes
+        """
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, "entries", key[:2], f"{key}.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def _generation_path(self, path: str) -> str:
+        digest = hashlib.sha256(path.encode()).hexdigest()
+        return os.path.join(self.directory, "generations", digest[:2], digest)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                meta = json.loads(f.read())
+            content = _read(self._object_path(meta["body"]))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # a corrupt or partially removed entry is treated as a miss
+            self._count("errors")
+            self.delete(key)
+            return None
+
+        self._count("reads")
+        return CachedResponse(
+            status_code=meta["status_code"],
+            headers=[(k, v) for k, v in meta["headers"]],
+            content=content,
+            stored_at=meta["stored_at"],
+            expires_at=meta["expires_at"],
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        digest = hashlib.sha256(entry.content).hexdigest()
+        object_path = self._object_path(digest)
+        try:
+            if not os.path.exists(object_path):
+                _write_atomic(object_path, entry.content)
+            meta = {
+                "status_code": entry.status_code,
+                "headers": entry.headers,
+                "body": digest,
+                "stored_at": entry.stored_at,
+                "expires_at": entry.expires_at,
+            }
+            _write_atomic(self._entry_path(key), json.dumps(meta).encode())
+        except OSError:
+            # a read-only or full disk degrades to not caching
+            self._count("errors")
+            return
+        self._count("writes")
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._entry_path(key))
+        except OSError:
+            pass
+
+    def generation(self, path: str) -> Optional[str]:
+        try:
+            return _read(self._generation_path(path)).decode()
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError):
+            self._count("errors")
+            return None
+
+    def invalidate(self, path: str) -> None:
+        # a random token rather than a counter, so concurrent invalidations
+        # never write a generation some process already cached reads under
+        try:
+            _write_atomic(self._generation_path(path), uuid.uuid4().hex.encode())
+        except OSError:
+            self._count("errors")
+
+    def clear(self) -> None:
+        for sub in ("entries", "objects"):
+            shutil.rmtree(os.path.join(self.directory, sub), ignore_errors=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "disk_reads": self.reads,
+                "disk_writes": self.writes,
+                "disk_errors": self.errors,
+            }
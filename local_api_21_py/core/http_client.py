@@ -0,0 +1,94 @@
+from typing import Dict, Optional
+
+import httpx
+
+"""
+Builds the pooled HTTPX clients used by the SDK when none is provided.
+"""
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def _limits(
+    *,
+    max_connections: Optional[int],
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: Optional[float],
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _host_pattern(host: str) -> str:
+    """Converts a host (optionally with scheme) into an HTTPX mount pattern"""
+    return host if "://" in host else f"all://{host}"
+
+
+def build_httpx_client(
+    *,
+    timeout: Optional[float],
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    host_limits: Optional[Dict[str, httpx.Limits]] = None,
+) -> httpx.Client:
+    """
+    Creates a synchronous HTTPX client with the given connection pool settings.
+
+    Args:
+        timeout: Default request timeout in seconds
+        max_connections: Maximum number of concurrent connections, None for no limit
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        http2: Enable HTTP/2 multiplexing, requires the `h2` package
+        host_limits: Separate connection pools for specific hosts, keyed by host
+            (`api.sideko.dev`) or HTTPX mount pattern (`https://api.sideko.dev`)
+    """
+    return httpx.Client(
+        timeout=timeout,
+        limits=_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        mounts={
+            _host_pattern(host): httpx.HTTPTransport(limits=limits, http2=http2)
+            for host, limits in (host_limits or {}).items()
+        },
+    )
+
+
+def build_async_httpx_client(
+    *,
+    timeout: Optional[float],
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    host_limits: Optional[Dict[str, httpx.Limits]] = None,
+) -> httpx.AsyncClient:
+    """
+    Creates an asynchronous HTTPX client with the given connection pool settings.
+
+    Accepts the same arguments as `build_httpx_client`.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        mounts={
+            _host_pattern(host): httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+            for host, limits in (host_limits or {}).items()
+        },
+    )
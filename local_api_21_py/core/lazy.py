@@ -0,0 +1,59 @@
+import importlib
+from typing import Any, Generic, Optional, Type, TypeVar, overload
+
+"""
+Sub-clients resolved on first attribute access.
+
+Resource modules and the model modules they use are only imported, and
+their clients only constructed, when a script first touches a resource, so
+a cold start that only calls `client.health.ping()` never pays for `sdk`,
+`doc` or `api`. The built client is stored on the instance, later accesses
+are plain attribute lookups.
+
+```py
+class Client:
+    health = LazyClient["HealthClient"]("local_api_21_py.resources.health", "HealthClient")
+```
+"""
+
+C = TypeVar("C")
+
+
+class LazyClient(Generic[C]):
+    """
+    Descriptor building a sub-client from the owner's `_base_client` the
+    first time it is accessed on an instance.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        """
+        Args:
+            module: Absolute name of the module defining the client class
+            name: Name of the client class
+        """
+        self.module = module
+        self.name = name
+        self.attr = name
+        self._cls: Optional[Type[C]] = None
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def resolve(self) -> Type[C]:
+        """Imports the client class"""
+        if self._cls is None:
+            self._cls = getattr(importlib.import_module(self.module), self.name)
+        return self._cls  # type: ignore[return-value]
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "LazyClient[C]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> C: ...
+
+    def __get__(self, instance: Optional[object], owner: type) -> Any:
+        if instance is None:
+            return self
+        client = self.resolve()(base_client=instance._base_client)  # type: ignore[attr-defined, call-arg]
+        # concurrent first accesses may both build a client, all callers get the same one
+        return instance.__dict__.setdefault(self.attr, client)
@@ -0,0 +1,148 @@
+import asyncio
+import collections
+import concurrent.futures
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+"""
+Lazy iteration over every item of a page-numbered list operation.
+
+While the caller consumes page N the next page is already being fetched, so
+the request latency of all pages but the first is hidden behind processing.
+Once the first page reports the number of pages, `concurrency` pages can be
+in flight at a time. Pages are always yielded in order, and pages that were
+not started when the caller stops iterating are never requested.
+"""
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+class _Window:
+    """Decides which page numbers to request next"""
+
+    def __init__(self, first_page: int, prefetch: bool, concurrency: int) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.next_page = first_page
+        self.first_page = first_page
+        self.last_page: Optional[int] = None
+        self.exhausted = False
+        self.prefetch = prefetch
+        self.concurrency = concurrency
+
+    def size(self) -> int:
+        """Pages that may be in flight, beyond the one being consumed"""
+        if not self.prefetch:
+            return 0
+        return self.concurrency if self.last_page is not None else 1
+
+    def has_more(self) -> bool:
+        if self.exhausted:
+            return False
+        return self.last_page is None or self.next_page <= self.last_page
+
+    def take(self) -> int:
+        page = self.next_page
+        self.next_page += 1
+        return page
+
+    def update(self, items: List[Any], page_count: Optional[int]) -> None:
+        """Records what a fetched page reported about the remaining pages"""
+        if page_count is not None:
+            self.last_page = self.first_page + page_count - 1
+        elif not items:
+            self.exhausted = True
+
+
+def paginate(
+    fetch_page: Callable[[int], P],
+    *,
+    get_items: Callable[[P], List[T]],
+    get_page_count: Callable[[P], Optional[int]],
+    first_page: int = 1,
+    prefetch: bool = True,
+    concurrency: int = 1,
+) -> Iterator[T]:
+    """
+    Yields the items of all pages, fetching upcoming pages on worker threads.
+
+    Args:
+        fetch_page: Requests the page with the given number
+        get_items: Items of a page
+        get_page_count: Total number of pages, None when unknown
+        first_page: Number of the first page
+        prefetch: Fetch the next page while the current one is consumed
+        concurrency: Pages in flight at once when the page count is known
+
+    Yields:
+        Items in page order
+    """
+    window = _Window(first_page, prefetch, concurrency)
+    in_flight: Deque["concurrent.futures.Future[P]"] = collections.deque()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+
+    def start() -> None:
+        in_flight.append(executor.submit(fetch_page, window.take()))
+
+    try:
+        start()
+        while in_flight:
+            page = in_flight.popleft().result()
+            items = get_items(page)
+            window.update(items, get_page_count(page))
+            while window.has_more() and len(in_flight) < window.size():
+                start()
+            yield from items
+            if not in_flight and window.has_more():
+                start()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def apaginate(
+    fetch_page: Callable[[int], Awaitable[P]],
+    *,
+    get_items: Callable[[P], List[T]],
+    get_page_count: Callable[[P], Optional[int]],
+    first_page: int = 1,
+    prefetch: bool = True,
+    concurrency: int = 1,
+) -> AsyncIterator[T]:
+    """
+    Asynchronous version of `paginate`, upcoming pages are fetched as tasks.
+    """
+    window = _Window(first_page, prefetch, concurrency)
+    in_flight: Deque["asyncio.Future[P]"] = collections.deque()
+
+    def start() -> None:
+        in_flight.append(asyncio.ensure_future(fetch_page(window.take())))
+
+    try:
+        start()
+        while in_flight:
+            page = await in_flight.popleft()
+            items = get_items(page)
+            window.update(items, get_page_count(page))
+            while window.has_more() and len(in_flight) < window.size():
+                start()
+            for item in items:
+                yield item
+            if not in_flight and window.has_more():
+                start()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
@@ -0,0 +1,341 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .batch import RateLimiter
+
+"""
+Waiting for many long running operations to reach a terminal status.
+
+All watched targets share one scheduler instead of each running its own
+polling loop:
+
+- targets are grouped (e.g. deployments by doc project) and a group whose
+  pending targets can be read with a single request is polled as a whole
+- each group backs off exponentially with jitter while nothing changes, and
+  is polled at the initial rate again as soon as one of its targets moves to
+  a new status
+- every request takes a token from the policy's rate limiter, so watching
+  hundreds of targets stays within a fixed request budget, and a policy
+  shared between waits shares that budget
+"""
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+StatusCallback = Callable[[K, T, Optional[str]], None]
+
+
+class PollTimeout(Exception):
+    """
+    Raised when targets are still pending at the deadline or after the
+    request budget of a wait has been spent.
+
+    Attributes:
+        pending: Last seen value of each unfinished target, None if never seen
+        finished: Values of the targets that did reach a terminal status
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        pending: Mapping[Any, Any],
+        finished: Mapping[Any, Any],
+    ) -> None:
+        super().__init__(message)
+        self.pending = dict(pending)
+        self.finished = dict(finished)
+
+
+class PollPolicy:
+    """
+    Describes how often targets are polled while waiting for them.
+
+    Examples:
+    ```py
+    policy = PollPolicy(initial_delay=2, max_delay=60, rate_limit=5)
+    client.doc.deployment.wait_for_many(ids, policy=policy)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.25,
+        rate_limit: Optional[float] = 10.0,
+        burst: int = 5,
+    ) -> None:
+        """
+        Args:
+            initial_delay: Seconds between polls right after a status change
+            max_delay: Upper bound for the delay between polls of a group
+            multiplier: Growth of the delay after each poll without changes
+            jitter: Relative random deviation of each delay, spreads polls of
+                groups that were started together
+            rate_limit: Maximum polling requests per second, shared by every
+                wait using this policy, None for no limit
+            burst: Requests that may be sent back to back after an idle period
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max(max_delay, initial_delay)
+        self.multiplier = max(multiplier, 1.0)
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.limiter = RateLimiter(rate_limit, burst) if rate_limit else None
+
+    def delay(self, unchanged_polls: int) -> float:
+        """Seconds until the next poll of a group after `unchanged_polls`"""
+        base = min(
+            self.max_delay,
+            self.initial_delay * self.multiplier ** min(unchanged_polls, 64),
+        )
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class _Scheduler(Generic[K, T]):
+    """Bookkeeping of a wait shared by the sync and async drivers"""
+
+    def __init__(
+        self,
+        targets: Iterable[K],
+        *,
+        group_of: Callable[[K], Hashable],
+        get_status: Callable[[T], str],
+        terminal: Collection[str],
+        policy: PollPolicy,
+        timeout: Optional[float],
+        max_requests: Optional[int],
+        on_status: Optional[StatusCallback],
+    ) -> None:
+        self.get_status = get_status
+        self.terminal = terminal
+        self.policy = policy
+        self.max_requests = max_requests
+        self.on_status = on_status
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.requests = 0
+        self.groups: Dict[Hashable, List[K]] = {}
+        for key in targets:
+            members = self.groups.setdefault(group_of(key), [])
+            if key not in members:
+                members.append(key)
+        self.last_seen: Dict[K, Optional[T]] = {
+            k: None for members in self.groups.values() for k in members
+        }
+        self.statuses: Dict[K, str] = {}
+        self.finished: Dict[K, T] = {}
+        self.unchanged: Dict[Hashable, int] = {g: 0 for g in self.groups}
+        self._order = itertools.count()
+        now = time.monotonic()
+        self.queue: List[Tuple[float, int, Hashable]] = [
+            (now, next(self._order), g) for g in self.groups
+        ]
+
+    def timeout(self, reason: str) -> PollTimeout:
+        pending = {k: v for k, v in self.last_seen.items() if k not in self.finished}
+        return PollTimeout(
+            f"{len(pending)} targets still pending, {reason}",
+            pending=pending,
+            finished=self.finished,
+        )
+
+    def next_due(self) -> Tuple[List[Hashable], float]:
+        """Groups due at the earliest poll time and the seconds until then"""
+        due_at = self.queue[0][0]
+        if self.deadline is not None and due_at > self.deadline:
+            raise self.timeout("deadline reached")
+        groups = []
+        while self.queue and self.queue[0][0] <= due_at:
+            groups.append(heapq.heappop(self.queue)[2])
+        return groups, max(0.0, due_at - time.monotonic())
+
+    def spend(self) -> float:
+        """Accounts for one request, returning the seconds to wait before it"""
+        if self.max_requests is not None and self.requests >= self.max_requests:
+            raise self.timeout(f"request budget of {self.max_requests} spent")
+        self.requests += 1
+        if self.policy.limiter is None:
+            return 0.0
+        wait = self.policy.limiter.reserve()
+        if self.deadline is not None and time.monotonic() + wait > self.deadline:
+            raise self.timeout("deadline reached")
+        return wait
+
+    def record(self, group: Hashable, found: Mapping[K, T]) -> None:
+        """Updates the targets of a polled group and schedules its next poll"""
+        changed = False
+        for key in list(self.groups[group]):
+            if key not in found:
+                continue
+            value = found[key]
+            status = self.get_status(value)
+            previous = self.statuses.get(key)
+            self.last_seen[key] = value
+            if status != previous:
+                changed = True
+                self.statuses[key] = status
+                if self.on_status is not None:
+                    self.on_status(key, value, previous)
+            if status in self.terminal:
+                self.finished[key] = value
+                self.groups[group].remove(key)
+        if not self.groups[group]:
+            return
+        self.unchanged[group] = 0 if changed else self.unchanged[group] + 1
+        heapq.heappush(
+            self.queue,
+            (
+                time.monotonic() + self.policy.delay(self.unchanged[group]),
+                next(self._order),
+                group,
+            ),
+        )
+
+
+def _defaults(
+    policy: Optional[PollPolicy], group_of: Optional[Callable[[K], Hashable]]
+) -> Tuple[PollPolicy, Callable[[K], Hashable]]:
+    return policy or PollPolicy(), group_of or (lambda key: key)
+
+
+def poll_until(
+    targets: Iterable[K],
+    fetch_one: Callable[[K], T],
+    *,
+    get_status: Callable[[T], str],
+    terminal: Collection[str],
+    fetch_group: Optional[Callable[[Any, List[K]], Mapping[K, T]]] = None,
+    group_of: Optional[Callable[[K], Hashable]] = None,
+    policy: Optional[PollPolicy] = None,
+    timeout: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    on_status: Optional[StatusCallback] = None,
+) -> Dict[K, T]:
+    """
+    Polls targets until all of them reached a terminal status.
+
+    Args:
+        targets: Keys identifying the watched targets
+        fetch_one: Reads the current value of a single target
+        get_status: Status of a value
+        terminal: Statuses that end the wait for a target
+        fetch_group: Reads several targets of a group with one request, any
+            target missing from the result is read with `fetch_one`
+        group_of: Group of a target, every target is its own group by default
+        policy: Polling delays and request rate, `PollPolicy()` by default
+        timeout: Seconds until `PollTimeout` is raised, None to wait forever
+        max_requests: Requests after which `PollTimeout` is raised
+        on_status: Called with the key, value and previous status (None on
+            the first poll) whenever a target is seen with a new status
+
+    Returns:
+        Terminal value of every target
+
+    Raises:
+        PollTimeout: Targets were pending at the deadline or budget limit
+    """
+    policy, group_of = _defaults(policy, group_of)
+    state: _Scheduler[K, T] = _Scheduler(
+        targets,
+        group_of=group_of,
+        get_status=get_status,
+        terminal=terminal,
+        policy=policy,
+        timeout=timeout,
+        max_requests=max_requests,
+        on_status=on_status,
+    )
+
+    def request(fn: Callable[..., Any], *args: Any) -> Any:
+        wait = state.spend()
+        if wait > 0:
+            time.sleep(wait)
+        return fn(*args)
+
+    while state.queue:
+        groups, wait = state.next_due()
+        if wait > 0:
+            time.sleep(wait)
+        for group in groups:
+            keys = list(state.groups[group])
+            found: Dict[K, T] = {}
+            if fetch_group is not None and len(keys) > 1:
+                found.update(request(fetch_group, group, keys))
+            for key in keys:
+                if key not in found:
+                    found[key] = request(fetch_one, key)
+            state.record(group, found)
+    return state.finished
+
+
+async def apoll_until(
+    targets: Iterable[K],
+    fetch_one: Callable[[K], Awaitable[T]],
+    *,
+    get_status: Callable[[T], str],
+    terminal: Collection[str],
+    fetch_group: Optional[Callable[[Any, List[K]], Awaitable[Mapping[K, T]]]] = None,
+    group_of: Optional[Callable[[K], Hashable]] = None,
+    policy: Optional[PollPolicy] = None,
+    timeout: Optional[float] = None,
+    max_requests: Optional[int] = None,
+    on_status: Optional[StatusCallback] = None,
+) -> Dict[K, T]:
+    """
+    Asynchronous version of `poll_until`, groups that are due at the same
+    time are polled concurrently.
+    """
+    policy, group_of = _defaults(policy, group_of)
+    state: _Scheduler[K, T] = _Scheduler(
+        targets,
+        group_of=group_of,
+        get_status=get_status,
+        terminal=terminal,
+        policy=policy,
+        timeout=timeout,
+        max_requests=max_requests,
+        on_status=on_status,
+    )
+
+    async def request(fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        wait = state.spend()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await fn(*args)
+
+    async def poll(group: Hashable) -> None:
+        keys = list(state.groups[group])
+        found: Dict[K, T] = {}
+        if fetch_group is not None and len(keys) > 1:
+            found.update(await request(fetch_group, group, keys))
+        missing = [k for k in keys if k not in found]
+        values = await asyncio.gather(*(request(fetch_one, k) for k in missing))
+        found.update(zip(missing, values))
+        state.record(group, found)
+
+    while state.queue:
+        groups, wait = state.next_due()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await asyncio.gather(*(poll(g) for g in groups))
+    return state.finished
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import httpx
+
+from .timing import RequestTimer, RequestTimings, capture_timers
+
+if TYPE_CHECKING:
+    from .base_client import AsyncBaseClient, SyncBaseClient
+
+"""
+Raw responses of `Client.with_raw_response` / `AsyncClient.with_raw_response`.
+
+The raw client shares the connection pool, auth and configuration of the
+client it was created from, its operations return a `RawResponse` holding the
+HTTP response and the timing breakdown next to the parsed result:
+
+```py
+raw = client.with_raw_response.sdk.generate(api_name="my-api", language="python")
+print(raw.status_code, raw.timings)
+sdk = raw.parsed
+```
+
+Helpers composed of several requests, such as `iter_all` or `wait_for`,
+expect parsed results and are only available on the regular client.
+"""
+
+T = TypeVar("T")
+
+
+class RawResponse(Generic[T]):
+    """
+    Parsed result of an operation with its HTTP response and timings.
+
+    Attributes:
+        parsed: Result the regular client returns
+        http_response: Final HTTP response, rebuilt from the cache for cached
+            reads, the body of streamed downloads is not read
+        timings: Phase breakdown of the request, see `core.timing`
+    """
+
+    def __init__(self, *, parsed: T, timer: RequestTimer) -> None:
+        self.parsed = parsed
+        self.http_response: httpx.Response = timer.response  # type: ignore[assignment]
+        self.timings: RequestTimings = timer.timings
+
+    @property
+    def status_code(self) -> int:
+        return self.http_response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.http_response.headers
+
+    def __repr__(self) -> str:
+        return f"RawResponse({self.timings.operation}, status_code={self.status_code})"
+
+
+class RawResponseBaseClient:
+    """`SyncBaseClient` view whose `request` returns a `RawResponse`"""
+
+    def __init__(self, base_client: "SyncBaseClient") -> None:
+        self._base_client = base_client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base_client, name)
+
+    def request(self, **kwargs: Any) -> RawResponse[Any]:
+        with capture_timers() as timers:
+            parsed = self._base_client.request(**kwargs)
+        return RawResponse(parsed=parsed, timer=timers[-1])
+
+
+class AsyncRawResponseBaseClient:
+    """`AsyncBaseClient` view whose `request` returns a `RawResponse`"""
+
+    def __init__(self, base_client: "AsyncBaseClient") -> None:
+        self._base_client = base_client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base_client, name)
+
+    async def request(self, **kwargs: Any) -> RawResponse[Any]:
+        with capture_timers() as timers:
+            parsed = await self._base_client.request(**kwargs)
+        return RawResponse(parsed=parsed, timer=timers[-1])
@@ -1,11 +1,15 @@
-from typing import Any, Dict, Type, Union, List, Mapping
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type, Union, List, Mapping
+import typing
 
 import httpx
-from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from typing_extensions import Literal, TypedDict, Required, NotRequired
+from pydantic import BaseModel
 
 from .type_utils import NotGiven
+from .type_adapters import TypeAdapterRegistry
 from .query import QueryParams, QueryParamStyle, encode_query_param
+from .retry import RetryPolicy
+from .upload import FileStream
 
 """
 Request configuration and utility functions for handling HTTP requests.
@@ -49,11 +53,29 @@ class RequestOptions(TypedDict):
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        validate_response: Whether to validate the response body with pydantic,
+            overrides the client level setting. When disabled models are built
+            without any checks, which tolerates schema drift from a trusted API
+            but is not faster than pydantic-core validation
+        retry: Retry policy for this request, overrides the client level policy
+        coalesce: Whether an identical in-flight GET may be shared with this
+            request, overrides the client level setting
+        cache: Set to False to bypass the client's response cache
+        stream: Return binary downloads as a `StreamingBinaryResponse` whose
+            body is read on demand instead of buffered in memory
+        compress: Compress the request body, overrides the client level
+            setting
     """
 
     timeout: NotRequired[int]
     additional_headers: NotRequired[Dict[str, str]]
     additional_params: NotRequired[QueryParams]
+    validate_response: NotRequired[bool]
+    retry: NotRequired[RetryPolicy]
+    coalesce: NotRequired[bool]
+    cache: NotRequired[bool]
+    stream: NotRequired[bool]
+    compress: NotRequired[bool]
 
 
 def default_request_options() -> RequestOptions:
@@ -81,6 +103,60 @@ def model_dump(item: Any) -> Any:
         return item
 
 
+request_adapters = TypeAdapterRegistry()
+"""
+Registry of serializers used to validate and dump request parameters and bodies
+"""
+
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+# exact item types and (type, value) literal pairs that pass through each
+# `dump_with` unchanged, or None when the type requires full validation
+_Passthrough = Optional[Tuple[FrozenSet[type], FrozenSet[Tuple[type, Any]]]]
+_passthrough_cache: Dict[Any, _Passthrough] = {}
+
+
+def _build_passthrough(dump_with: Any) -> _Passthrough:
+    """
+    Determines which items validation would return unchanged for `dump_with`.
+
+    Covers primitives, Literals of primitives and Unions composed of those;
+    anything else (models, containers, Any) yields None.
+    """
+    if dump_with in _PRIMITIVE_TYPES:
+        return frozenset([dump_with]), frozenset()
+
+    origin = typing.get_origin(dump_with)
+    if origin is Literal:
+        literals = typing.get_args(dump_with)
+        if not all(type(v) in _PRIMITIVE_TYPES for v in literals):
+            return None
+        return frozenset(), frozenset((type(v), v) for v in literals)
+    elif origin is Union:
+        types: FrozenSet[type] = frozenset()
+        literals_: FrozenSet[Tuple[type, Any]] = frozenset()
+        for arg in typing.get_args(dump_with):
+            passthrough = _get_passthrough(arg)
+            if passthrough is None:
+                return None
+            types |= passthrough[0]
+            literals_ |= passthrough[1]
+        return types, literals_
+
+    return None
+
+
+def _get_passthrough(dump_with: Any) -> _Passthrough:
+    try:
+        return _passthrough_cache[dump_with]
+    except KeyError:
+        passthrough = _build_passthrough(dump_with)
+        _passthrough_cache[dump_with] = passthrough
+        return passthrough
+    except TypeError:
+        return None
+
+
 def to_encodable(
     *, item: Any, dump_with: Union[Type, Union[Type, Any], List[Type]]
 ) -> Any:
@@ -88,10 +164,21 @@ def to_encodable(
     Validates and converts an item to an encodable format using a specified type.
     Uses Pydantic's TypeAdapter for validation and converts the result
     to a format suitable for encoding in requests.
+
+    Primitive items whose exact type (or Literal value) is already accepted by
+    `dump_with` are returned without validation, all other items are validated
+    with an adapter cached in `request_adapters`.
     """
+    item_type = type(item)
+    if item_type in _PRIMITIVE_TYPES:
+        passthrough = _get_passthrough(dump_with)
+        if passthrough is not None and (
+            item_type in passthrough[0] or (item_type, item) in passthrough[1]
+        ):
+            return item
+
     filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
-    validated_item = adapter.validate_python(filtered_item)
+    validated_item = request_adapters.get(dump_with).validate_python(filtered_item)
     return model_dump(validated_item)
 
 
@@ -124,14 +211,19 @@ def to_content(*, file: httpx._types.FileTypes) -> httpx._types.RequestContent:
     """
     Converts the various ways files can be provided to something that is accepted by
     the httpx.request content kwarg
+
+    File objects are wrapped in a `FileStream` and sent in chunks instead of
+    being read into memory.
     """
     if isinstance(file, tuple):
         file_content: httpx._types.FileContent = file[1]
     else:
         file_content = file
 
+    if isinstance(file_content, FileStream):
+        return file_content
     if hasattr(file_content, "read") and callable(file_content.read):
-        return file_content.read()
+        return FileStream(file_content)
     else:
         return file_content
 
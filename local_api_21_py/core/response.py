@@ -1,8 +1,12 @@
+import collections
 import json
 from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
 from pydantic import BaseModel
 import httpx
 
+from .sse import ServerSentEvent, SSEDecoder
+from .type_adapters import response_adapters
+
 """
 Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
 Includes utilities for both synchronous and asynchronous stream processing.
@@ -27,26 +31,47 @@ def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    Validators are compiled once per target type and reused from the
+    process-wide `response_adapters` registry.
     """
+    return response_adapters.get(load_with).validate_python(data)
+
 
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
+def from_json(*, content: Union[str, bytes], load_with: Type[EncodableT]) -> Any:
+    """
+    Parses and validates a raw JSON document into a specified type.
 
-    return Caster(data=data).data
+    Decoding and validation happen in a single pass inside pydantic-core,
+    skipping the intermediate Python objects built by `json.loads`.
+    """
+    return response_adapters.get(load_with).validate_json(content)
 
 
 T = TypeVar("T")
 
 
+def _load_event(event: ServerSentEvent, cast_to: Type[T]) -> T:
+    """
+    Converts the data of an SSE event into the specified type.
+
+    JSON payloads that are not already an object with a `data` key are
+    wrapped as `{"data": payload}`, non-JSON payloads are wrapped as text.
+    """
+    try:
+        parsed_data = json.loads(event.data)
+        if not isinstance(parsed_data, dict) or "data" not in parsed_data:
+            parsed_data = {"data": parsed_data}
+        return from_encodable(data=parsed_data, load_with=cast_to)
+    except json.JSONDecodeError:
+        return from_encodable(data={"data": event.data}, load_with=cast_to)
+
+
 class StreamResponse(Generic[T]):
     """
     Handles synchronous streaming of Server-Sent Events (SSE).
 
-    Processes a streaming HTTP response by buffering chunks of data
-    and parsing them according to SSE format, converting each event
-    into the specified type.
+    Feeds the chunks of a streaming HTTP response through an incremental
+    SSE decoder, converting each event into the specified type.
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -62,8 +87,19 @@ class StreamResponse(Generic[T]):
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.iter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.decoder = SSEDecoder()
+        self._events: collections.deque = collections.deque()
+        self._exhausted = False
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """ID of the most recent event, used to resume an interrupted stream"""
+        return self.decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        """Reconnection time in milliseconds requested by the server"""
+        return self.decoder.retry
 
     def __iter__(self):
         """Enables iteration over the stream events."""
@@ -73,100 +109,30 @@ class StreamResponse(Generic[T]):
         """
         Retrieves and processes the next event from the stream.
 
-        Buffers incoming data and processes it according to SSE format,
-        converting each complete event into the specified type.
+        Reads chunks until the decoder completes an event, converting each
+        event into the specified type.
 
         Raises:
             StopIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
+        while not self._events:
+            if self._exhausted:
+                raise StopIteration
 
+            try:
                 chunk = next(self.iterator)
-                self.buffer += chunk
-
-        except StopIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            self._context.__exit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
-
-        Searches for event boundaries and parses complete events,
-        handling both JSON and non-JSON payloads.
+            except StopIteration:
+                # release the connection before handing out the flushed events
+                self._exhausted = True
+                self._context.__exit__(None, None, None)
+                self._events.extend(self.decoder.flush())
+                if not self._events:
+                    raise
+                break
 
-        Args:
-            final: Whether this is the final processing of the buffer
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
-
-        Handles multi-line data fields and empty data fields according
-        to the SSE specification.
-        """
-        data = []
-        for line in message.split("\n"):
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line.strip() == "data:":  # Handle empty data field
-                data.append("")
+            self._events.extend(self.decoder.feed(chunk))
 
-        if data:
-            return "\n".join(data)
-        return None
+        return _load_event(self._events.popleft(), self.cast_to)
 
 
 class AsyncStreamResponse(Generic[T]):
@@ -190,8 +156,19 @@ class AsyncStreamResponse(Generic[T]):
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.aiter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.decoder = SSEDecoder()
+        self._events: collections.deque = collections.deque()
+        self._exhausted = False
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """ID of the most recent event, used to resume an interrupted stream"""
+        return self.decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        """Reconnection time in milliseconds requested by the server"""
+        return self.decoder.retry
 
     def __aiter__(self):
         """Enables async iteration over the stream events."""
@@ -207,87 +184,21 @@ class AsyncStreamResponse(Generic[T]):
         Raises:
             StopAsyncIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
+        while not self._events:
+            if self._exhausted:
+                raise StopAsyncIteration
 
+            try:
                 chunk = await self.iterator.__anext__()
-                self.buffer += chunk
-
-        except StopAsyncIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
-            await self._context.__aexit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
-
-        Identical to the synchronous version's buffer processing.
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
-
-        Identical to the synchronous version's SSE parsing.
-        """
-        data = []
-        for line in message.split("\n"):
-            line = line.strip()
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
+            except StopAsyncIteration:
+                # release the connection before handing out the flushed events
+                self._exhausted = True
+                await self._context.__aexit__(None, None, None)
+                self._events.extend(self.decoder.flush())
+                if not self._events:
+                    raise
+                break
+
+            self._events.extend(self.decoder.feed(chunk))
+
+        return _load_event(self._events.popleft(), self.cast_to)
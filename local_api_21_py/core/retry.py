@@ -0,0 +1,339 @@
+import datetime
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Optional, Union
+
+import httpx
+
+"""
+Retry policies for transient API failures.
+
+Delays between attempts use "decorrelated jitter" (each delay is drawn between
+the base delay and three times the previous delay), which spreads out retries
+from many clients better than plain exponential backoff. A server provided
+`Retry-After` header takes precedence over the computed delay.
+"""
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE"}
+)
+
+# errors raised before the request reached the server, safe for any method
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryMetrics:
+    """
+    Thread-safe counters describing the requests sent by a client.
+
+    Attributes:
+        requests: Logical requests sent, regardless of the number of attempts
+        attempts: HTTP attempts, including retries
+        retries: Attempts that were retries of a previous failed attempt
+        exhausted: Requests that failed after their final allowed attempt
+        deadline_exceeded: Requests that stopped retrying because the next
+            attempt would have exceeded the deadline
+        backoff_seconds: Total time spent waiting between attempts
+        retried_statuses: Number of retries per HTTP status code
+        retried_errors: Number of retries per transport error class name
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets all counters back to zero"""
+        with self._lock:
+            self.requests = 0
+            self.attempts = 0
+            self.retries = 0
+            self.exhausted = 0
+            self.deadline_exceeded = 0
+            self.backoff_seconds = 0.0
+            self.retried_statuses: Dict[int, int] = {}
+            self.retried_errors: Dict[str, int] = {}
+
+    def _record_attempt(self, first: bool) -> None:
+        with self._lock:
+            self.attempts += 1
+            if first:
+                self.requests += 1
+            else:
+                self.retries += 1
+
+    def _record_retry(self, *, delay: float, reason: Union[int, str]) -> None:
+        with self._lock:
+            self.backoff_seconds += delay
+            counts: Dict[Any, int] = (
+                self.retried_statuses
+                if isinstance(reason, int)
+                else self.retried_errors
+            )
+            counts[reason] = counts.get(reason, 0) + 1
+
+    def _record_give_up(self, *, deadline: bool) -> None:
+        with self._lock:
+            if deadline:
+                self.deadline_exceeded += 1
+            else:
+                self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a consistent copy of the counters"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "deadline_exceeded": self.deadline_exceeded,
+                "backoff_seconds": self.backoff_seconds,
+                "retried_statuses": dict(self.retried_statuses),
+                "retried_errors": dict(self.retried_errors),
+            }
+
+
+class RetryPolicy:
+    """
+    Describes when and how often a failed request is retried.
+
+    Only idempotent methods (GET, HEAD, OPTIONS, TRACE, PUT, DELETE) are
+    retried after a response or a failure mid-request, other methods such as
+    POST only when `retry_non_idempotent` is set. Connection failures, where
+    the request never reached the server, are retried for every method.
+
+    Examples:
+    ```py
+    client = Client(retry=RetryPolicy(max_attempts=5, deadline=30))
+    client.sdk.generate(..., request_options={"retry": RetryPolicy(retry_non_idempotent=True)})
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 20.0,
+        deadline: Optional[float] = None,
+        retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES,
+        retry_non_idempotent: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            max_attempts: Total attempts including the first one, 1 disables retries
+            base_delay: Minimum delay in seconds between attempts
+            max_delay: Maximum computed delay in seconds between attempts
+            deadline: Overall time budget in seconds for all attempts and delays,
+                attempt timeouts are shortened to fit into the remaining budget
+            retry_statuses: HTTP status codes considered transient
+            retry_non_idempotent: Retry methods like POST after the request was sent
+            respect_retry_after: Wait for the duration of a `Retry-After` header
+            max_retry_after: Give up instead of waiting for a longer `Retry-After`
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.retry_non_idempotent = retry_non_idempotent
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def allows_method(self, method: str) -> bool:
+        """Whether requests with the method may be resent after reaching the server"""
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, previous: float) -> float:
+        """Draws the next delay using decorrelated jitter"""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Parses the `Retry-After` header, in seconds or as an HTTP date"""
+        value = response.headers.get("retry-after")
+        if not self.respect_retry_after or value is None:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (retry_at - now).total_seconds())
+
+    def start(
+        self,
+        *,
+        method: str,
+        rewind: Optional[Callable[[], None]] = None,
+        replayable: bool = True,
+        metrics: Optional[RetryMetrics] = None,
+    ) -> "RetryState":
+        """
+        Begins tracking the attempts of a single request.
+
+        Args:
+            method: HTTP method of the request
+            rewind: Called before every retry to reset a file-like body
+            replayable: Whether the request body can be sent again
+            metrics: Counters to update
+        """
+        return RetryState(
+            self, method=method, rewind=rewind, replayable=replayable, metrics=metrics
+        )
+
+
+class RetryState:
+    """Attempt bookkeeping for a single request under a `RetryPolicy`"""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        *,
+        method: str,
+        rewind: Optional[Callable[[], None]],
+        replayable: bool,
+        metrics: Optional[RetryMetrics],
+    ) -> None:
+        self.policy = policy
+        self.method = method
+        self.attempt = 0
+        self._rewind = rewind
+        self._replayable = replayable
+        self._metrics = metrics
+        self._started = time.monotonic()
+        self._delay = policy.base_delay
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the deadline budget, None without a deadline"""
+        if self.policy.deadline is None:
+            return None
+        return self.policy.deadline - (time.monotonic() - self._started)
+
+    def begin_attempt(self) -> None:
+        """Records an attempt, rewinding the body before retries"""
+        if self.attempt > 0 and self._rewind is not None:
+            self._rewind()
+        self.attempt += 1
+        if self._metrics is not None:
+            self._metrics._record_attempt(first=self.attempt == 1)
+
+    def timeout(self, configured: httpx._types.TimeoutTypes) -> Optional[httpx.Timeout]:
+        """
+        Shortens a timeout to the remaining deadline budget.
+
+        Returns None when the configured timeout can be used unchanged.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+        remaining = max(remaining, 0.001)
+        timeout = httpx.Timeout(configured)  # type: ignore[arg-type]
+
+        def cap(value: Optional[float]) -> float:
+            return remaining if value is None else min(value, remaining)
+
+        return httpx.Timeout(
+            connect=cap(timeout.connect),
+            read=cap(timeout.read),
+            write=cap(timeout.write),
+            pool=cap(timeout.pool),
+        )
+
+    def on_response(self, response: httpx.Response) -> Optional[float]:
+        """
+        Returns the delay before retrying the response, None to not retry.
+        """
+        status = response.status_code
+        if status not in self.policy.retry_statuses:
+            return None
+        if not self.policy.allows_method(self.method):
+            return None
+
+        retry_after = self.policy.retry_after(response)
+        if retry_after is not None and retry_after > self.policy.max_retry_after:
+            self._give_up(deadline=False)
+            return None
+        return self._next_delay(retry_after, reason=status)
+
+    def on_error(self, error: Exception) -> Optional[float]:
+        """
+        Returns the delay before retrying after a transport error, None to raise.
+        """
+        if not isinstance(error, httpx.TransportError):
+            return None
+        if not isinstance(error, _CONNECT_ERRORS) and not self.policy.allows_method(
+            self.method
+        ):
+            return None
+        return self._next_delay(None, reason=type(error).__name__)
+
+    def _next_delay(
+        self, retry_after: Optional[float], *, reason: Union[int, str]
+    ) -> Optional[float]:
+        if self.attempt >= self.policy.max_attempts or not self._replayable:
+            self._give_up(deadline=False)
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = self._delay = self.policy.backoff(self._delay)
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            self._give_up(deadline=True)
+            return None
+
+        if self._metrics is not None:
+            self._metrics._record_retry(delay=delay, reason=reason)
+        return delay
+
+    def _give_up(self, *, deadline: bool) -> None:
+        if self._metrics is not None and self.policy.max_attempts > 1:
+            self._metrics._record_give_up(deadline=deadline)
+
+
+def body_rewinder(content: Any) -> Optional[Callable[[], None]]:
+    """
+    Returns a callable resetting a seekable file-like body to its start.
+
+    Returns None when no rewinding is needed, see `is_replayable`.
+    """
+    seek = getattr(content, "seek", None)
+    tell = getattr(content, "tell", None)
+    if seek is None or tell is None:
+        return None
+    try:
+        position = tell()
+    except (OSError, ValueError):
+        return None
+    return lambda: seek(position)
+
+
+def is_replayable(content: Any) -> bool:
+    """
+    Whether a request body can be sent more than once.
+
+    Bytes, strings, seekable files and bodies declaring `replayable` (see
+    `AsyncChunkReader`) can be replayed, one-shot iterators and generators
+    cannot.
+    """
+    if content is None or isinstance(content, (bytes, bytearray, str, memoryview)):
+        return True
+    if getattr(content, "replayable", False):
+        return True
+    return body_rewinder(content) is not None
@@ -0,0 +1,174 @@
+import re
+from typing import List, Optional
+
+"""
+Incremental decoder for Server-Sent Events (SSE) streams.
+
+Implements the event stream interpretation from the HTML living standard
+(https://html.spec.whatwg.org/multipage/server-sent-events.html) in a single
+pass over the received bytes, regardless of how the stream is chunked.
+"""
+
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+_CR = 0x0D
+_LF = 0x0A
+
+
+class ServerSentEvent:
+    """
+    A single dispatched SSE event.
+
+    Attributes:
+        event: Event type, `message` unless set by an `event:` field
+        data: Data fields of the event joined with newlines
+        id: Last event ID seen on the stream when the event was dispatched
+        retry: Reconnection time in milliseconds last set by a `retry:` field
+    """
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(
+        self,
+        *,
+        data: str,
+        event: str = "message",
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return (
+            f"ServerSentEvent(event={self.event!r}, data={self.data!r}, "
+            f"id={self.id!r}, retry={self.retry!r})"
+        )
+
+
+class SSEDecoder:
+    """
+    Decodes an SSE byte stream chunk by chunk.
+
+    Only complete lines are decoded. A partial trailing line stays in the
+    buffer and scanning for its terminator resumes where the previous chunk
+    ended, so every received byte is examined once no matter how long an
+    event is or how finely it is chunked.
+
+    Attributes:
+        last_event_id: Value of the most recent `id:` field
+        retry: Value of the most recent valid `retry:` field
+    """
+
+    last_event_id: Optional[str]
+    retry: Optional[int]
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # offset into the buffer where the search for a line ending resumes
+        self._scan_from = 0
+        # a chunk ended on CR, a LF starting the next chunk completes a CRLF
+        self._skip_lf = False
+        self._event_type = ""
+        self._data: List[str] = []
+        self.last_event_id = None
+        self.retry = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Adds received bytes and returns the events they completed.
+        """
+        buffer = self._buffer
+        buffer += chunk
+        if not buffer:
+            return []
+
+        start = 0
+        if self._skip_lf:
+            self._skip_lf = False
+            if buffer[0] == _LF:
+                start = 1
+
+        events: List[ServerSentEvent] = []
+        with memoryview(buffer) as view:
+            pos = max(start, self._scan_from)
+            while True:
+                match = _LINE_END.search(buffer, pos)
+                if match is None:
+                    break
+
+                line_end, pos = match.span()
+                if pos == len(buffer) and buffer[line_end] == _CR:
+                    self._skip_lf = True
+
+                event = self._process_line(str(view[start:line_end], "utf-8"))
+                if event is not None:
+                    events.append(event)
+                start = pos
+
+        del buffer[:start]
+        self._scan_from = len(buffer)
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """
+        Processes any unterminated line and dispatches the pending event.
+
+        Called once the stream is exhausted so a final event without a
+        trailing blank line is not lost.
+        """
+        events: List[ServerSentEvent] = []
+        if self._buffer:
+            event = self._process_line(self._buffer.decode())
+            if event is not None:
+                events.append(event)
+            self._buffer.clear()
+            self._scan_from = 0
+
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> Optional[ServerSentEvent]:
+        if not line:
+            return self._dispatch()
+        if line[0] == ":":
+            # comment line
+            return None
+
+        field, sep, value = line.partition(":")
+        if sep and value[:1] == " ":
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isascii() and value.isdigit():
+                self.retry = int(value)
+
+        return None
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        data = "\n".join(self._data)
+        if data == "":
+            # nothing, or a lone empty `data:` line, was buffered
+            self._data = []
+            self._event_type = ""
+            return None
+
+        event = ServerSentEvent(
+            data=data,
+            event=self._event_type or "message",
+            id=self.last_event_id,
+            retry=self.retry,
+        )
+        self._data = []
+        self._event_type = ""
+        return event
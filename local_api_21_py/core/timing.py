@@ -0,0 +1,209 @@
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, cast
+
+import httpx
+
+from .request import RequestConfig
+
+"""
+Per-request timing breakdown.
+
+A request is split into the phases below, reported as a `RequestTimings` to
+the client's timing hooks and on the `RawResponse` of `with_raw_response`:
+
+- `auth`: preparing the auth providers, eg fetching or refreshing a token
+- `build`: building the request (URL, headers, query, body encoding)
+- `connection_acquire`: from handing the request to HTTPX until its headers
+  are written, ie waiting for a pooled connection and opening a new one,
+  of which `connect` and `tls` are the TCP and TLS handshakes
+- `ttfb`: from writing the request until the response headers arrived,
+  covering the upload and the server's processing
+- `body_read`: downloading the response body
+- `deserialize`: parsing and validating the body into the response type
+
+Network phases come from HTTPX's `trace` extension and add up over retried
+attempts. Transports that do not emit trace events (eg `MockTransport`) report
+their whole exchange as `ttfb`. Nothing is recorded, and no trace extension is
+installed, while a client has no hooks and no raw response is requested.
+
+```py
+client = Client(timing_hooks=[lambda t: print(t.operation, t.as_dict())])
+```
+"""
+
+TimingHook = Callable[["RequestTimings"], None]
+
+_active: contextvars.ContextVar[Optional["RequestTimer"]] = contextvars.ContextVar(
+    "local_api_21_py_request_timer", default=None
+)
+_captured: contextvars.ContextVar[Optional[List["RequestTimer"]]] = (
+    contextvars.ContextVar("local_api_21_py_captured_timers", default=None)
+)
+
+_PHASES = (
+    "auth",
+    "build",
+    "connection_acquire",
+    "connect",
+    "tls",
+    "ttfb",
+    "body_read",
+    "deserialize",
+)
+
+
+class RequestTimings:
+    """
+    Seconds spent in each phase of a request.
+
+    Attributes:
+        method: HTTP method
+        path: API endpoint path, eg `/doc_project/{doc_name}/deployment`
+            with the parameters filled in
+        status_code: Status of the final response, None if none was received
+        attempts: HTTP attempts sent, 0 when the response came from the
+            cache or a coalesced request
+        auth: Auth provider preparation
+        build: Request building
+        connection_acquire: Pool wait and connection setup
+        connect: TCP handshake, part of `connection_acquire`
+        tls: TLS handshake, part of `connection_acquire`
+        ttfb: Request upload and server processing up to the response headers
+        body_read: Response body download
+        deserialize: Response parsing and validation
+        total: Whole request, including retry backoff
+    """
+
+    def __init__(self, *, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.status_code: Optional[int] = None
+        self.attempts = 0
+        self.auth = 0.0
+        self.build = 0.0
+        self.connection_acquire = 0.0
+        self.connect = 0.0
+        self.tls = 0.0
+        self.ttfb = 0.0
+        self.body_read = 0.0
+        self.deserialize = 0.0
+        self.total = 0.0
+
+    @property
+    def operation(self) -> str:
+        """`METHOD /path` of the request"""
+        return f"{self.method} {self.path}"
+
+    def as_dict(self) -> Dict[str, float]:
+        """Phase durations and the total in seconds"""
+        phases = {name: getattr(self, name) for name in _PHASES}
+        phases["total"] = self.total
+        return phases
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v * 1e3:.2f}ms" for k, v in self.as_dict().items())
+        return f"RequestTimings({self.operation}, {phases})"
+
+
+class RequestTimer:
+    """Records the `RequestTimings` of the request running in this context"""
+
+    def __init__(self, *, method: str, path: str, hooks: List[TimingHook]) -> None:
+        self.timings = RequestTimings(method=method, path=path)
+        self.response: Optional[httpx.Response] = None
+        self._hooks = hooks
+        self._captured = _captured.get()
+        self._token = _active.set(self)
+        self._start = self._mark = time.perf_counter()
+        self._sent = 0.0
+        self._events: Dict[str, float] = {}
+
+    def lap(self, phase: str) -> None:
+        """Adds the time since the previous lap to `phase`"""
+        now = time.perf_counter()
+        setattr(self.timings, phase, getattr(self.timings, phase) + now - self._mark)
+        self._mark = now
+
+    def attempt(self, cfg: RequestConfig, trace: Callable[..., Any]) -> RequestConfig:
+        """Starts an attempt, returns `cfg` with the trace extension installed"""
+        self.timings.attempts += 1
+        self._events = {}
+        self._sent = time.perf_counter()
+        extensions = {**cfg.get("extensions", {}), "trace": trace}
+        return cast(RequestConfig, {**cfg, "extensions": extensions})
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """HTTPX `trace` extension of synchronous clients"""
+        # "http11.send_request_headers.started" -> "send_request_headers.started"
+        self._events[name.partition(".")[2]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        """HTTPX `trace` extension of asynchronous clients"""
+        self._events[name.partition(".")[2]] = time.perf_counter()
+
+    def received(self) -> None:
+        """Ends an attempt once its response was received"""
+        now = time.perf_counter()
+        events = self._events
+        timings = self.timings
+        sent = events.get("send_request_headers.started")
+        first_byte = events.get("receive_response_headers.complete")
+        if sent is None or first_byte is None:
+            timings.ttfb += now - self._sent
+        else:
+            timings.connection_acquire += sent - self._sent
+            timings.connect += self._span(events, "connect_tcp")
+            timings.tls += self._span(events, "start_tls")
+            timings.ttfb += first_byte - sent
+            timings.body_read += (
+                events.get("receive_response_body.complete", now) - first_byte
+            )
+        self._mark = now
+
+    def fetched(self, response: httpx.Response) -> None:
+        """Records the final response, after retries, caching and coalescing"""
+        self.response = response
+        self.timings.status_code = response.status_code
+        self._mark = time.perf_counter()
+
+    @staticmethod
+    def _span(events: Dict[str, float], name: str) -> float:
+        started = events.get(f"{name}.started")
+        complete = events.get(f"{name}.complete")
+        return complete - started if started and complete else 0.0
+
+    def finish(self) -> None:
+        """Completes the timings and passes them to the hooks"""
+        self.timings.total = time.perf_counter() - self._start
+        _active.reset(self._token)
+        if self._captured is not None:
+            self._captured.append(self)
+        for hook in self._hooks:
+            hook(self.timings)
+
+
+def active_timer() -> Optional[RequestTimer]:
+    """Timer of the request running in this context, None if it is not timed"""
+    return _active.get()
+
+
+def start_timer(
+    *, method: str, path: str, hooks: List[TimingHook]
+) -> Optional[RequestTimer]:
+    """Times a request when hooks are registered or its timings are captured"""
+    if not hooks and _captured.get() is None:
+        return None
+    return RequestTimer(method=method, path=path, hooks=hooks)
+
+
+@contextlib.contextmanager
+def capture_timers() -> Iterator[List[RequestTimer]]:
+    """Collects the timers of the requests finished within the block"""
+    captured: List[RequestTimer] = []
+    token = _captured.set(captured)
+    try:
+        yield captured
+    finally:
+        _captured.reset(token)
@@ -0,0 +1,97 @@
+import threading
+from typing import Any, Dict
+
+from pydantic import TypeAdapter
+
+"""
+Process-wide registry of compiled pydantic validators.
+
+Building a pydantic core schema is expensive, so adapters are compiled
+once per type and shared by every client instance, thread and stream.
+"""
+
+
+class TypeAdapterRegistry:
+    """
+    Thread-safe cache of pydantic TypeAdapters keyed by the type they validate.
+
+    Generic aliases such as `typing.List[models.Asset]` and Unions compare and
+    hash by value, so equivalent types built at different call sites share a
+    single compiled adapter. Unhashable types are compiled on every lookup and
+    counted as misses.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that required compiling a new adapter
+    """
+
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self._adapters: Dict[Any, TypeAdapter] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tp: Any) -> TypeAdapter:
+        """
+        Retrieves the compiled adapter for a type, building it on first use.
+        """
+        try:
+            adapter = self._adapters.get(tp)
+        except TypeError:
+            with self._lock:
+                self.misses += 1
+            return TypeAdapter(tp)
+
+        if adapter is not None:
+            with self._lock:
+                self.hits += 1
+            return adapter
+
+        with self._lock:
+            # another thread may have compiled the adapter while we waited
+            adapter = self._adapters.get(tp)
+            if adapter is None:
+                adapter = TypeAdapter(tp)
+                self._adapters[tp] = adapter
+                self.misses += 1
+            else:
+                self.hits += 1
+            return adapter
+
+    def __contains__(self, tp: Any) -> bool:
+        try:
+            return tp in self._adapters
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._adapters)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of the registry counters.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._adapters),
+            }
+
+    def clear(self) -> None:
+        """
+        Drops all compiled adapters and resets the counters.
+        """
+        with self._lock:
+            self._adapters.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+response_adapters = TypeAdapterRegistry()
+"""
+Registry of validators used to load response bodies and stream events
+"""
@@ -0,0 +1,188 @@
+import asyncio
+import io
+import mmap
+import os
+import stat
+from typing import Any, AsyncIterator, BinaryIO, Iterable, Iterator, Optional, Union
+
+"""
+Request bodies streamed from files in bounded chunks.
+
+`FileStream` is accepted wherever the client takes a file: as `content`, or
+as a part of a multipart `files=` upload. Regular files are memory mapped and
+read a chunk at a time, pages that have been sent are released again with
+`madvise`, so uploading a large spec costs one chunk of memory rather than
+the size of the file.
+
+Synchronous HTTPX iterates request bodies on the calling thread. The async
+client instead hands file-backed bodies to `AsyncChunkReader`, which pulls
+each chunk in the default executor so disk reads never block the event loop.
+"""
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+
+
+class FileStream(io.RawIOBase):
+    """
+    Read-only, seekable file body read through `mmap` where possible.
+
+    The stream covers the file from its current position to the end, so an
+    already opened handle is sent from where it stands, like `file.read()`.
+    Iterating the stream yields chunks starting at the current position and
+    rewinding it with `seek(0)` replays the body, which retries rely on.
+
+    Examples:
+    ```py
+    client.api.spec.create(
+        api_name="petstore", openapi=FileStream("specs/petstore.yaml"), version="1.4.0"
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", BinaryIO],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Args:
+            file: Path of the file, opened (and closed) by the stream, or a
+                binary file object owned by the caller
+            chunk_size: Size of the chunks read from the file
+        """
+        super().__init__()
+        if isinstance(file, (str, os.PathLike)):
+            self._file: Any = open(file, "rb")
+            self._owns_file = True
+            self.name = os.fspath(file)
+        else:
+            self._file = file
+            self._owns_file = False
+            self.name = getattr(file, "name", "upload")
+        self.chunk_size = chunk_size
+        self._start = self._file.tell() if self._file.seekable() else 0
+        self._position = 0
+        self._released = 0
+        self._map: Optional[mmap.mmap] = None
+        self._size: Optional[int] = None
+        try:
+            info: Optional[os.stat_result] = os.fstat(self._file.fileno())
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            info = None
+        if info is not None and stat.S_ISREG(info.st_mode):
+            # st_size is only meaningful for regular files, it is 0 for pipes
+            # and sockets whose bodies are sent chunked
+            self._size = max(info.st_size - self._start, 0)
+            if self._size:
+                try:
+                    self._map = mmap.mmap(
+                        self._file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                except (OSError, ValueError):
+                    pass  # read through the file object instead
+        elif info is None and self._file.seekable():
+            self._size = self._file.seek(0, os.SEEK_END) - self._start
+            self._file.seek(self._start)
+
+    @property
+    def size(self) -> Optional[int]:
+        """Number of bytes the stream sends, None for unsized files like pipes"""
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._size is not None
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if self._size is None:
+            raise io.UnsupportedOperation("stream is not seekable")
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = max(offset, 0)
+        if self._map is None:
+            self._file.seek(self._start + self._position)
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = (self._size - self._position) if self._size is not None else -1
+        if self._map is None:
+            chunk = self._file.read(size)
+            self._position += len(chunk)
+            return chunk
+
+        start = self._start + self._position
+        chunk = self._map[start : start + size]
+        self._position += len(chunk)
+        self._release(start + len(chunk))
+        return chunk
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def _release(self, upto: int) -> None:
+        """Drops mapped pages that have been sent from the process"""
+        if _MADV_DONTNEED is None or self._map is None:
+            return
+        end = upto - upto % mmap.PAGESIZE
+        if end > self._released:
+            self._map.madvise(_MADV_DONTNEED, self._released, end - self._released)
+            self._released = end
+
+    def __iter__(self) -> Iterator[bytes]:  # type: ignore[override]
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._owns_file:
+            self._file.close()
+        super().close()
+
+
+class AsyncChunkReader:
+    """
+    Async iterable over a synchronous byte iterable whose chunks are produced
+    in the default executor.
+
+    Used by the async client for file-backed bodies and multipart uploads.
+    Every iteration restarts the wrapped iterable, so bodies that can be
+    iterated again (files that seek back, HTTPX multipart streams) can be
+    replayed on retry.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """
+        Args:
+            chunks: Re-iterable body, eg a `FileStream`
+        """
+        self.chunks = chunks
+        self.replayable = getattr(chunks, "replayable", True)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        if isinstance(self.chunks, FileStream) and self.chunks.seekable():
+            self.chunks.seek(0)
+        iterator = iter(self.chunks)
+        while True:
+            chunk = await loop.run_in_executor(None, next, iterator, None)
+            if chunk is None:
+                return
+            yield chunk
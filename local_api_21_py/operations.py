@@ -0,0 +1,337 @@
+import functools
+import types
+import typing
+
+import httpx
+
+from local_api_21_py.client import AsyncClient, Client
+from local_api_21_py.core import BinaryResponse, LazyClient
+from local_api_21_py.types import models, params
+
+"""
+Table of the API operations sent by the resource clients.
+
+Every operation of `resources/*` is declared with the route it requests and
+the exact `dump_with` and `cast_to` types it passes to the base client, so
+tooling such as `warm_up` and the benchmark stand-in reads them from one
+place instead of inspecting signatures and docstrings. The table mirrors the
+resource clients and is kept in sync with them by the test suite.
+"""
+
+
+class Operation(typing.NamedTuple):
+    """An API operation of the resource clients"""
+
+    method: str
+    """HTTP method"""
+
+    path: str
+    """Path template such as `/doc_project/{doc_name}`"""
+
+    dump_with: typing.Tuple[typing.Any, ...]
+    """`dump_with` types of the request body, empty for operations without one"""
+
+    cast_to: typing.Any
+    """`cast_to` type of the response"""
+
+
+OPERATIONS: typing.Dict[str, Operation] = {
+    "api.delete": Operation("DELETE", "/api/{api_name}", (), type(None)),
+    "api.list": Operation("GET", "/api", (), typing.List[models.Api]),
+    "api.get": Operation("GET", "/api/{api_name}", (), models.Api),
+    "api.patch": Operation(
+        "PATCH", "/api/{api_name}", (params._SerializerUpdateApi,), models.Api
+    ),
+    "api.create": Operation("POST", "/api", (params._SerializerNewApi,), models.Api),
+    "api.init": Operation(
+        "POST", "/api/init", (params._SerializerNewApiWithVersion,), models.ApiSpec
+    ),
+    "api.spec.delete": Operation(
+        "DELETE", "/api/{api_name}/spec/{api_version}", (), type(None)
+    ),
+    "api.spec.list": Operation(
+        "GET", "/api/{api_name}/spec", (), typing.List[models.ApiSpec]
+    ),
+    "api.spec.get": Operation(
+        "GET", "/api/{api_name}/spec/{api_version}", (), models.ApiSpec
+    ),
+    "api.spec.get_openapi": Operation(
+        "GET", "/api/{api_name}/spec/{api_version}/openapi", (), models.OpenApi
+    ),
+    "api.spec.get_stats": Operation(
+        "GET", "/api/{api_name}/spec/{api_version}/stats", (), models.ApiSpecStats
+    ),
+    "api.spec.patch": Operation(
+        "PATCH",
+        "/api/{api_name}/spec/{api_version}",
+        (params._SerializerUpdateApiSpec,),
+        models.ApiSpec,
+    ),
+    "api.spec.create": Operation(
+        "POST", "/api/{api_name}/spec", (params._SerializerNewApiSpec,), models.ApiSpec
+    ),
+    "api_link.delete": Operation("DELETE", "/api_link/{id}", (), type(None)),
+    "api_link.list": Operation("GET", "/api_link", (), typing.List[models.ApiLink]),
+    "api_link.get": Operation("GET", "/api_link/{id}", (), models.ApiLink),
+    "api_link.patch": Operation(
+        "PATCH", "/api_link/{id}", (params._SerializerUpdateApiLink,), models.ApiLink
+    ),
+    "api_link.create": Operation(
+        "POST", "/api_link", (params._SerializerNewApiLink,), models.ApiLink
+    ),
+    "api_link.reorder": Operation(
+        "POST", "/api_link/reorder", (params._SerializerApiReorder,), models.ApiReorder
+    ),
+    "api_link.group.delete": Operation(
+        "DELETE", "/api_link_group/{id}", (), type(None)
+    ),
+    "api_link.group.list": Operation(
+        "GET", "/api_link_group", (), typing.List[models.ApiLinkGroup]
+    ),
+    "api_link.group.patch": Operation(
+        "PATCH",
+        "/api_link_group/{id}",
+        (params._SerializerUpdateApiLinkGroup,),
+        models.ApiLinkGroup,
+    ),
+    "api_link.group.create": Operation(
+        "POST",
+        "/api_link_group",
+        (params._SerializerNewApiLinkGroup,),
+        models.ApiLinkGroup,
+    ),
+    "doc.delete": Operation("DELETE", "/doc_project/{doc_name}", (), type(None)),
+    "doc.list": Operation("GET", "/doc_project", (), typing.List[models.DocProject]),
+    "doc.get": Operation("GET", "/doc_project/{doc_name}", (), models.DocProject),
+    "doc.check_preview": Operation("GET", "/doc_project/{doc_name}/preview", (), bool),
+    "doc.patch": Operation(
+        "PATCH",
+        "/doc_project/{doc_name}",
+        (params._SerializerUpdateDocProject,),
+        models.DocProject,
+    ),
+    "doc.create": Operation(
+        "POST", "/doc_project", (params._SerializerNewDocProject,), models.DocProject
+    ),
+    "doc.preview.delete_password": Operation(
+        "DELETE",
+        "/doc_project/{doc_name}/password",
+        (params._SerializerDocPreviewPasswordName,),
+        type(None),
+    ),
+    "doc.preview.list_passwords": Operation(
+        "GET",
+        "/doc_project/{doc_name}/password",
+        (),
+        typing.List[models.DocPreviewPassword],
+    ),
+    "doc.preview.create_password": Operation(
+        "POST",
+        "/doc_project/{doc_name}/password",
+        (params._SerializerDocPreviewPasswordName,),
+        models.DocPreviewPassword,
+    ),
+    "doc.version.list": Operation(
+        "GET", "/doc_project/{doc_name}/version", (), typing.List[models.DocVersion]
+    ),
+    "doc.version.get": Operation(
+        "GET", "/doc_project/{doc_name}/version/{doc_version}", (), models.DocVersion
+    ),
+    "doc.version.guide.delete": Operation(
+        "DELETE",
+        "/doc_project/{doc_name}/version/{doc_version}/guide/{guide_id}",
+        (),
+        type(None),
+    ),
+    "doc.version.guide.list": Operation(
+        "GET",
+        "/doc_project/{doc_name}/version/{doc_version}/guide",
+        (),
+        typing.List[models.GuideWithChildren],
+    ),
+    "doc.version.guide.get": Operation(
+        "GET",
+        "/doc_project/{doc_name}/version/{doc_version}/guide/{guide_id}",
+        (),
+        models.Guide,
+    ),
+    "doc.version.guide.get_content": Operation(
+        "GET",
+        "/doc_project/{doc_name}/version/{doc_version}/guide/{guide_id}/content",
+        (),
+        models.GuideContent,
+    ),
+    "doc.version.guide.patch": Operation(
+        "PATCH",
+        "/doc_project/{doc_name}/version/{doc_version}/guide/{guide_id}",
+        (params._SerializerUpdateGuide,),
+        models.Guide,
+    ),
+    "doc.version.guide.create": Operation(
+        "POST",
+        "/doc_project/{doc_name}/version/{doc_version}/guide",
+        (params._SerializerNewGuide,),
+        models.Guide,
+    ),
+    "doc.version.guide.reorder": Operation(
+        "POST",
+        "/doc_project/{doc_name}/version/{doc_version}/guide/reorder",
+        (typing.List[params._SerializerReorderGuide],),
+        typing.List[models.GuideWithChildren],
+    ),
+    "doc.deployment.list": Operation(
+        "GET", "/doc_project/{doc_name}/deployment", (), typing.List[models.Deployment]
+    ),
+    "doc.deployment.get": Operation(
+        "GET",
+        "/doc_project/{doc_name}/deployment/{deployment_id}",
+        (),
+        models.Deployment,
+    ),
+    "doc.deployment.trigger": Operation(
+        "POST",
+        "/doc_project/{doc_name}/deployment",
+        (params._SerializerNewDeployment,),
+        models.Deployment,
+    ),
+    "doc.theme.get": Operation(
+        "GET", "/doc_project/{doc_name}/theme", (), models.Theme
+    ),
+    "doc.theme.update": Operation(
+        "PUT",
+        "/doc_project/{doc_name}/theme",
+        (params._SerializerThemeValues,),
+        models.Theme,
+    ),
+    "asset.delete": Operation("DELETE", "/organization/asset/{id}", (), type(None)),
+    "asset.list": Operation("GET", "/organization/asset", (), models.ListAssetsPage),
+    "asset.patch": Operation(
+        "PATCH",
+        "/organization/asset/{id}",
+        (params._SerializerUpdateAsset,),
+        models.Asset,
+    ),
+    "asset.create": Operation(
+        "POST",
+        "/organization/asset",
+        (params._SerializerFile,),
+        typing.List[models.Asset],
+    ),
+    "role.delete": Operation("DELETE", "/role/{id}", (), type(None)),
+    "role.list": Operation("GET", "/role", (), typing.List[models.Role]),
+    "role.create": Operation(
+        "POST", "/role", (params._SerializerNewRole,), models.Role
+    ),
+    "service_account.delete": Operation(
+        "DELETE", "/service_account/{id}", (), type(None)
+    ),
+    "service_account.list": Operation(
+        "GET", "/service_account", (), typing.List[models.User]
+    ),
+    "service_account.get": Operation("GET", "/service_account/{id}", (), models.User),
+    "service_account.create": Operation(
+        "POST",
+        "/service_account",
+        (params._SerializerNewServiceAccount,),
+        models.UserApiKey,
+    ),
+    "health.check": Operation("GET", "/_health", (), models.HealthCheckResponse),
+    "health.ping": Operation("GET", "/_ping", (), models.HealthPingResponse),
+    "auth.exchange_code": Operation("GET", "/auth/exchange_key", (), models.UserApiKey),
+    "cli.check_updates": Operation(
+        "GET", "/cli/updates/{cli_version}", (), typing.List[models.CliUpdate]
+    ),
+    "org.get": Operation("GET", "/organization", (), models.Organization),
+    "org.create": Operation(
+        "POST",
+        "/organization",
+        (params._SerializerNewOrganization,),
+        models.OrganizationWithRedirect,
+    ),
+    "org.theme.get": Operation("GET", "/organization/theme", (), models.Theme),
+    "org.theme.update": Operation(
+        "PUT", "/organization/theme", (params._SerializerThemeValues,), models.Theme
+    ),
+    "sdk.list": Operation("GET", "/sdk", (), typing.List[models.SdkGeneration]),
+    "sdk.generate": Operation(
+        "POST", "/sdk", (params._SerializerNewSdk,), BinaryResponse
+    ),
+    "sdk.update": Operation("POST", "/sdk/update", (params._SerializerUpdateSdk,), str),
+    "sdk.config.init": Operation(
+        "POST", "/sdk/config/init", (params._SerializerInitSdkConfig,), BinaryResponse
+    ),
+    "sdk.config.sync": Operation(
+        "POST", "/sdk/config/sync", (params._SerializerSyncSdkConfig,), BinaryResponse
+    ),
+    "sdk.doc.create": Operation(
+        "POST",
+        "/sdk/{sdk_id}/doc",
+        (params._SerializerSdkDocRequest,),
+        models.SdkDocResponse,
+    ),
+    "user.invite": Operation(
+        "POST", "/user/invite", (params._SerializerInvite,), httpx.Response
+    ),
+    "user.me.get": Operation("GET", "/user/me", (), models.User),
+    "user.me.get_key": Operation("GET", "/user/me/api_key", (), models.UserApiKey),
+    "lint.run": Operation(
+        "POST", "/lint", (params._SerializerNewLint,), models.LintReport
+    ),
+    "webhook.vercel": Operation(
+        "POST", "/webhook/vercel", (typing.Dict[str, typing.Any],), httpx.Response
+    ),
+}
+"""Operations by their dotted path from the client, eg `"doc.deployment.get"`"""
+
+HELPERS: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "asset.iter_all": ("asset.list",),
+    "doc.deployment.wait_for": ("doc.deployment.get",),
+    "doc.deployment.wait_for_many": ("doc.deployment.list", "doc.deployment.get"),
+}
+"""Operations sent by the helper methods of the resource clients"""
+
+
+@functools.lru_cache(maxsize=None)
+def _method_names() -> typing.Dict[typing.Tuple[type, str], str]:
+    names: typing.Dict[typing.Tuple[type, str], str] = {}
+
+    def walk(owner: type, prefix: str) -> None:
+        for attr_name, attr in vars(owner).items():
+            if isinstance(attr, LazyClient):
+                walk(attr.resolve(), f"{prefix}{attr_name}.")
+            elif isinstance(attr, types.FunctionType):
+                name = f"{prefix}{attr_name}"
+                if name in OPERATIONS or name in HELPERS:
+                    names[(owner, attr_name)] = name
+
+    walk(Client, "")
+    walk(AsyncClient, "")
+    return names
+
+
+def operation_name(
+    operation: typing.Union[str, typing.Callable[..., typing.Any]],
+) -> str:
+    """
+    Dotted path of an operation or helper from the client.
+
+    Args:
+        operation: Bound method of a sync or async resource client such as
+            `client.doc.deployment.get`, or its dotted path
+
+    Returns:
+        Key of the operation in `OPERATIONS` or `HELPERS`
+
+    Raises:
+        ValueError: The operation is not sent by the resource clients
+    """
+    if isinstance(operation, str):
+        if operation in OPERATIONS or operation in HELPERS:
+            return operation
+    else:
+        owner = type(getattr(operation, "__self__", None))
+        fn_name = getattr(operation, "__name__", "")
+        name = _method_names().get((owner, fn_name))
+        if name is not None:
+            return name
+    raise ValueError(f"unknown operation {operation!r}")
@@ -4,6 +4,7 @@ import typing_extensions
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
@@ -11,14 +12,17 @@ from local_api_21_py.core import (
     to_encodable,
     type_utils,
 )
-from local_api_21_py.resources.api.spec import AsyncSpecClient, SpecClient
 from local_api_21_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.api.spec import AsyncSpecClient, SpecClient
+
 
 class ApiClient:
+    spec = LazyClient["SpecClient"]("local_api_21_py.resources.api.spec", "SpecClient")
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.spec = SpecClient(base_client=self._base_client)
 
     def delete(
         self, *, api_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -278,9 +282,12 @@ class ApiClient:
 
 
 class AsyncApiClient:
+    spec = LazyClient["AsyncSpecClient"](
+        "local_api_21_py.resources.api.spec", "AsyncSpecClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.spec = AsyncSpecClient(base_client=self._base_client)
 
     async def delete(
         self, *, api_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -3,6 +3,7 @@ import typing_extensions
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
@@ -11,14 +12,19 @@ from local_api_21_py.core import (
     to_encodable,
     type_utils,
 )
-from local_api_21_py.resources.api_link.group import AsyncGroupClient, GroupClient
 from local_api_21_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.api_link.group import AsyncGroupClient, GroupClient
+
 
 class ApiLinkClient:
+    group = LazyClient["GroupClient"](
+        "local_api_21_py.resources.api_link.group", "GroupClient"
+    )
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.group = GroupClient(base_client=self._base_client)
 
     def delete(
         self, *, id: str, request_options: typing.Optional[RequestOptions] = None
@@ -337,9 +343,12 @@ class ApiLinkClient:
 
 
 class AsyncApiLinkClient:
+    group = LazyClient["AsyncGroupClient"](
+        "local_api_21_py.resources.api_link.group", "AsyncGroupClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.group = AsyncGroupClient(base_client=self._base_client)
 
     async def delete(
         self, *, id: str, request_options: typing.Optional[RequestOptions] = None
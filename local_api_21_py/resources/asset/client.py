@@ -6,9 +6,11 @@ from local_api_21_py.core import (
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    apaginate,
     default_request_options,
     encode_query_param,
     filter_not_given,
+    paginate,
     to_encodable,
     type_utils,
 )
@@ -114,6 +116,52 @@ class AssetClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_all(
+        self,
+        *,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.Asset]:
+        """
+        List All Assets
+
+        Iterates the media assets of every page of `list`, see `core.pagination`
+
+        GET /organization/asset
+
+        Args:
+            name: str
+            prefetch: Fetch the next page while the current one is consumed
+            concurrency: Pages in flight at once when the page count is known
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over all organization assets
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for asset in client.asset.iter_all(concurrency=4):
+            print(asset.name)
+        ```
+        """
+        return paginate(
+            lambda page: self.list(
+                name=name, page=page, request_options=request_options
+            ),
+            get_items=lambda p: p.results,
+            get_page_count=lambda p: p.pagination.page_count,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     def patch(
         self,
         *,
@@ -302,6 +350,52 @@ class AsyncAssetClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_all(
+        self,
+        *,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        prefetch: bool = True,
+        concurrency: int = 1,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.Asset]:
+        """
+        List All Assets
+
+        Iterates the media assets of every page of `list`, see `core.pagination`
+
+        GET /organization/asset
+
+        Args:
+            name: str
+            prefetch: Fetch the next page while the current one is consumed
+            concurrency: Pages in flight at once when the page count is known
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Async iterator over all organization assets
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for asset in client.asset.iter_all(concurrency=4):
+            print(asset.name)
+        ```
+        """
+        return apaginate(
+            lambda page: self.list(
+                name=name, page=page, request_options=request_options
+            ),
+            get_items=lambda p: p.results,
+            get_page_count=lambda p: p.pagination.page_count,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     async def patch(
         self,
         *,
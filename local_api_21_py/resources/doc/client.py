@@ -2,6 +2,7 @@ import typing
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
@@ -10,23 +11,34 @@ from local_api_21_py.core import (
     to_encodable,
     type_utils,
 )
-from local_api_21_py.resources.doc.deployment import (
-    AsyncDeploymentClient,
-    DeploymentClient,
-)
-from local_api_21_py.resources.doc.preview import AsyncPreviewClient, PreviewClient
-from local_api_21_py.resources.doc.theme import AsyncThemeClient, ThemeClient
-from local_api_21_py.resources.doc.version import AsyncVersionClient, VersionClient
 from local_api_21_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.doc.deployment import (
+        AsyncDeploymentClient,
+        DeploymentClient,
+    )
+    from local_api_21_py.resources.doc.preview import AsyncPreviewClient, PreviewClient
+    from local_api_21_py.resources.doc.theme import AsyncThemeClient, ThemeClient
+    from local_api_21_py.resources.doc.version import AsyncVersionClient, VersionClient
+
 
 class DocClient:
+    preview = LazyClient["PreviewClient"](
+        "local_api_21_py.resources.doc.preview", "PreviewClient"
+    )
+    version = LazyClient["VersionClient"](
+        "local_api_21_py.resources.doc.version", "VersionClient"
+    )
+    deployment = LazyClient["DeploymentClient"](
+        "local_api_21_py.resources.doc.deployment", "DeploymentClient"
+    )
+    theme = LazyClient["ThemeClient"](
+        "local_api_21_py.resources.doc.theme", "ThemeClient"
+    )
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.preview = PreviewClient(base_client=self._base_client)
-        self.version = VersionClient(base_client=self._base_client)
-        self.deployment = DeploymentClient(base_client=self._base_client)
-        self.theme = ThemeClient(base_client=self._base_client)
 
     def delete(
         self, *, doc_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -265,12 +277,21 @@ class DocClient:
 
 
 class AsyncDocClient:
+    preview = LazyClient["AsyncPreviewClient"](
+        "local_api_21_py.resources.doc.preview", "AsyncPreviewClient"
+    )
+    version = LazyClient["AsyncVersionClient"](
+        "local_api_21_py.resources.doc.version", "AsyncVersionClient"
+    )
+    deployment = LazyClient["AsyncDeploymentClient"](
+        "local_api_21_py.resources.doc.deployment", "AsyncDeploymentClient"
+    )
+    theme = LazyClient["AsyncThemeClient"](
+        "local_api_21_py.resources.doc.theme", "AsyncThemeClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.preview = AsyncPreviewClient(base_client=self._base_client)
-        self.version = AsyncVersionClient(base_client=self._base_client)
-        self.deployment = AsyncDeploymentClient(base_client=self._base_client)
-        self.theme = AsyncThemeClient(base_client=self._base_client)
 
     async def delete(
         self, *, doc_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -3,16 +3,23 @@ import typing_extensions
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    PollPolicy,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
+    apoll_until,
     default_request_options,
     encode_query_param,
+    poll_until,
     to_encodable,
     type_utils,
 )
 from local_api_21_py.types import models, params
 
+TERMINAL_STATUSES = frozenset({"Complete", "Error", "Cancelled"})
+
+DeploymentKey = typing.Tuple[str, str]
+
 
 class DeploymentClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -174,6 +181,137 @@ class DeploymentClient:
             request_options=request_options or default_request_options(),
         )
 
+    def wait_for(
+        self,
+        *,
+        deployment_id: str,
+        doc_name: str,
+        timeout: typing.Optional[float] = None,
+        policy: typing.Optional[PollPolicy] = None,
+        on_status: typing.Optional[
+            typing.Callable[
+                [DeploymentKey, models.Deployment, typing.Optional[str]], None
+            ]
+        ] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> models.Deployment:
+        """
+        Wait for a deployment to finish
+
+        Polls `get` with backoff until the deployment is `Complete`, `Error`
+        or `Cancelled`, see `core.polling`
+
+        GET /doc_project/{doc_name}/deployment/{deployment_id}
+
+        Args:
+            deployment_id: str
+            doc_name: Unique project name or the uuid
+            timeout: Seconds to wait before raising `PollTimeout`
+            policy: Polling delays and request budget
+            on_status: Called with the key, deployment and previous status
+                whenever the deployment is seen with a new status
+            request_options: Additional options to customize the HTTP requests
+
+        Returns:
+            Deployment in its terminal status
+
+        Raises:
+            PollTimeout: The deployment was still running at the deadline
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        deployment = client.doc.deployment.trigger(doc_name="my-project", target="Preview")
+        client.doc.deployment.wait_for(
+            deployment_id=deployment.id, doc_name="my-project", timeout=600
+        )
+        ```
+        """
+        done = self.wait_for_many(
+            [(doc_name, deployment_id)],
+            timeout=timeout,
+            policy=policy,
+            on_status=on_status,
+            request_options=request_options,
+        )
+        return done[(doc_name, deployment_id)]
+
+    def wait_for_many(
+        self,
+        deployments: typing.Iterable[DeploymentKey],
+        *,
+        timeout: typing.Optional[float] = None,
+        policy: typing.Optional[PollPolicy] = None,
+        max_requests: typing.Optional[int] = None,
+        on_status: typing.Optional[
+            typing.Callable[
+                [DeploymentKey, models.Deployment, typing.Optional[str]], None
+            ]
+        ] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[DeploymentKey, models.Deployment]:
+        """
+        Wait for several deployments to finish
+
+        Polls all deployments from one scheduler: deployments of the same doc
+        project are read together with a single `list` request, and all
+        requests share the rate limit of `policy`, see `core.polling`
+
+        GET /doc_project/{doc_name}/deployment
+
+        Args:
+            deployments: `(doc_name, deployment_id)` pairs
+            timeout: Seconds to wait before raising `PollTimeout`
+            policy: Polling delays and request budget
+            max_requests: Requests after which `PollTimeout` is raised
+            on_status: Called with the key, deployment and previous status
+                whenever a deployment is seen with a new status
+            request_options: Additional options to customize the HTTP requests
+
+        Returns:
+            Deployment in its terminal status by `(doc_name, deployment_id)`
+
+        Raises:
+            PollTimeout: Deployments were still running at the deadline or
+                after `max_requests`
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        done = client.doc.deployment.wait_for_many(
+            [("docs-a", id_a), ("docs-b", id_b)], timeout=600
+        )
+        failed = [key for key, d in done.items() if d.status != "Complete"]
+        ```
+        """
+
+        def fetch_one(key: DeploymentKey) -> models.Deployment:
+            return self.get(
+                doc_name=key[0], deployment_id=key[1], request_options=request_options
+            )
+
+        def fetch_group(
+            doc_name: str, keys: typing.List[DeploymentKey]
+        ) -> typing.Dict[DeploymentKey, models.Deployment]:
+            listed = self.list(doc_name=doc_name, request_options=request_options)
+            wanted = set(keys)
+            return {(doc_name, d.id): d for d in listed if (doc_name, d.id) in wanted}
+
+        return poll_until(
+            deployments,
+            fetch_one,
+            get_status=lambda d: d.status,
+            terminal=TERMINAL_STATUSES,
+            fetch_group=fetch_group,
+            group_of=lambda key: key[0],
+            policy=policy,
+            timeout=timeout,
+            max_requests=max_requests,
+            on_status=on_status,
+        )
+
 
 class AsyncDeploymentClient:
     def __init__(self, *, base_client: AsyncBaseClient):
@@ -334,3 +472,134 @@ class AsyncDeploymentClient:
             cast_to=models.Deployment,
             request_options=request_options or default_request_options(),
         )
+
+    async def wait_for(
+        self,
+        *,
+        deployment_id: str,
+        doc_name: str,
+        timeout: typing.Optional[float] = None,
+        policy: typing.Optional[PollPolicy] = None,
+        on_status: typing.Optional[
+            typing.Callable[
+                [DeploymentKey, models.Deployment, typing.Optional[str]], None
+            ]
+        ] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> models.Deployment:
+        """
+        Wait for a deployment to finish
+
+        Polls `get` with backoff until the deployment is `Complete`, `Error`
+        or `Cancelled`, see `core.polling`
+
+        GET /doc_project/{doc_name}/deployment/{deployment_id}
+
+        Args:
+            deployment_id: str
+            doc_name: Unique project name or the uuid
+            timeout: Seconds to wait before raising `PollTimeout`
+            policy: Polling delays and request budget
+            on_status: Called with the key, deployment and previous status
+                whenever the deployment is seen with a new status
+            request_options: Additional options to customize the HTTP requests
+
+        Returns:
+            Deployment in its terminal status
+
+        Raises:
+            PollTimeout: The deployment was still running at the deadline
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        deployment = await client.doc.deployment.trigger(doc_name="my-project", target="Preview")
+        await client.doc.deployment.wait_for(
+            deployment_id=deployment.id, doc_name="my-project", timeout=600
+        )
+        ```
+        """
+        done = await self.wait_for_many(
+            [(doc_name, deployment_id)],
+            timeout=timeout,
+            policy=policy,
+            on_status=on_status,
+            request_options=request_options,
+        )
+        return done[(doc_name, deployment_id)]
+
+    async def wait_for_many(
+        self,
+        deployments: typing.Iterable[DeploymentKey],
+        *,
+        timeout: typing.Optional[float] = None,
+        policy: typing.Optional[PollPolicy] = None,
+        max_requests: typing.Optional[int] = None,
+        on_status: typing.Optional[
+            typing.Callable[
+                [DeploymentKey, models.Deployment, typing.Optional[str]], None
+            ]
+        ] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Dict[DeploymentKey, models.Deployment]:
+        """
+        Wait for several deployments to finish
+
+        Polls all deployments from one scheduler: deployments of the same doc
+        project are read together with a single `list` request, and all
+        requests share the rate limit of `policy`, see `core.polling`
+
+        GET /doc_project/{doc_name}/deployment
+
+        Args:
+            deployments: `(doc_name, deployment_id)` pairs
+            timeout: Seconds to wait before raising `PollTimeout`
+            policy: Polling delays and request budget
+            max_requests: Requests after which `PollTimeout` is raised
+            on_status: Called with the key, deployment and previous status
+                whenever a deployment is seen with a new status
+            request_options: Additional options to customize the HTTP requests
+
+        Returns:
+            Deployment in its terminal status by `(doc_name, deployment_id)`
+
+        Raises:
+            PollTimeout: Deployments were still running at the deadline or
+                after `max_requests`
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        done = await client.doc.deployment.wait_for_many(
+            [("docs-a", id_a), ("docs-b", id_b)], timeout=600
+        )
+        failed = [key for key, d in done.items() if d.status != "Complete"]
+        ```
+        """
+
+        async def fetch_one(key: DeploymentKey) -> models.Deployment:
+            return await self.get(
+                doc_name=key[0], deployment_id=key[1], request_options=request_options
+            )
+
+        async def fetch_group(
+            doc_name: str, keys: typing.List[DeploymentKey]
+        ) -> typing.Dict[DeploymentKey, models.Deployment]:
+            listed = await self.list(doc_name=doc_name, request_options=request_options)
+            wanted = set(keys)
+            return {(doc_name, d.id): d for d in listed if (doc_name, d.id) in wanted}
+
+        return await apoll_until(
+            deployments,
+            fetch_one,
+            get_status=lambda d: d.status,
+            terminal=TERMINAL_STATUSES,
+            fetch_group=fetch_group,
+            group_of=lambda key: key[0],
+            policy=policy,
+            timeout=timeout,
+            max_requests=max_requests,
+            on_status=on_status,
+        )
@@ -2,18 +2,27 @@ import typing
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
 )
-from local_api_21_py.resources.doc.version.guide import AsyncGuideClient, GuideClient
 from local_api_21_py.types import models
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.doc.version.guide import (
+        AsyncGuideClient,
+        GuideClient,
+    )
+
 
 class VersionClient:
+    guide = LazyClient["GuideClient"](
+        "local_api_21_py.resources.doc.version.guide", "GuideClient"
+    )
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.guide = GuideClient(base_client=self._base_client)
 
     def list(
         self, *, doc_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -88,9 +97,12 @@ class VersionClient:
 
 
 class AsyncVersionClient:
+    guide = LazyClient["AsyncGuideClient"](
+        "local_api_21_py.resources.doc.version.guide", "AsyncGuideClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.guide = AsyncGuideClient(base_client=self._base_client)
 
     async def list(
         self, *, doc_name: str, request_options: typing.Optional[RequestOptions] = None
@@ -89,7 +89,6 @@ class GuideClient:
         )
         ```
         """
-        models.GuideWithChildren.model_rebuild(_types_namespace=models._types_namespace)
         return self._base_client.request(
             method="GET",
             path=f"/doc_project/{doc_name}/version/{doc_version}/guide",
@@ -396,7 +395,6 @@ class GuideClient:
         )
         ```
         """
-        models.GuideWithChildren.model_rebuild(_types_namespace=models._types_namespace)
         _json = to_encodable(
             item=data, dump_with=typing.List[params._SerializerReorderGuide]
         )
@@ -488,7 +486,6 @@ class AsyncGuideClient:
         )
         ```
         """
-        models.GuideWithChildren.model_rebuild(_types_namespace=models._types_namespace)
         return await self._base_client.request(
             method="GET",
             path=f"/doc_project/{doc_name}/version/{doc_version}/guide",
@@ -795,7 +792,6 @@ class AsyncGuideClient:
         )
         ```
         """
-        models.GuideWithChildren.model_rebuild(_types_namespace=models._types_namespace)
         _json = to_encodable(
             item=data, dump_with=typing.List[params._SerializerReorderGuide]
         )
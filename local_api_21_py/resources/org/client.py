@@ -2,19 +2,25 @@ import typing
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
     to_encodable,
 )
-from local_api_21_py.resources.org.theme import AsyncThemeClient, ThemeClient
 from local_api_21_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.org.theme import AsyncThemeClient, ThemeClient
+
 
 class OrgClient:
+    theme = LazyClient["ThemeClient"](
+        "local_api_21_py.resources.org.theme", "ThemeClient"
+    )
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.theme = ThemeClient(base_client=self._base_client)
 
     def get(
         self, *, request_options: typing.Optional[RequestOptions] = None
@@ -93,9 +99,12 @@ class OrgClient:
 
 
 class AsyncOrgClient:
+    theme = LazyClient["AsyncThemeClient"](
+        "local_api_21_py.resources.org.theme", "AsyncThemeClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.theme = AsyncThemeClient(base_client=self._base_client)
 
     async def get(
         self, *, request_options: typing.Optional[RequestOptions] = None
@@ -5,6 +5,7 @@ import typing_extensions
 from local_api_21_py.core import (
     AsyncBaseClient,
     BinaryResponse,
+    LazyClient,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
@@ -14,16 +15,21 @@ from local_api_21_py.core import (
     to_encodable,
     type_utils,
 )
-from local_api_21_py.resources.sdk.config import AsyncConfigClient, ConfigClient
-from local_api_21_py.resources.sdk.doc import AsyncDocClient, DocClient
 from local_api_21_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.sdk.config import AsyncConfigClient, ConfigClient
+    from local_api_21_py.resources.sdk.doc import AsyncDocClient, DocClient
+
 
 class SdkClient:
+    config = LazyClient["ConfigClient"](
+        "local_api_21_py.resources.sdk.config", "ConfigClient"
+    )
+    doc = LazyClient["DocClient"]("local_api_21_py.resources.sdk.doc", "DocClient")
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.config = ConfigClient(base_client=self._base_client)
-        self.doc = DocClient(base_client=self._base_client)
 
     def list(
         self,
@@ -252,10 +258,15 @@ class SdkClient:
 
 
 class AsyncSdkClient:
+    config = LazyClient["AsyncConfigClient"](
+        "local_api_21_py.resources.sdk.config", "AsyncConfigClient"
+    )
+    doc = LazyClient["AsyncDocClient"](
+        "local_api_21_py.resources.sdk.doc", "AsyncDocClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.config = AsyncConfigClient(base_client=self._base_client)
-        self.doc = AsyncDocClient(base_client=self._base_client)
 
     async def list(
         self,
@@ -4,19 +4,23 @@ import typing_extensions
 
 from local_api_21_py.core import (
     AsyncBaseClient,
+    LazyClient,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
     to_encodable,
 )
-from local_api_21_py.resources.user.me import AsyncMeClient, MeClient
 from local_api_21_py.types import params
 
+if typing.TYPE_CHECKING:
+    from local_api_21_py.resources.user.me import AsyncMeClient, MeClient
+
 
 class UserClient:
+    me = LazyClient["MeClient"]("local_api_21_py.resources.user.me", "MeClient")
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.me = MeClient(base_client=self._base_client)
 
     def invite(
         self,
@@ -74,9 +78,12 @@ class UserClient:
 
 
 class AsyncUserClient:
+    me = LazyClient["AsyncMeClient"](
+        "local_api_21_py.resources.user.me", "AsyncMeClient"
+    )
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.me = AsyncMeClient(base_client=self._base_client)
 
     async def invite(
         self,
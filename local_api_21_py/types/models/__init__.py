@@ -1,53 +1,57 @@
-from .api import Api
-from .api_link import ApiLink
-from .api_link_api_version import ApiLinkApiVersion
-from .api_link_doc_version import ApiLinkDocVersion
-from .api_link_group import ApiLinkGroup
-from .api_link_group_reorder import ApiLinkGroupReorder
-from .api_link_reorder import ApiLinkReorder
-from .api_mock_server import ApiMockServer
-from .api_reorder import ApiReorder
-from .api_spec import ApiSpec
-from .api_spec_stats import ApiSpecStats
-from .api_spec_stats_lint_errors import ApiSpecStatsLintErrors
-from .asset import Asset
-from .cli_update import CliUpdate
-from .deployment import Deployment
-from .doc_preview_password import DocPreviewPassword
-from .doc_project import DocProject
-from .doc_project_action_button import DocProjectActionButton
-from .doc_project_domains import DocProjectDomains
-from .doc_project_logos import DocProjectLogos
-from .doc_project_metadata import DocProjectMetadata
-from .doc_project_settings import DocProjectSettings
-from .doc_version import DocVersion
-from .guide import Guide
-from .guide_content import GuideContent
-from .guide_href import GuideHref
-from .guide_with_children import GuideWithChildren
-from .health_check_response import HealthCheckResponse
-from .health_ping_response import HealthPingResponse
-from .lint_error_details import LintErrorDetails
-from .lint_location import LintLocation
-from .lint_report import LintReport
-from .lint_result import LintResult
-from .lint_summary import LintSummary
-from .list_assets_page import ListAssetsPage
-from .module_doc import ModuleDoc
-from .open_api import OpenApi
-from .organization import Organization
-from .organization_features import OrganizationFeatures
-from .organization_with_redirect import OrganizationWithRedirect
-from .pagination import Pagination
-from .role import Role
-from .role_definition import RoleDefinition
-from .sdk_doc_response import SdkDocResponse
-from .sdk_generation import SdkGeneration
-from .theme import Theme
-from .theme_values import ThemeValues
-from .user import User
-from .user_api_key import UserApiKey
-from .validation import Validation
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .api import Api
+    from .api_link import ApiLink
+    from .api_link_api_version import ApiLinkApiVersion
+    from .api_link_doc_version import ApiLinkDocVersion
+    from .api_link_group import ApiLinkGroup
+    from .api_link_group_reorder import ApiLinkGroupReorder
+    from .api_link_reorder import ApiLinkReorder
+    from .api_mock_server import ApiMockServer
+    from .api_reorder import ApiReorder
+    from .api_spec import ApiSpec
+    from .api_spec_stats import ApiSpecStats
+    from .api_spec_stats_lint_errors import ApiSpecStatsLintErrors
+    from .asset import Asset
+    from .cli_update import CliUpdate
+    from .deployment import Deployment
+    from .doc_preview_password import DocPreviewPassword
+    from .doc_project import DocProject
+    from .doc_project_action_button import DocProjectActionButton
+    from .doc_project_domains import DocProjectDomains
+    from .doc_project_logos import DocProjectLogos
+    from .doc_project_metadata import DocProjectMetadata
+    from .doc_project_settings import DocProjectSettings
+    from .doc_version import DocVersion
+    from .guide import Guide
+    from .guide_content import GuideContent
+    from .guide_href import GuideHref
+    from .guide_with_children import GuideWithChildren
+    from .health_check_response import HealthCheckResponse
+    from .health_ping_response import HealthPingResponse
+    from .lint_error_details import LintErrorDetails
+    from .lint_location import LintLocation
+    from .lint_report import LintReport
+    from .lint_result import LintResult
+    from .lint_summary import LintSummary
+    from .list_assets_page import ListAssetsPage
+    from .module_doc import ModuleDoc
+    from .open_api import OpenApi
+    from .organization import Organization
+    from .organization_features import OrganizationFeatures
+    from .organization_with_redirect import OrganizationWithRedirect
+    from .pagination import Pagination
+    from .role import Role
+    from .role_definition import RoleDefinition
+    from .sdk_doc_response import SdkDocResponse
+    from .sdk_generation import SdkGeneration
+    from .theme import Theme
+    from .theme_values import ThemeValues
+    from .user import User
+    from .user_api_key import UserApiKey
+    from .validation import Validation
 
 
 __all__ = [
@@ -103,56 +107,72 @@ __all__ = [
     "Validation",
 ]
 
-
-_types_namespace = {
-    "HealthCheckResponse": HealthCheckResponse,
-    "HealthPingResponse": HealthPingResponse,
-    "Api": Api,
-    "ApiSpec": ApiSpec,
-    "ApiMockServer": ApiMockServer,
-    "OpenApi": OpenApi,
-    "Validation": Validation,
-    "ApiSpecStats": ApiSpecStats,
-    "ApiSpecStatsLintErrors": ApiSpecStatsLintErrors,
-    "LintErrorDetails": LintErrorDetails,
-    "ApiLink": ApiLink,
-    "ApiLinkApiVersion": ApiLinkApiVersion,
-    "ApiLinkDocVersion": ApiLinkDocVersion,
-    "ApiLinkGroup": ApiLinkGroup,
-    "UserApiKey": UserApiKey,
-    "CliUpdate": CliUpdate,
-    "DocProject": DocProject,
-    "DocVersion": DocVersion,
-    "DocProjectDomains": DocProjectDomains,
-    "DocProjectLogos": DocProjectLogos,
-    "Asset": Asset,
-    "DocProjectSettings": DocProjectSettings,
-    "DocProjectActionButton": DocProjectActionButton,
-    "DocProjectMetadata": DocProjectMetadata,
-    "Deployment": Deployment,
-    "DocPreviewPassword": DocPreviewPassword,
-    "Theme": Theme,
-    "ThemeValues": ThemeValues,
-    "GuideWithChildren": GuideWithChildren,
-    "Guide": Guide,
-    "GuideHref": GuideHref,
-    "GuideContent": GuideContent,
-    "Organization": Organization,
-    "OrganizationFeatures": OrganizationFeatures,
-    "ListAssetsPage": ListAssetsPage,
-    "Pagination": Pagination,
-    "Role": Role,
-    "RoleDefinition": RoleDefinition,
-    "User": User,
-    "SdkGeneration": SdkGeneration,
-    "ApiReorder": ApiReorder,
-    "ApiLinkGroupReorder": ApiLinkGroupReorder,
-    "ApiLinkReorder": ApiLinkReorder,
-    "LintReport": LintReport,
-    "LintResult": LintResult,
-    "LintLocation": LintLocation,
-    "LintSummary": LintSummary,
-    "OrganizationWithRedirect": OrganizationWithRedirect,
-    "SdkDocResponse": SdkDocResponse,
-    "ModuleDoc": ModuleDoc,
+_lazy_imports = {
+    "Api": ".api",
+    "ApiLink": ".api_link",
+    "ApiLinkApiVersion": ".api_link_api_version",
+    "ApiLinkDocVersion": ".api_link_doc_version",
+    "ApiLinkGroup": ".api_link_group",
+    "ApiLinkGroupReorder": ".api_link_group_reorder",
+    "ApiLinkReorder": ".api_link_reorder",
+    "ApiMockServer": ".api_mock_server",
+    "ApiReorder": ".api_reorder",
+    "ApiSpec": ".api_spec",
+    "ApiSpecStats": ".api_spec_stats",
+    "ApiSpecStatsLintErrors": ".api_spec_stats_lint_errors",
+    "Asset": ".asset",
+    "CliUpdate": ".cli_update",
+    "Deployment": ".deployment",
+    "DocPreviewPassword": ".doc_preview_password",
+    "DocProject": ".doc_project",
+    "DocProjectActionButton": ".doc_project_action_button",
+    "DocProjectDomains": ".doc_project_domains",
+    "DocProjectLogos": ".doc_project_logos",
+    "DocProjectMetadata": ".doc_project_metadata",
+    "DocProjectSettings": ".doc_project_settings",
+    "DocVersion": ".doc_version",
+    "Guide": ".guide",
+    "GuideContent": ".guide_content",
+    "GuideHref": ".guide_href",
+    "GuideWithChildren": ".guide_with_children",
+    "HealthCheckResponse": ".health_check_response",
+    "HealthPingResponse": ".health_ping_response",
+    "LintErrorDetails": ".lint_error_details",
+    "LintLocation": ".lint_location",
+    "LintReport": ".lint_report",
+    "LintResult": ".lint_result",
+    "LintSummary": ".lint_summary",
+    "ListAssetsPage": ".list_assets_page",
+    "ModuleDoc": ".module_doc",
+    "OpenApi": ".open_api",
+    "Organization": ".organization",
+    "OrganizationFeatures": ".organization_features",
+    "OrganizationWithRedirect": ".organization_with_redirect",
+    "Pagination": ".pagination",
+    "Role": ".role",
+    "RoleDefinition": ".role_definition",
+    "SdkDocResponse": ".sdk_doc_response",
+    "SdkGeneration": ".sdk_generation",
+    "Theme": ".theme",
+    "ThemeValues": ".theme_values",
+    "User": ".user",
+    "UserApiKey": ".user_api_key",
+    "Validation": ".validation",
 }
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "_types_namespace":
+        namespace = {n: __getattr__(n) for n in __all__}
+        globals()[name] = namespace
+        return namespace
+    module = _lazy_imports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return [*globals(), *_lazy_imports]
@@ -13,6 +13,7 @@ class ApiLink(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_version: ApiLinkApiVersion = pydantic.Field(
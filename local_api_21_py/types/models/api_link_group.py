@@ -9,6 +9,7 @@ class ApiLinkGroup(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     doc_version_id: str = pydantic.Field(
@@ -12,6 +12,7 @@ class ApiSpecStatsLintErrors(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     incorrect_examples: typing.List[LintErrorDetails] = pydantic.Field(
@@ -9,6 +9,7 @@ class Asset(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     extension: str = pydantic.Field(
@@ -13,6 +13,7 @@ class Deployment(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     created_at: str = pydantic.Field(
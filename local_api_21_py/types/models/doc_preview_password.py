@@ -9,6 +9,7 @@ class DocPreviewPassword(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: str = pydantic.Field(
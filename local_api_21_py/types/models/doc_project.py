@@ -14,6 +14,7 @@ class DocProject(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     created_at: str = pydantic.Field(
@@ -10,6 +10,7 @@ class DocProjectActionButton(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     enabled: bool = pydantic.Field(
@@ -12,6 +12,7 @@ class DocProjectLogos(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     dark: typing.Optional[Asset] = pydantic.Field(
@@ -12,6 +12,7 @@ class Guide(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     created_at: str = pydantic.Field(
@@ -9,6 +9,7 @@ class LintLocation(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     end_column: int = pydantic.Field(
@@ -13,6 +13,7 @@ class LintReport(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     results: typing.List[LintResult] = pydantic.Field(
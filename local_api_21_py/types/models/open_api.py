@@ -13,6 +13,7 @@ class OpenApi(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     extension: typing_extensions.Literal["json", "yaml"] = pydantic.Field(
@@ -9,6 +9,7 @@ class OrganizationFeatures(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     allow_sdk_cli: bool = pydantic.Field(
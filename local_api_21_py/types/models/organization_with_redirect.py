@@ -11,6 +11,7 @@ class OrganizationWithRedirect(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     organization: Organization = pydantic.Field(
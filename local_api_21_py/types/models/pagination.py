@@ -9,6 +9,7 @@ class Pagination(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     page: int = pydantic.Field(
@@ -10,6 +10,7 @@ class SdkGeneration(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_version_id: str = pydantic.Field(
@@ -10,6 +10,7 @@ class ThemeValues(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_reference_group_variant: typing.Optional[str] = pydantic.Field(
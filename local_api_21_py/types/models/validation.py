@@ -10,6 +10,7 @@ class Validation(pydantic.BaseModel):
     model_config = pydantic.ConfigDict(
         arbitrary_types_allowed=True,
         populate_by_name=True,
+        defer_build=True,
     )
 
     message: str = pydantic.Field(
@@ -1,61 +1,74 @@
-from .api_link_group_reorder import ApiLinkGroupReorder, _SerializerApiLinkGroupReorder
-from .api_link_reorder import ApiLinkReorder, _SerializerApiLinkReorder
-from .api_reorder import ApiReorder, _SerializerApiReorder
-from .doc_preview_password_name import (
-    DocPreviewPasswordName,
-    _SerializerDocPreviewPasswordName,
-)
-from .file import File, _SerializerFile
-from .init_sdk_config import InitSdkConfig, _SerializerInitSdkConfig
-from .invite import Invite, _SerializerInvite
-from .latest_api_link_policy import LatestApiLinkPolicy, _SerializerLatestApiLinkPolicy
-from .new_api import NewApi, _SerializerNewApi
-from .new_api_link import NewApiLink, _SerializerNewApiLink
-from .new_api_link_group import NewApiLinkGroup, _SerializerNewApiLinkGroup
-from .new_api_spec import NewApiSpec, _SerializerNewApiSpec
-from .new_api_with_version import NewApiWithVersion, _SerializerNewApiWithVersion
-from .new_deployment import NewDeployment, _SerializerNewDeployment
-from .new_doc_project import NewDocProject, _SerializerNewDocProject
-from .new_guide import NewGuide, _SerializerNewGuide
-from .new_lint import NewLint, _SerializerNewLint
-from .new_organization import NewOrganization, _SerializerNewOrganization
-from .new_role import NewRole, _SerializerNewRole
-from .new_sdk import NewSdk, _SerializerNewSdk
-from .new_service_account import NewServiceAccount, _SerializerNewServiceAccount
-from .object_role import ObjectRole, _SerializerObjectRole
-from .pinned_api_link_policy import PinnedApiLinkPolicy, _SerializerPinnedApiLinkPolicy
-from .reorder_guide import ReorderGuide, _SerializerReorderGuide
-from .sdk_doc_request import SdkDocRequest, _SerializerSdkDocRequest
-from .sync_sdk_config import SyncSdkConfig, _SerializerSyncSdkConfig
-from .theme_values import ThemeValues, _SerializerThemeValues
-from .update_api import UpdateApi, _SerializerUpdateApi
-from .update_api_link import UpdateApiLink, _SerializerUpdateApiLink
-from .update_api_link_api_version import (
-    UpdateApiLinkApiVersion,
-    _SerializerUpdateApiLinkApiVersion,
-)
-from .update_api_link_group import UpdateApiLinkGroup, _SerializerUpdateApiLinkGroup
-from .update_api_spec import UpdateApiSpec, _SerializerUpdateApiSpec
-from .update_asset import UpdateAsset, _SerializerUpdateAsset
-from .update_doc_project import UpdateDocProject, _SerializerUpdateDocProject
-from .update_doc_project_logos import (
-    UpdateDocProjectLogos,
-    _SerializerUpdateDocProjectLogos,
-)
-from .update_doc_project_settings import (
-    UpdateDocProjectSettings,
-    _SerializerUpdateDocProjectSettings,
-)
-from .update_doc_project_settings_action_button import (
-    UpdateDocProjectSettingsActionButton,
-    _SerializerUpdateDocProjectSettingsActionButton,
-)
-from .update_doc_project_settings_metadata import (
-    UpdateDocProjectSettingsMetadata,
-    _SerializerUpdateDocProjectSettingsMetadata,
-)
-from .update_guide import UpdateGuide, _SerializerUpdateGuide
-from .update_sdk import UpdateSdk, _SerializerUpdateSdk
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .api_link_group_reorder import (
+        ApiLinkGroupReorder,
+        _SerializerApiLinkGroupReorder,
+    )
+    from .api_link_reorder import ApiLinkReorder, _SerializerApiLinkReorder
+    from .api_reorder import ApiReorder, _SerializerApiReorder
+    from .doc_preview_password_name import (
+        DocPreviewPasswordName,
+        _SerializerDocPreviewPasswordName,
+    )
+    from .file import File, _SerializerFile
+    from .init_sdk_config import InitSdkConfig, _SerializerInitSdkConfig
+    from .invite import Invite, _SerializerInvite
+    from .latest_api_link_policy import (
+        LatestApiLinkPolicy,
+        _SerializerLatestApiLinkPolicy,
+    )
+    from .new_api import NewApi, _SerializerNewApi
+    from .new_api_link import NewApiLink, _SerializerNewApiLink
+    from .new_api_link_group import NewApiLinkGroup, _SerializerNewApiLinkGroup
+    from .new_api_spec import NewApiSpec, _SerializerNewApiSpec
+    from .new_api_with_version import NewApiWithVersion, _SerializerNewApiWithVersion
+    from .new_deployment import NewDeployment, _SerializerNewDeployment
+    from .new_doc_project import NewDocProject, _SerializerNewDocProject
+    from .new_guide import NewGuide, _SerializerNewGuide
+    from .new_lint import NewLint, _SerializerNewLint
+    from .new_organization import NewOrganization, _SerializerNewOrganization
+    from .new_role import NewRole, _SerializerNewRole
+    from .new_sdk import NewSdk, _SerializerNewSdk
+    from .new_service_account import NewServiceAccount, _SerializerNewServiceAccount
+    from .object_role import ObjectRole, _SerializerObjectRole
+    from .pinned_api_link_policy import (
+        PinnedApiLinkPolicy,
+        _SerializerPinnedApiLinkPolicy,
+    )
+    from .reorder_guide import ReorderGuide, _SerializerReorderGuide
+    from .sdk_doc_request import SdkDocRequest, _SerializerSdkDocRequest
+    from .sync_sdk_config import SyncSdkConfig, _SerializerSyncSdkConfig
+    from .theme_values import ThemeValues, _SerializerThemeValues
+    from .update_api import UpdateApi, _SerializerUpdateApi
+    from .update_api_link import UpdateApiLink, _SerializerUpdateApiLink
+    from .update_api_link_api_version import (
+        UpdateApiLinkApiVersion,
+        _SerializerUpdateApiLinkApiVersion,
+    )
+    from .update_api_link_group import UpdateApiLinkGroup, _SerializerUpdateApiLinkGroup
+    from .update_api_spec import UpdateApiSpec, _SerializerUpdateApiSpec
+    from .update_asset import UpdateAsset, _SerializerUpdateAsset
+    from .update_doc_project import UpdateDocProject, _SerializerUpdateDocProject
+    from .update_doc_project_logos import (
+        UpdateDocProjectLogos,
+        _SerializerUpdateDocProjectLogos,
+    )
+    from .update_doc_project_settings import (
+        UpdateDocProjectSettings,
+        _SerializerUpdateDocProjectSettings,
+    )
+    from .update_doc_project_settings_action_button import (
+        UpdateDocProjectSettingsActionButton,
+        _SerializerUpdateDocProjectSettingsActionButton,
+    )
+    from .update_doc_project_settings_metadata import (
+        UpdateDocProjectSettingsMetadata,
+        _SerializerUpdateDocProjectSettingsMetadata,
+    )
+    from .update_guide import UpdateGuide, _SerializerUpdateGuide
+    from .update_sdk import UpdateSdk, _SerializerUpdateSdk
 
 
 __all__ = [
@@ -140,3 +153,99 @@ __all__ = [
     "_SerializerUpdateGuide",
     "_SerializerUpdateSdk",
 ]
+
+_lazy_imports = {
+    "ApiLinkGroupReorder": ".api_link_group_reorder",
+    "_SerializerApiLinkGroupReorder": ".api_link_group_reorder",
+    "ApiLinkReorder": ".api_link_reorder",
+    "_SerializerApiLinkReorder": ".api_link_reorder",
+    "ApiReorder": ".api_reorder",
+    "_SerializerApiReorder": ".api_reorder",
+    "DocPreviewPasswordName": ".doc_preview_password_name",
+    "_SerializerDocPreviewPasswordName": ".doc_preview_password_name",
+    "File": ".file",
+    "_SerializerFile": ".file",
+    "InitSdkConfig": ".init_sdk_config",
+    "_SerializerInitSdkConfig": ".init_sdk_config",
+    "Invite": ".invite",
+    "_SerializerInvite": ".invite",
+    "LatestApiLinkPolicy": ".latest_api_link_policy",
+    "_SerializerLatestApiLinkPolicy": ".latest_api_link_policy",
+    "NewApi": ".new_api",
+    "_SerializerNewApi": ".new_api",
+    "NewApiLink": ".new_api_link",
+    "_SerializerNewApiLink": ".new_api_link",
+    "NewApiLinkGroup": ".new_api_link_group",
+    "_SerializerNewApiLinkGroup": ".new_api_link_group",
+    "NewApiSpec": ".new_api_spec",
+    "_SerializerNewApiSpec": ".new_api_spec",
+    "NewApiWithVersion": ".new_api_with_version",
+    "_SerializerNewApiWithVersion": ".new_api_with_version",
+    "NewDeployment": ".new_deployment",
+    "_SerializerNewDeployment": ".new_deployment",
+    "NewDocProject": ".new_doc_project",
+    "_SerializerNewDocProject": ".new_doc_project",
+    "NewGuide": ".new_guide",
+    "_SerializerNewGuide": ".new_guide",
+    "NewLint": ".new_lint",
+    "_SerializerNewLint": ".new_lint",
+    "NewOrganization": ".new_organization",
+    "_SerializerNewOrganization": ".new_organization",
+    "NewRole": ".new_role",
+    "_SerializerNewRole": ".new_role",
+    "NewSdk": ".new_sdk",
+    "_SerializerNewSdk": ".new_sdk",
+    "NewServiceAccount": ".new_service_account",
+    "_SerializerNewServiceAccount": ".new_service_account",
+    "ObjectRole": ".object_role",
+    "_SerializerObjectRole": ".object_role",
+    "PinnedApiLinkPolicy": ".pinned_api_link_policy",
+    "_SerializerPinnedApiLinkPolicy": ".pinned_api_link_policy",
+    "ReorderGuide": ".reorder_guide",
+    "_SerializerReorderGuide": ".reorder_guide",
+    "SdkDocRequest": ".sdk_doc_request",
+    "_SerializerSdkDocRequest": ".sdk_doc_request",
+    "SyncSdkConfig": ".sync_sdk_config",
+    "_SerializerSyncSdkConfig": ".sync_sdk_config",
+    "ThemeValues": ".theme_values",
+    "_SerializerThemeValues": ".theme_values",
+    "UpdateApi": ".update_api",
+    "_SerializerUpdateApi": ".update_api",
+    "UpdateApiLink": ".update_api_link",
+    "_SerializerUpdateApiLink": ".update_api_link",
+    "UpdateApiLinkApiVersion": ".update_api_link_api_version",
+    "_SerializerUpdateApiLinkApiVersion": ".update_api_link_api_version",
+    "UpdateApiLinkGroup": ".update_api_link_group",
+    "_SerializerUpdateApiLinkGroup": ".update_api_link_group",
+    "UpdateApiSpec": ".update_api_spec",
+    "_SerializerUpdateApiSpec": ".update_api_spec",
+    "UpdateAsset": ".update_asset",
+    "_SerializerUpdateAsset": ".update_asset",
+    "UpdateDocProject": ".update_doc_project",
+    "_SerializerUpdateDocProject": ".update_doc_project",
+    "UpdateDocProjectLogos": ".update_doc_project_logos",
+    "_SerializerUpdateDocProjectLogos": ".update_doc_project_logos",
+    "UpdateDocProjectSettings": ".update_doc_project_settings",
+    "_SerializerUpdateDocProjectSettings": ".update_doc_project_settings",
+    "UpdateDocProjectSettingsActionButton": ".update_doc_project_settings_action_button",
+    "_SerializerUpdateDocProjectSettingsActionButton": ".update_doc_project_settings_action_button",
+    "UpdateDocProjectSettingsMetadata": ".update_doc_project_settings_metadata",
+    "_SerializerUpdateDocProjectSettingsMetadata": ".update_doc_project_settings_metadata",
+    "UpdateGuide": ".update_guide",
+    "_SerializerUpdateGuide": ".update_guide",
+    "UpdateSdk": ".update_sdk",
+    "_SerializerUpdateSdk": ".update_sdk",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _lazy_imports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return [*globals(), *_lazy_imports]
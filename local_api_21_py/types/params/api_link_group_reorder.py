@@ -20,6 +20,7 @@ class _SerializerApiLinkGroupReorder(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     id: str = pydantic.Field(
@@ -22,6 +22,7 @@ class _SerializerApiLinkReorder(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     group_id: str = pydantic.Field(
@@ -26,6 +26,7 @@ class _SerializerApiReorder(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     doc_version_id: str = pydantic.Field(
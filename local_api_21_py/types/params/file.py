@@ -20,6 +20,7 @@ class _SerializerFile(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     file: typing.Optional[typing.Any] = pydantic.Field(
@@ -36,6 +36,7 @@ class _SerializerInitSdkConfig(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_name: str = pydantic.Field(
@@ -32,6 +32,7 @@ class _SerializerInvite(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     email: str = pydantic.Field(
@@ -39,6 +39,7 @@ class _SerializerNewApiLink(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     build_request_enabled: typing.Optional[bool] = pydantic.Field(
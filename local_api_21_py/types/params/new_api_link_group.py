@@ -22,6 +22,7 @@ class _SerializerNewApiLinkGroup(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     doc_version_id: str = pydantic.Field(
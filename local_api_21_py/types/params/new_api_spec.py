@@ -50,6 +50,7 @@ class _SerializerNewApiSpec(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     allow_lint_errors: typing.Optional[bool] = pydantic.Field(
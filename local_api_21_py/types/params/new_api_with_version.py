@@ -52,6 +52,7 @@ class _SerializerNewApiWithVersion(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: str = pydantic.Field(
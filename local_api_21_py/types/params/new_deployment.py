@@ -23,6 +23,7 @@ class _SerializerNewDeployment(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     doc_version_id: typing.Optional[str] = pydantic.Field(
@@ -18,6 +18,7 @@ class _SerializerNewDocProject(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: str = pydantic.Field(
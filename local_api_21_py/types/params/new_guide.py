@@ -44,6 +44,7 @@ class _SerializerNewGuide(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     content: str = pydantic.Field(
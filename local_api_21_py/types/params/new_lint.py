@@ -32,6 +32,7 @@ class _SerializerNewLint(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_name: typing.Optional[str] = pydantic.Field(alias="api_name", default=None)
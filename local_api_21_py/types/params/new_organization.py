@@ -20,6 +20,7 @@ class _SerializerNewOrganization(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: str = pydantic.Field(
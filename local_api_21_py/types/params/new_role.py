@@ -47,6 +47,7 @@ class _SerializerNewRole(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     object_id: str = pydantic.Field(
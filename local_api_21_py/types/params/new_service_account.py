@@ -28,6 +28,7 @@ class _SerializerNewServiceAccount(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     expiration: typing.Optional[str] = pydantic.Field(alias="expiration", default=None)
@@ -39,6 +39,7 @@ class _SerializerObjectRole(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     object_id: str = pydantic.Field(
@@ -22,6 +22,7 @@ class _SerializerPinnedApiLinkPolicy(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_id: str = pydantic.Field(
@@ -23,6 +23,7 @@ class _SerializerReorderGuide(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     id: str = pydantic.Field(
@@ -22,6 +22,7 @@ class _SerializerSdkDocRequest(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     modules_filter: typing.Optional[typing.List[str]] = pydantic.Field(
@@ -35,6 +35,7 @@ class _SerializerSyncSdkConfig(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_version: typing.Optional[
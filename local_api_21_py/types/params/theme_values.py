@@ -72,6 +72,7 @@ class _SerializerThemeValues(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_reference_group_variant: typing.Optional[str] = pydantic.Field(
@@ -19,6 +19,7 @@ class _SerializerUpdateApi(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: typing.Optional[str] = pydantic.Field(alias="name", default=None)
@@ -43,6 +43,7 @@ class _SerializerUpdateApiLink(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_version: typing.Optional[_SerializerUpdateApiLinkApiVersion] = pydantic.Field(
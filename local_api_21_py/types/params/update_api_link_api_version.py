@@ -20,6 +20,7 @@ class _SerializerUpdateApiLinkApiVersion(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     api_id: str = pydantic.Field(
@@ -21,6 +21,7 @@ class _SerializerUpdateApiLinkGroup(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     nav_label: typing.Optional[str] = pydantic.Field(alias="nav_label", default=None)
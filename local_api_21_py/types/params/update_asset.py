@@ -22,6 +22,7 @@ class _SerializerUpdateAsset(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     name: typing.Optional[str] = pydantic.Field(alias="name", default=None)
@@ -32,6 +32,7 @@ class _SerializerUpdateDocProject(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     logos: typing.Optional[_SerializerUpdateDocProjectLogos] = pydantic.Field(
@@ -32,6 +32,7 @@ class _SerializerUpdateDocProjectLogos(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     dark: typing.Optional[str] = pydantic.Field(alias="dark", default=None)
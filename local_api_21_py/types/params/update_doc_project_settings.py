@@ -30,6 +30,7 @@ class _SerializerUpdateDocProjectSettings(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     action_button: typing.Optional[_SerializerUpdateDocProjectSettingsActionButton] = (
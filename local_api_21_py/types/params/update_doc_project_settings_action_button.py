@@ -23,6 +23,7 @@ class _SerializerUpdateDocProjectSettingsActionButton(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     enabled: typing.Optional[bool] = pydantic.Field(alias="enabled", default=None)
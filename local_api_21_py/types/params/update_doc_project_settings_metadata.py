@@ -21,6 +21,7 @@ class _SerializerUpdateDocProjectSettingsMetadata(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     description: typing.Optional[str] = pydantic.Field(
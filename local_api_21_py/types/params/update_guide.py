@@ -40,6 +40,7 @@ class _SerializerUpdateGuide(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     content: typing.Optional[str] = pydantic.Field(alias="content", default=None)
@@ -54,6 +54,7 @@ class _SerializerUpdateSdk(pydantic.BaseModel):
 
     model_config = pydantic.ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
     allow_lint_errors: typing.Optional[bool] = pydantic.Field(
@@ -0,0 +1,140 @@
+import concurrent.futures
+import threading
+import types
+import typing
+
+import httpx
+import pydantic
+
+from local_api_21_py.core import BinaryResponse, request_adapters, response_adapters
+
+"""
+Explicit compilation of the pydantic validators used by API operations.
+
+Models and request serializers are declared with `defer_build=True`, so
+importing them is cheap and a validator is compiled the first time an
+operation sends or receives the type. Short scripts never pay for schemas
+they do not use, long-lived services can move the cost of the operations
+they serve out of their first requests:
+
+```py
+client = Client(...)
+warm_up(["doc.deployment.get", client.doc.deployment.trigger], background=True)
+```
+"""
+
+Operation = typing.Union[str, typing.Callable[..., typing.Any]]
+
+# response types that are returned without pydantic validation
+_UNVALIDATED = (type(None), BinaryResponse, httpx.Response)
+
+
+def _operation_types(
+    table: types.ModuleType, name: str
+) -> typing.Tuple[typing.List[typing.Any], typing.List[typing.Any]]:
+    """Request and response types validated by an operation or helper"""
+    if name in table.HELPERS:
+        requests: typing.List[typing.Any] = []
+        responses: typing.List[typing.Any] = []
+        for sent in table.HELPERS[name]:
+            more = _operation_types(table, sent)
+            requests += more[0]
+            responses += more[1]
+        return requests, responses
+
+    operation = table.OPERATIONS[name]
+    responses = [] if operation.cast_to in _UNVALIDATED else [operation.cast_to]
+    return list(operation.dump_with), responses
+
+
+def operation_types(operations: typing.Iterable[Operation]) -> typing.List[typing.Any]:
+    """
+    Lists the request and response types the given operations validate.
+
+    Types are read from `operations.OPERATIONS`: the `dump_with` types of the request
+    bodies and the `cast_to` type of the responses, eg
+    `List[models.Deployment]`, keyed like the adapters the requests use.
+    Helpers such as `wait_for` list the types of the operations they send.
+
+    Args:
+        operations: Bound methods such as `client.doc.deployment.get`, or
+            their dotted paths from the client such as `"doc.deployment.get"`
+
+    Returns:
+        Request serializers followed by response types, in first-use order
+        and without duplicates
+    """
+    requests, responses = _collect(operations)
+    return requests + [tp for tp in responses if tp not in requests]
+
+
+def _collect(
+    operations: typing.Optional[typing.Iterable[Operation]],
+) -> typing.Tuple[typing.List[typing.Any], typing.List[typing.Any]]:
+    # the operation table references every model, it is imported on first use
+    # so importing the package stays lazy
+    from local_api_21_py import operations as table
+
+    requests: typing.Dict[typing.Any, None] = {}
+    responses: typing.Dict[typing.Any, None] = {}
+    for operation in table.OPERATIONS if operations is None else operations:
+        more = _operation_types(table, table.operation_name(operation))
+        requests.update(dict.fromkeys(more[0]))
+        responses.update(dict.fromkeys(more[1]))
+    return list(requests), list(responses)
+
+
+def _models_in(tp: typing.Any) -> typing.Iterator[type]:
+    if isinstance(tp, type) and issubclass(tp, pydantic.BaseModel):
+        yield tp
+    for arg in typing.get_args(tp):
+        yield from _models_in(arg)
+
+
+def _build(
+    requests: typing.List[typing.Any], responses: typing.List[typing.Any]
+) -> typing.List[typing.Any]:
+    for registry, tps in ((request_adapters, requests), (response_adapters, responses)):
+        for tp in tps:
+            for model in _models_in(tp):
+                if not model.__pydantic_complete__:
+                    model.model_rebuild()
+            registry.get(tp)
+    return requests + [tp for tp in responses if tp not in requests]
+
+
+def warm_up(
+    operations: typing.Optional[typing.Iterable[Operation]] = None,
+    *,
+    background: bool = False,
+) -> "concurrent.futures.Future[typing.List[typing.Any]]":
+    """
+    Compiles the validators of the given operations ahead of their first use.
+
+    Args:
+        operations: Operations to prepare, see `operation_types`. None
+            compiles the types of every operation of the API
+        background: Compile on a daemon thread and return immediately, so a
+            server can start accepting requests while the compilation runs
+
+    Returns:
+        Future resolving to the compiled types, already done unless
+        `background` is set
+    """
+    requests, responses = _collect(operations)
+
+    future: "concurrent.futures.Future[typing.List[typing.Any]]" = (
+        concurrent.futures.Future()
+    )
+    if not background:
+        future.set_result(_build(requests, responses))
+        return future
+
+    def target() -> None:
+        try:
+            future.set_result(_build(requests, responses))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="local_api_21_py-warm-up", daemon=True).start()
+    return future
@@ -0,0 +1,56 @@
+import inspect
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient
+from local_api_21_py.core import AsyncBaseClient, SyncBaseClient
+
+Handler = typing.Callable[[httpx.Request], typing.Any]
+
+
+def _async_handler(handler: Handler) -> Handler:
+    if inspect.iscoroutinefunction(handler):
+        return handler
+
+    async def read_then_handle(request: httpx.Request) -> httpx.Response:
+        # lets synchronous handlers call `request.read()` on streamed bodies
+        await request.aread()
+        return handler(request)
+
+    return read_then_handle
+
+
+@pytest.fixture
+def mock_client() -> typing.Callable[..., typing.Any]:
+    """
+    Factory of clients whose requests are answered by a `MockTransport` handler.
+
+    The handler is any `httpx.Request -> httpx.Response` callable, synchronous
+    handlers also serve asynchronous clients. Other keyword arguments are
+    passed to the client:
+
+    ```py
+    client = mock_client(server.handler, retry=FAST)
+    client = mock_client(server.handler, client_cls=AsyncBaseClient)
+    client = mock_client(handler, client_cls=Client)
+    ```
+    """
+
+    def build(
+        handler: Handler,
+        *,
+        client_cls: typing.Type[typing.Any] = SyncBaseClient,
+        base_url: str = "http://testserver",
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        httpx_client: typing.Union[httpx.Client, httpx.AsyncClient]
+        if issubclass(client_cls, (AsyncBaseClient, AsyncClient)):
+            transport = httpx.MockTransport(_async_handler(handler))
+            httpx_client = httpx.AsyncClient(transport=transport)
+        else:
+            httpx_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client_cls(base_url=base_url, httpx_client=httpx_client, **kwargs)
+
+    return build
@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import datetime
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import AsyncBaseClient, AuthBearer, OAuth2
+
+
+class TokenServer:
+    """Mock transport handler issuing numbered access tokens."""
+
+    def __init__(self, token_delay: float = 0) -> None:
+        self.token_requests = 0
+        self.token_delay = token_delay
+        self.seen_tokens: typing.List[str] = []
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            self.token_requests += 1
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": f"token-{self.token_requests}",
+                    "expires_in": 3600,
+                },
+            )
+        self.seen_tokens.append(request.headers["authorization"])
+        return httpx.Response(200, json={"ok": True})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            time.sleep(self.token_delay)
+        return self._response(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/token":
+            await asyncio.sleep(self.token_delay)
+        return self._response(request)
+
+
+def _oauth2() -> OAuth2:
+    return OAuth2(
+        base_url="http://testserver",
+        default_token_url="/oauth/token",
+        access_token_pointer="/access_token",
+        expires_in_pointer="/expires_in",
+        credentials_location="request_body",
+        body_content="form",
+        request_mutator=AuthBearer(),
+        form={
+            "client_id": "id",
+            "client_secret": "secret",
+            "grant_type": None,
+            "scope": None,
+            "token_url": None,
+        },
+    )
+
+
+def test_sync_refresh_uses_client_pool(mock_client):
+    """Token requests are sent through the client's httpx transport."""
+    server = TokenServer()
+    client = mock_client(server.handler)
+    client.register_auth("OAuth2", _oauth2())
+
+    client.request(method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"])
+    client.request(method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"])
+
+    assert server.token_requests == 1
+    assert server.seen_tokens == ["Bearer token-1", "Bearer token-1"]
+
+
+def test_expired_token_is_refreshed_through_client(mock_client, monkeypatch):
+    """A token expiring after `prepare` is refreshed with the client's HTTPX client."""
+    server = TokenServer()
+    standalone = httpx.Client(transport=httpx.MockTransport(server.handler))
+    monkeypatch.setattr(httpx, "post", standalone.post)
+    client = mock_client(server.handler)
+    oauth2 = _oauth2()
+    client.register_auth("OAuth2", oauth2)
+    # never prepared, the token is fetched on its own as before
+    cfg = client.build_request(method="GET", path="/", auth_names=["OAuth2"])
+    assert cfg["headers"]["Authorization"] == "Bearer token-1"
+
+    monkeypatch.setattr(httpx, "post", None)
+    oauth2.expires_at = datetime.datetime.now() - datetime.timedelta(seconds=1)
+    client.request(method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"])
+    oauth2.expires_at = datetime.datetime.now() - datetime.timedelta(seconds=1)
+    cfg = client.build_request(method="GET", path="/", auth_names=["OAuth2"])
+
+    assert server.token_requests == 3
+    assert cfg["headers"]["Authorization"] == "Bearer token-3"
+
+
+@pytest.mark.asyncio
+async def test_await_expired_token_is_not_refreshed_blocking(mock_client):
+    """Asynchronous clients never refresh a token on the event loop thread."""
+    server = TokenServer()
+    client = mock_client(server.async_handler, client_cls=AsyncBaseClient)
+    oauth2 = _oauth2()
+    client.register_auth("OAuth2", oauth2)
+    await client.request(
+        method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"]
+    )
+
+    # expired between `prepare_async` and `add_to_request`
+    oauth2.expires_at = datetime.datetime.now() - datetime.timedelta(seconds=1)
+    cfg = client.build_request(method="GET", path="/", auth_names=["OAuth2"])
+    assert cfg["headers"]["Authorization"] == "Bearer token-1"
+    assert server.token_requests == 1
+
+
+def test_threads_share_one_refresh(mock_client):
+    """Threads of a synchronous client wait for the token one of them fetches."""
+    server = TokenServer(token_delay=0.05)
+    client = mock_client(server.handler)
+    client.register_auth("OAuth2", _oauth2())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [
+            pool.submit(
+                client.request,
+                method="GET",
+                path="/",
+                cast_to=typing.Any,
+                auth_names=["OAuth2"],
+            )
+            for _ in range(16)
+        ]
+    assert all(f.exception() is None for f in futures)
+    assert server.token_requests == 1
+    assert set(server.seen_tokens) == {"Bearer token-1"}
+
+
+@pytest.mark.asyncio
+async def test_await_concurrent_requests_share_refresh(mock_client):
+    """Concurrent requests without a token wait on a single refresh."""
+    server = TokenServer(token_delay=0.05)
+    client = mock_client(server.async_handler, client_cls=AsyncBaseClient)
+    client.register_auth("OAuth2", _oauth2())
+
+    await asyncio.gather(
+        *[
+            client.request(
+                method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"]
+            )
+            for _ in range(10)
+        ]
+    )
+
+    assert server.token_requests == 1
+    assert set(server.seen_tokens) == {"Bearer token-1"}
+
+
+@pytest.mark.asyncio
+async def test_await_token_refreshed_in_background(mock_client):
+    """A token close to expiry is used while a refresh runs in the background."""
+    server = TokenServer(token_delay=0.05)
+    client = mock_client(server.async_handler, client_cls=AsyncBaseClient)
+    oauth2 = _oauth2()
+    oauth2.access_token = "token-0"
+    oauth2.expires_at = datetime.datetime.now() + datetime.timedelta(seconds=5)
+    client.register_auth("OAuth2", oauth2)
+
+    await client.request(
+        method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"]
+    )
+    assert server.seen_tokens == ["Bearer token-0"]
+
+    await asyncio.sleep(0.1)
+    await client.request(
+        method="GET", path="/", cast_to=typing.Any, auth_names=["OAuth2"]
+    )
+    assert server.token_requests == 1
+    assert server.seen_tokens[-1] == "Bearer token-1"
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient
+from local_api_21_py.core import AsyncRateLimiter, RateLimiter
+from local_api_21_py.core.batch import iter_batch, run_batch
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.started: typing.List[int] = []
+
+    async def call(self, value: int, delay: float = 0.0, fail: bool = False) -> int:
+        self.started.append(value)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise ValueError(value)
+            return value
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_results_keep_call_order_with_bounded_concurrency():
+    tracker = Tracker()
+    calls = [(lambda i=i: tracker.call(i, delay=0.001 * (i % 4))) for i in range(50)]
+    results = await run_batch(calls, concurrency=5)
+    assert results == list(range(50))
+    assert tracker.peak == 5
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_stops_starting_calls():
+    tracker = Tracker()
+    calls = [(lambda i=i: tracker.call(i, delay=0.01, fail=i == 0)) for i in range(20)]
+    with pytest.raises(ValueError):
+        await run_batch(calls, concurrency=2)
+    assert len(tracker.started) < 20
+    assert tracker.active == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_errors_and_awaitables():
+    tracker = Tracker()
+    calls = [tracker.call(i, fail=i % 3 == 0) for i in range(6)]
+    results = await run_batch(calls, concurrency=3, fail_fast=False)
+    assert [isinstance(r, ValueError) for r in results] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert results[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_results_stream_in_completion_order():
+    tracker = Tracker()
+    delays = [0.03, 0.0, 0.015]
+    calls = [(lambda i=i: tracker.call(i, delay=delays[i])) for i in range(3)]
+    order = [r.index async for r in iter_batch(calls, concurrency=3)]
+    assert order == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_call_starts():
+    tracker = Tracker()
+    start = time.monotonic()
+    await run_batch(
+        [(lambda i=i: tracker.call(i)) for i in range(6)],
+        concurrency=6,
+        rate_limit=AsyncRateLimiter(rate=100, burst=2),
+    )
+    # two calls start at once, the other four are spaced 10ms apart
+    assert time.monotonic() - start >= 0.035
+
+
+def test_sync_rate_limiter():
+    limiter = RateLimiter(rate=200)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_async_client_batch(mock_client):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True})
+
+    client = mock_client(handler, client_cls=AsyncClient)
+    pings = await client.batch(
+        [client.health.ping for _ in range(25)], concurrency=4, rate_limit=1000
+    )
+    assert len(pings) == 25
+    assert all(p.ok for p in pings)
@@ -0,0 +1,32 @@
+import pytest
+
+from local_api_21_py.bench.load import MODES, parse_mix, run_mode, schedule
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.bench.standin import StandIn
+
+
+def test_mix_schedule_is_weighted_and_repeatable():
+    mix = parse_mix("health.ping=3, doc.deployment.list")
+    assert mix == [("health.ping", 3.0), ("doc.deployment.list", 1.0)]
+    names = schedule(mix, 400, seed=1)
+    assert names == schedule(mix, 400, seed=1)
+    assert names.count("health.ping") > names.count("doc.deployment.list") > 0
+    with pytest.raises(ValueError):
+        parse_mix("doc.nope")
+
+
+@pytest.mark.parametrize("mode", list(MODES))
+def test_every_mode_reports(mode):
+    names = schedule(parse_mix("health.ping,doc.deployment.trigger"), 40, seed=0)
+    with LocalServer(StandIn(list_size=2).handler) as server:
+        result = run_mode(mode, server.base_url, names, concurrency=4)
+        paced = run_mode(mode, server.base_url, names[:10], concurrency=2, rate=200)
+    assert result["requests"] == 40
+    assert result["errors"] == 0
+    assert 0 < result["p50"] <= result["p95"] <= result["p99"]
+    assert result["throughput"] > 0
+    assert result["cpu_serialize"] > 0
+    assert result["peak_rss_mb"] > 0
+    # ten requests paced at 200/s take at least 45 ms
+    assert paced["requests"] == 10
+    assert paced["throughput"] < 10 / 0.045
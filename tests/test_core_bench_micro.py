@@ -0,0 +1,30 @@
+from local_api_21_py.bench.micro import build_cases, compare
+
+
+def test_every_case_runs_offline():
+    cases = build_cases(items=2)
+    names = [name for name, _ in cases]
+    assert len(names) == len(set(names))
+    for prefix in (
+        "build_request",
+        "process_response",
+        "from_encodable",
+        "to_encodable",
+        "encode_query_param.deepObject",
+        "sse",
+        "multipart",
+        "filter_not_given",
+    ):
+        assert any(n.startswith(prefix) for n in names), prefix
+    for _, fn in cases:
+        fn()
+
+
+def test_compare_flags_throughput_losses():
+    baseline = {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}
+    results = {
+        "a": {"ops_per_sec": 85.0},
+        "b": {"ops_per_sec": 70.0},
+        "new": {"ops_per_sec": 1.0},
+    }
+    assert compare(results, baseline, max_regression=0.2) == ["b"]
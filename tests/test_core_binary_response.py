@@ -0,0 +1,158 @@
+import io
+import random
+import tarfile
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import (
+    ApiError,
+    AsyncBaseClient,
+    AsyncStreamingBinaryResponse,
+    BinaryResponse,
+    StreamingBinaryResponse,
+    SyncBaseClient,
+)
+
+
+def _archive(files: typing.Dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+SDK_FILES = {
+    "sdk/README.md": b"# SDK\n",
+    "sdk/client.py": random.Random(0).getrandbits(8 * 300_000).to_bytes(300_000, "big"),
+}
+ARCHIVE = _archive(SDK_FILES)
+
+
+def _chunks(data: bytes) -> typing.Iterator[bytes]:
+    for i in range(0, len(data), 8192):
+        yield data[i : i + 8192]
+
+
+async def _achunks(data: bytes) -> typing.AsyncIterator[bytes]:
+    for chunk in _chunks(data):
+        yield chunk
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/missing"):
+        return httpx.Response(404, json={"detail": "not found"})
+    return httpx.Response(
+        200,
+        headers={
+            "content-type": "application/gzip",
+            "content-length": str(len(ARCHIVE)),
+        },
+        stream=_Stream(ARCHIVE),
+    )
+
+
+class _Stream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return _chunks(self.data)
+
+    def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        return _achunks(self.data)
+
+
+def _download(client: SyncBaseClient, path: str = "/sdk/generate") -> typing.Any:
+    return client.request(
+        method="POST",
+        path=path,
+        cast_to=BinaryResponse,
+        json={},
+        request_options={"stream": True},
+    )
+
+
+def test_buffered_by_default(mock_client):
+    response = mock_client(handler).request(
+        method="POST", path="/sdk/generate", cast_to=BinaryResponse, json={}
+    )
+    assert type(response) is BinaryResponse
+    assert response.content == ARCHIVE
+
+
+def test_extract_while_downloading(tmp_path, mock_client):
+    progress: typing.List[typing.Tuple[int, typing.Optional[int]]] = []
+    with _download(mock_client(handler)) as archive:
+        assert isinstance(archive, StreamingBinaryResponse)
+        names = archive.extract_to(
+            tmp_path, progress=lambda n, total: progress.append((n, total))
+        )
+
+    assert names == list(SDK_FILES)
+    for name, data in SDK_FILES.items():
+        assert (tmp_path / name).read_bytes() == data
+    assert progress[-1] == (len(ARCHIVE), len(ARCHIVE))
+    assert len(progress) > 1
+
+
+def test_write_to_file(tmp_path, mock_client):
+    target = tmp_path / "sdk.tar.gz"
+    written = _download(mock_client(handler)).write_to(target)
+    assert written == len(ARCHIVE)
+    assert target.read_bytes() == ARCHIVE
+    assert not (tmp_path / "sdk.tar.gz.part").exists()
+
+
+def test_lazy_content(mock_client):
+    archive = _download(mock_client(handler))
+    assert archive.content == ARCHIVE
+    assert archive.content == ARCHIVE
+
+
+def test_unsafe_members_are_rejected(tmp_path, mock_client):
+    global ARCHIVE
+    original = ARCHIVE
+    ARCHIVE = _archive({"../escape.txt": b"oops"})
+    try:
+        with pytest.raises(tarfile.TarError):
+            _download(mock_client(handler)).extract_to(tmp_path / "out")
+    finally:
+        ARCHIVE = original
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_error_status_raises(mock_client):
+    with pytest.raises(ApiError) as e:
+        _download(mock_client(handler), "/missing")
+    assert e.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_await_extract_and_write(tmp_path, mock_client):
+    client = mock_client(handler, client_cls=AsyncBaseClient)
+
+    async def download() -> typing.Any:
+        return await client.request(
+            method="POST",
+            path="/sdk/generate",
+            cast_to=BinaryResponse,
+            json={},
+            request_options={"stream": True},
+        )
+
+    archive = await download()
+    assert isinstance(archive, AsyncStreamingBinaryResponse)
+    names = await archive.extract_to(tmp_path / "sdk")
+    assert names == list(SDK_FILES)
+    assert (tmp_path / "sdk" / "sdk/client.py").read_bytes() == SDK_FILES[
+        "sdk/client.py"
+    ]
+
+    written = await (await download()).write_to(tmp_path / "sdk.tar.gz")
+    assert written == len(ARCHIVE)
+    assert await (await download()).aread() == ARCHIVE
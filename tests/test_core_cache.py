@@ -0,0 +1,275 @@
+import asyncio
+import time
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from local_api_21_py.core import (
+    AsyncBaseClient,
+    CachedResponse,
+    DiskCacheStorage,
+    MemoryCacheStorage,
+    ResponseCache,
+    SyncBaseClient,
+)
+
+
+class Theme(pydantic.BaseModel):
+    color: str
+
+
+class ThemeServer:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.color = "blue"
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if request.method == "PUT":
+            self.color = "red"
+        return httpx.Response(200, json={"color": self.color})
+
+
+def _get_theme(client: SyncBaseClient, **kwargs: typing.Any) -> Theme:
+    return client.request(
+        method="GET", path="/doc_project/docs/theme", cast_to=Theme, **kwargs
+    )
+
+
+def test_cached_reads_are_independent_copies(mock_client):
+    server = ThemeServer()
+    cache = ResponseCache()
+    client = mock_client(server.handler, cache=cache)
+
+    first = _get_theme(client)
+    first.color = "mutated"
+    second = _get_theme(client)
+
+    assert server.calls == 1
+    assert second.color == "blue"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_uncached_operations_and_opt_out(mock_client):
+    server = ThemeServer()
+    client = mock_client(
+        server.handler, cache=ResponseCache(ttls={"GET /organization": 60})
+    )
+    _get_theme(client)
+    _get_theme(client)
+    assert server.calls == 2
+
+    client = mock_client(server.handler, cache=ResponseCache())
+    _get_theme(client, request_options={"cache": False})
+    _get_theme(client, request_options={"cache": False})
+    assert server.calls == 4
+
+
+def test_auth_identity_is_part_of_key(mock_client):
+    """Responses are never shared between credentials."""
+    server = ThemeServer()
+    client = mock_client(server.handler, cache=ResponseCache())
+    _get_theme(client, headers={"x-api-key": "tenant-a"})
+    _get_theme(client, headers={"x-api-key": "tenant-b"})
+    _get_theme(client, headers={"x-api-key": "tenant-a"})
+    assert server.calls == 2
+
+
+def test_mutation_invalidates_reads(mock_client):
+    server = ThemeServer()
+    client = mock_client(server.handler, cache=ResponseCache())
+    assert _get_theme(client).color == "blue"
+    client.request(method="PUT", path="/doc_project/docs/theme", cast_to=Theme, json={})
+    assert _get_theme(client).color == "red"
+
+
+def test_expired_entries_are_refetched(mock_client):
+    server = ThemeServer()
+    client = mock_client(
+        server.handler,
+        cache=ResponseCache(ttls={"GET /doc_project/{doc_name}/theme": 0.001}),
+    )
+    _get_theme(client)
+    time.sleep(0.01)
+    _get_theme(client)
+    assert server.calls == 2
+
+
+def test_memory_storage_lru_bounds():
+    storage = MemoryCacheStorage(max_entries=2, max_bytes=250)
+
+    def entry(size: int) -> CachedResponse:
+        return CachedResponse(
+            status_code=200,
+            headers=[],
+            content=b"x" * size,
+            stored_at=0,
+            expires_at=1,
+        )
+
+    storage.set("a", entry(100))
+    storage.set("b", entry(100))
+    storage.get("a")
+    storage.set("c", entry(10))
+    assert storage.get("b") is None
+    storage.set("d", entry(200))
+    assert storage.stats() == {"entries": 2, "bytes": 210, "evictions": 2}
+
+
+@pytest.mark.asyncio
+async def test_await_cached_reads(mock_client):
+    server = ThemeServer()
+    client = mock_client(
+        server.handler, client_cls=AsyncBaseClient, cache=ResponseCache()
+    )
+    for _ in range(3):
+        theme = await client.request(
+            method="GET", path="/doc_project/docs/theme", cast_to=Theme
+        )
+        assert theme.color == "blue"
+    assert server.calls == 1
+
+
+class SpecServer:
+    """Serves a large spec with an ETag, answering 304 when unchanged."""
+
+    def __init__(self) -> None:
+        self.spec = "openapi: 3.0.0\n" + "x" * 10_000
+        self.version = 1
+        self.statuses: typing.List[int] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        etag = f'"v{self.version}"'
+        if request.headers.get("if-none-match") == etag:
+            self.statuses.append(304)
+            return httpx.Response(304, headers={"etag": etag})
+        self.statuses.append(200)
+        return httpx.Response(200, headers={"etag": etag}, json={"openapi": self.spec})
+
+
+class OpenApi(pydantic.BaseModel):
+    openapi: str
+
+
+SPEC_PATH = "/api/petstore/spec/latest/openapi"
+
+
+def test_conditional_requests_serve_cached_body(mock_client):
+    """Always-revalidated operations send If-None-Match and reuse 304 bodies."""
+    server = SpecServer()
+    cache = ResponseCache(ttls={"GET /api/{api_name}/spec/{api_version}/openapi": 0})
+    client = mock_client(server.handler, cache=cache)
+
+    specs = [
+        client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi) for _ in range(3)
+    ]
+    server.version = 2
+    server.spec = "openapi: 3.1.0"
+    latest = client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+
+    assert server.statuses == [200, 304, 304, 200]
+    assert all(s.openapi.startswith("openapi: 3.0.0") for s in specs)
+    assert latest.openapi == "openapi: 3.1.0"
+    stats = cache.stats()
+    assert stats["revalidations"] == 2
+    assert stats["bytes_saved"] > 20_000
+
+
+def test_stale_while_revalidate_refreshes_in_background(mock_client):
+    server = SpecServer()
+    cache = ResponseCache(
+        ttls={"GET /api/{api_name}/spec/{api_version}/openapi": 0},
+        stale_while_revalidate=60,
+    )
+    client = mock_client(server.handler, cache=cache)
+    client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+    server.version = 2
+    server.spec = "openapi: 3.1.0"
+
+    stale = client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+    assert stale.openapi.startswith("openapi: 3.0.0")
+
+    deadline = time.monotonic() + 5
+    while len(server.statuses) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.001)
+    fresh = client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+    assert fresh.openapi == "openapi: 3.1.0"
+    assert cache.stats()["stale_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_await_stale_while_revalidate(mock_client):
+    server = SpecServer()
+
+    cache = ResponseCache(
+        ttls={"GET /api/{api_name}/spec/{api_version}/openapi": 0},
+        stale_while_revalidate=60,
+    )
+    client = mock_client(server.handler, client_cls=AsyncBaseClient, cache=cache)
+    await client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+    await client.request(method="GET", path=SPEC_PATH, cast_to=OpenApi)
+    await asyncio.gather(*client._background)
+
+    assert server.statuses == [200, 304]
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_versioned_ttl():
+    cache = ResponseCache()
+    assert cache.ttl_for("GET", "/api/petstore/spec/1.4.0/openapi") == float("inf")
+    assert cache.ttl_for("GET", "/api/petstore/spec/latest/openapi") == 30
+    assert cache.ttl_for("GET", "/api/petstore/spec/1.4.0") is None
+
+
+def test_disk_cache_shared_between_clients(tmp_path, mock_client):
+    """A second client (eg another worker process) reads the stored spec."""
+    server = SpecServer()
+
+    def client() -> SyncBaseClient:
+        return mock_client(
+            server.handler, cache=ResponseCache(storage=DiskCacheStorage(str(tmp_path)))
+        )
+
+    path = "/api/petstore/spec/1.4.0/openapi"
+    first = client().request(method="GET", path=path, cast_to=OpenApi)
+    second = client().request(method="GET", path=path, cast_to=OpenApi)
+
+    assert server.statuses == [200]
+    assert second.openapi == first.openapi
+    assert len(list((tmp_path / "objects").rglob("*"))) == 2  # shard dir + body
+
+
+def test_disk_cache_invalidation_is_shared(tmp_path, mock_client):
+    """A mutation sent by one process drops the cached reads of the others."""
+    server = ThemeServer()
+    reader = mock_client(
+        server.handler, cache=ResponseCache(storage=DiskCacheStorage(str(tmp_path)))
+    )
+    writer = mock_client(
+        server.handler, cache=ResponseCache(storage=DiskCacheStorage(str(tmp_path)))
+    )
+
+    assert _get_theme(reader).color == "blue"
+    assert _get_theme(reader).color == "blue"
+    writer.request(method="PUT", path="/doc_project/docs/theme", cast_to=Theme, json={})
+    assert _get_theme(reader).color == "red"
+    assert server.calls == 3
+
+
+def test_disk_cache_corrupt_entry_is_a_miss(tmp_path):
+    storage = DiskCacheStorage(str(tmp_path))
+    entry = CachedResponse(
+        status_code=200, headers=[], content=b"{}", stored_at=0, expires_at=1
+    )
+    storage.set("ab" * 32, entry)
+    assert storage.get("ab" * 32).content == b"{}"
+
+    entry_file = next((tmp_path / "entries").rglob("*.json"))
+    entry_file.write_text("{not json")
+    assert storage.get("ab" * 32) is None
+    assert storage.stats()["disk_errors"] == 1
@@ -0,0 +1,134 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import (
+    ApiError,
+    AsyncBaseClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    SyncBaseClient,
+)
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+SERVICES = {"__default_service__": "http://api", "cdn": "http://cdn"}
+
+
+class Backend:
+    """Mock service answering with a configurable status."""
+
+    def __init__(self) -> None:
+        self.status = 503
+        self.paths: typing.List[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return httpx.Response(self.status, json={})
+
+
+def _breaker(**kwargs: typing.Any) -> CircuitBreaker:
+    return CircuitBreaker(window_size=4, minimum_calls=4, open_duration=60, **kwargs)
+
+
+def _fail(client: SyncBaseClient, times: int, **kwargs: typing.Any) -> None:
+    for _ in range(times):
+        with pytest.raises(ApiError):
+            client.request(method="GET", path="/", cast_to=typing.Any, **kwargs)
+
+
+def test_opens_on_error_rate_and_fails_fast(mock_client):
+    backend = Backend()
+    breaker = _breaker()
+    client = mock_client(
+        backend.handler, base_url=SERVICES, retry=NO_RETRY, circuit_breaker=breaker
+    )
+
+    _fail(client, 4)
+    with pytest.raises(CircuitOpenError) as exc:
+        client.request(method="GET", path="/", cast_to=typing.Any)
+
+    assert exc.value.retry_in > 0
+    assert len(backend.paths) == 4
+    snapshot = breaker.snapshot()["__default_service__"]
+    assert snapshot["state"] == "open"
+    assert snapshot["rejected"] == 1
+
+
+def test_circuits_are_per_service(mock_client):
+    """An open circuit for one service does not affect another."""
+    backend = Backend()
+    breaker = _breaker()
+    client = mock_client(
+        backend.handler, base_url=SERVICES, retry=NO_RETRY, circuit_breaker=breaker
+    )
+
+    _fail(client, 4, service_name="cdn")
+    backend.status = 200
+    assert client.request(method="GET", path="/", cast_to=typing.Any) == {}
+    assert breaker.state("cdn") == "open"
+    assert breaker.state("__default_service__") == "closed"
+
+
+def test_half_open_probe_closes_circuit(mock_client):
+    """After open_duration a probe of probe_path closes the circuit."""
+    backend = Backend()
+    breaker = _breaker(probe_path="/_ping")
+    client = mock_client(
+        backend.handler, base_url=SERVICES, retry=NO_RETRY, circuit_breaker=breaker
+    )
+
+    _fail(client, 4)
+    breaker._circuit("__default_service__").opened_at -= 60
+    assert breaker.snapshot()["__default_service__"]["state"] == "half_open"
+
+    backend.status = 200
+    client.request(method="GET", path="/data", cast_to=typing.Any)
+    assert backend.paths[-2:] == ["/_ping", "/data"]
+    assert breaker.state("__default_service__") == "closed"
+
+
+def test_failed_probe_reopens_circuit(mock_client):
+    backend = Backend()
+    breaker = _breaker()
+    client = mock_client(
+        backend.handler, base_url=SERVICES, retry=NO_RETRY, circuit_breaker=breaker
+    )
+
+    _fail(client, 4)
+    breaker._circuit("__default_service__").opened_at -= 60
+    _fail(client, 1)
+    assert breaker.snapshot()["__default_service__"]["times_opened"] == 2
+    with pytest.raises(CircuitOpenError):
+        client.request(method="GET", path="/", cast_to=typing.Any)
+
+
+def test_trips_on_latency(mock_client):
+    backend = Backend()
+    backend.status = 200
+    breaker = _breaker(slow_call_threshold=0)
+    client = mock_client(
+        backend.handler, base_url=SERVICES, retry=NO_RETRY, circuit_breaker=breaker
+    )
+
+    for _ in range(4):
+        client.request(method="GET", path="/", cast_to=typing.Any)
+    assert breaker.state("__default_service__") == "open"
+
+
+@pytest.mark.asyncio
+async def test_await_fails_fast(mock_client):
+    backend = Backend()
+    client = mock_client(
+        backend.handler,
+        client_cls=AsyncBaseClient,
+        base_url="http://api",
+        retry=NO_RETRY,
+        circuit_breaker=_breaker(),
+    )
+    for _ in range(4):
+        with pytest.raises(ApiError):
+            await client.request(method="GET", path="/", cast_to=typing.Any)
+    with pytest.raises(CircuitOpenError):
+        await client.request(method="GET", path="/", cast_to=typing.Any)
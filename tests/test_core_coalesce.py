@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from local_api_21_py.core import AsyncBaseClient
+
+
+class Org(pydantic.BaseModel):
+    name: str
+
+
+class SlowServer:
+    """Counts requests and holds them until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.release.wait(5)
+        return httpx.Response(200, json={"name": "sideko"})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"name": request.headers["x-api-key"]})
+
+
+def test_threads_share_in_flight_get(mock_client):
+    """Identical concurrent GETs send one request, each caller gets a copy."""
+    server = SlowServer()
+    client = mock_client(server.handler, coalesce_requests=True)
+    results: typing.List[Org] = []
+
+    def call() -> None:
+        results.append(client.request(method="GET", path="/org", cast_to=Org))
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 5
+    while client.coalescer.stats.requests < 8 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    server.release.set()
+    for t in threads:
+        t.join()
+
+    assert server.calls == 1
+    assert len({id(r) for r in results}) == 8
+    assert client.coalescer.stats.snapshot() == {
+        "requests": 8,
+        "sent": 1,
+        "coalesced": 7,
+    }
+
+
+@pytest.mark.asyncio
+async def test_await_coalesces_per_auth_identity(mock_client):
+    """Requests with different credentials are never shared."""
+    server = SlowServer()
+    client = mock_client(
+        server.async_handler, client_cls=AsyncBaseClient, coalesce_requests=True
+    )
+
+    results = await asyncio.gather(
+        *[
+            client.request(
+                method="GET",
+                path="/org",
+                cast_to=Org,
+                headers={"x-api-key": key},
+            )
+            for key in ["a", "a", "a", "b", "b"]
+        ]
+    )
+
+    assert server.calls == 2
+    assert [r.name for r in results] == ["a", "a", "a", "b", "b"]
+    assert results[0] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_await_cancelled_caller_does_not_cancel_flight(mock_client):
+    server = SlowServer()
+    client = mock_client(
+        server.async_handler, client_cls=AsyncBaseClient, coalesce_requests=True
+    )
+
+    def get() -> typing.Any:
+        return client.request(
+            method="GET", path="/org", cast_to=Org, headers={"x-api-key": "a"}
+        )
+
+    first = asyncio.ensure_future(get())
+    second = asyncio.ensure_future(get())
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert (await second).name == "a"
+    assert server.calls == 1
+
+
+def test_posts_and_opt_out_not_coalesced(mock_client):
+    server = SlowServer()
+    server.release.set()
+    client = mock_client(server.handler, coalesce_requests=True)
+    client.request(method="POST", path="/org", cast_to=Org, json={})
+    client.request(
+        method="GET", path="/org", cast_to=Org, request_options={"coalesce": False}
+    )
+    assert client.coalescer.stats.requests == 0
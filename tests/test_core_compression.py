@@ -0,0 +1,143 @@
+import gzip
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import (
+    AsyncBaseClient,
+    FileStream,
+    RequestCompression,
+    RetryPolicy,
+    SyncBaseClient,
+)
+
+SPEC = (
+    b"openapi: 3.0.0\npaths:\n" + b"  /pets: {get: {operationId: listPets}}\n" * 20_000
+)
+
+
+class Server:
+    def __init__(self, *, accepts_encoding: bool = True, failures: int = 0) -> None:
+        self.accepts_encoding = accepts_encoding
+        self.failures = failures
+        self.requests: typing.List[httpx.Request] = []
+        self.bodies: typing.List[bytes] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = request.read()
+        encoding = request.headers.get("content-encoding")
+        if encoding is not None and not self.accepts_encoding:
+            return httpx.Response(415, headers={"accept-encoding": "identity"})
+        self.bodies.append(gzip.decompress(body) if encoding == "gzip" else body)
+        if len(self.requests) <= self.failures:
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+
+def _upload(client: SyncBaseClient, **kwargs: typing.Any) -> None:
+    client.request(
+        method="POST",
+        path="/lint",
+        cast_to=dict,
+        files=[("openapi", ("openapi.yaml", SPEC, "application/yaml"))],
+        **kwargs,
+    )
+
+
+def test_large_bodies_are_compressed(mock_client):
+    server = Server()
+    _upload(mock_client(server.handler, compression=RequestCompression("gzip")))
+
+    request = server.requests[0]
+    assert request.headers["content-encoding"] == "gzip"
+    assert request.headers["content-type"].startswith("multipart/form-data")
+    assert request.headers["transfer-encoding"] == "chunked"
+    assert len(request.content) < len(SPEC) / 10
+    assert SPEC in server.bodies[0]
+
+
+def test_small_bodies_and_opt_out_are_sent_as_is(mock_client):
+    server = Server()
+    client = mock_client(server.handler, compression=RequestCompression("gzip"))
+    client.request(method="POST", path="/lint", cast_to=dict, json={"a": 1})
+    _upload(client, request_options={"compress": False})
+    assert all("content-encoding" not in r.headers for r in server.requests)
+
+
+def test_request_option_enables_compression(mock_client):
+    server = Server()
+    client = mock_client(server.handler)
+    client.request(
+        method="POST",
+        path="/lint",
+        cast_to=dict,
+        content=SPEC,
+        request_options={"compress": True},
+    )
+    assert "content-encoding" in server.requests[0].headers
+    assert server.bodies == [SPEC]
+
+
+def test_rejected_encoding_falls_back(tmp_path, mock_client):
+    path = tmp_path / "openapi.yaml"
+    path.write_bytes(SPEC)
+    server = Server(accepts_encoding=False)
+    client = mock_client(server.handler, compression=RequestCompression("gzip"))
+
+    with FileStream(str(path)) as stream:
+        client.request(method="POST", path="/lint", cast_to=dict, content=stream)
+    _upload(client)
+
+    encodings = [r.headers.get("content-encoding") for r in server.requests]
+    assert encodings == ["gzip", None, None]
+    assert server.bodies[0] == SPEC
+
+
+def test_fallback_keeps_request_timeout(mock_client):
+    server = Server(accepts_encoding=False)
+    client = mock_client(server.handler, compression=RequestCompression("gzip"))
+    client.request(
+        method="POST",
+        path="/lint",
+        cast_to=dict,
+        content=SPEC,
+        request_options={"timeout": 7},
+    )
+
+    timeouts = [r.extensions["timeout"]["read"] for r in server.requests]
+    assert timeouts == [7, 7]
+
+
+def test_zstd(mock_client):
+    zstandard = pytest.importorskip("zstandard")
+    server = Server()
+    client = mock_client(server.handler, compression=RequestCompression("zstd"))
+    client.request(method="POST", path="/lint", cast_to=dict, content=SPEC)
+    request = server.requests[0]
+    assert request.headers["content-encoding"] == "zstd"
+    decompressed = (
+        zstandard.ZstdDecompressor().decompressobj().decompress(request.content)
+    )
+    assert decompressed == SPEC
+
+
+@pytest.mark.asyncio
+async def test_await_compressed_upload_is_replayed(mock_client):
+    server = Server(failures=1)
+    client = mock_client(
+        server.handler,
+        client_cls=AsyncBaseClient,
+        retry=RetryPolicy(base_delay=0, retry_non_idempotent=True),
+        compression=RequestCompression("gzip"),
+    )
+    await client.request(
+        method="POST",
+        path="/lint",
+        cast_to=dict,
+        files=[("openapi", ("openapi.yaml", SPEC, "application/yaml"))],
+    )
+    assert len(server.bodies) == 2
+    assert server.bodies[0] == server.bodies[1]
+    assert SPEC in server.bodies[0]
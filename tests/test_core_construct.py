@@ -0,0 +1,93 @@
+import datetime
+import enum
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.core import construct_encodable, from_encodable
+from local_api_21_py.types import models
+
+
+def test_construct_nested_models():
+    """Nested and recursive models are constructed with their own types."""
+    data = example_for(typing.List[models.Deployment], list_size=2)
+    deployments = construct_encodable(
+        data=data, load_with=typing.List[models.Deployment]
+    )
+
+    assert isinstance(deployments[0], models.Deployment)
+    assert isinstance(deployments[0].doc_version, models.DocVersion)
+    assert [d.model_dump() for d in deployments] == [
+        d.model_dump()
+        for d in from_encodable(data=data, load_with=typing.List[models.Deployment])
+    ]
+
+    guides = construct_encodable(
+        data=example_for(typing.List[models.GuideWithChildren]),
+        load_with=typing.List[models.GuideWithChildren],
+    )
+    assert isinstance(guides[0].children[0], models.GuideWithChildren)
+
+
+def test_construct_fills_defaults_and_skips_validation():
+    """Missing optional fields get defaults and values are not checked."""
+    theme = construct_encodable(data={}, load_with=models.ThemeValues)
+    assert theme.api_reference_group_variant is None
+    assert theme.model_fields_set == set()
+
+    deployment = construct_encodable(
+        data={"status": "Unknown"}, load_with=models.Deployment
+    )
+    assert deployment.status == "Unknown"
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+class _Event(pydantic.BaseModel):
+    at: datetime.datetime
+    day: typing.Optional[datetime.date] = None
+    colors: typing.List[_Color]
+
+
+def test_construct_converts_datetime_and_enum_leaves():
+    """Leaves are returned with the types validation would give them."""
+    data = {"at": "2024-05-01T12:30:00+00:00", "day": "2024-05-01"}
+    event = construct_encodable(
+        data={**data, "colors": ["red", "blue"]}, load_with=_Event
+    )
+    validated = from_encodable(data={**data, "colors": ["red"]}, load_with=_Event)
+
+    assert event.at == validated.at
+    assert event.day == validated.day
+    # unknown members are kept as sent
+    assert event.colors == [_Color.RED, "blue"]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    deployment = example_for(models.Deployment)
+    deployment["status"] = "Queued"
+    return httpx.Response(200, json=[deployment])
+
+
+def test_validate_response_request_option(mock_client):
+    """The per-call option disables validation for a single request."""
+    client = mock_client(_handler, client_cls=Client)
+    response = client.doc.deployment.list(
+        doc_name="my-project", request_options={"validate_response": False}
+    )
+    assert response[0].status == "Queued"
+    assert isinstance(response[0].doc_version, models.DocVersion)
+
+
+@pytest.mark.asyncio
+async def test_await_validate_response_client_option(mock_client):
+    """The client level option applies to every request."""
+    client = mock_client(_handler, client_cls=AsyncClient, validate_response=False)
+    response = await client.doc.deployment.list(doc_name="my-project")
+    assert response[0].status == "Queued"
@@ -0,0 +1,69 @@
+import time
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.core import build_httpx_client
+
+
+def test_host_limits_mount_separate_pools():
+    """Per-host limits are mounted as dedicated transports."""
+    client = build_httpx_client(
+        timeout=10,
+        max_connections=8,
+        host_limits={"api.sideko.dev": httpx.Limits(max_connections=2)},
+    )
+
+    pool = client._transport_for_url(httpx.URL("https://api.sideko.dev/v1"))._pool
+    default = client._transport_for_url(httpx.URL("https://other.dev/"))._pool
+    assert pool._max_connections == 2
+    assert default._max_connections == 8
+
+
+def test_warm_connections_reuses_pool():
+    """Warmed connections are kept alive and reused by later requests."""
+    with LocalServer() as server:
+        client = Client(base_url=server.base_url, max_keepalive_connections=4)
+        assert client.warm_connections(connections=4) == 4
+
+        pool = client._base_client.httpx_client._transport._pool
+        opened = len(pool.connections)
+        assert 1 <= opened <= 4
+
+        client.health.ping()
+        assert len(pool.connections) == opened
+        assert client.warm_connections(connections=0) == 0
+
+
+def test_parallel_map_and_submit_share_pool():
+    """Calls run concurrently on the client's threads and connection pool."""
+
+    def slow_ping(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    with LocalServer(slow_ping) as server:
+        with Client(base_url=server.base_url, max_workers=8) as client:
+            start = time.monotonic()
+            pings = list(client.map(lambda _: client.health.ping(), range(8)))
+            elapsed = time.monotonic() - start
+            future = client.submit(client.health.ping)
+            assert future.result().ok
+
+            pool = client._base_client.httpx_client._transport._pool
+            assert len(pool.connections) <= 8
+
+        assert all(p.ok for p in pings)
+        assert elapsed < 0.3
+        assert client._base_client.httpx_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_await_warm_connections():
+    """Async warm-up reports the number of successful pings."""
+    with LocalServer() as server:
+        client = AsyncClient(base_url=server.base_url)
+        assert await client.warm_connections(connections=3) == 3
+        assert await client.warm_connections(connections=0) == 0
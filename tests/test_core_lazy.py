@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.core import LazyClient
+from local_api_21_py.resources.doc.deployment import DeploymentClient
+from local_api_21_py.types import models, params
+
+
+def test_import_defers_resources_and_types():
+    code = (
+        "import sys, local_api_21_py\n"
+        "client = local_api_21_py.Client(api_key='key')\n"
+        "client.health\n"
+        "print(sorted(m for m in sys.modules if m.startswith('local_api_21_py.')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert "local_api_21_py.resources.health" in output
+    assert "local_api_21_py.resources.sdk" not in output
+    assert "local_api_21_py.types.models.api" not in output
+    assert "local_api_21_py.types.params.new_api" not in output
+
+
+def test_sub_clients_are_built_once_per_instance():
+    client = Client(api_key="key")
+    assert isinstance(Client.__dict__["doc"], LazyClient)
+    assert client.doc is client.doc
+    assert isinstance(client.doc.deployment, DeploymentClient)
+    assert client.doc._base_client is client._base_client
+    assert Client(api_key="key").doc is not client.doc
+    assert AsyncClient(api_key="key").doc.deployment.__class__.__name__ == (
+        "AsyncDeploymentClient"
+    )
+
+
+def test_types_resolve_on_access():
+    assert models.Deployment.__name__ == "Deployment"
+    assert params._SerializerNewDeployment.__name__ == "_SerializerNewDeployment"
+    assert "Deployment" in dir(models)
+    assert models._types_namespace["GuideWithChildren"] is models.GuideWithChildren
+    try:
+        models.Missing
+    except AttributeError as e:
+        assert "Missing" in str(e)
+    else:
+        raise AssertionError("expected AttributeError")
@@ -0,0 +1,64 @@
+import ast
+import inspect
+import textwrap
+import types
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.core import LazyClient
+from local_api_21_py.operations import HELPERS, OPERATIONS, operation_name
+
+
+def _methods(owner: type, prefix: str = ""):
+    for name, attr in vars(owner).items():
+        if isinstance(attr, LazyClient):
+            yield from _methods(attr.resolve(), f"{prefix}{name}.")
+        elif prefix and isinstance(attr, types.FunctionType):
+            if not name.startswith("_"):
+                yield f"{prefix}{name}", attr
+
+
+def _declared(fn: types.FunctionType):
+    """`method`, `path`, body `dump_with` and `cast_to` written in a method"""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(fn)))
+    dump_with = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and ast.unparse(node.targets[0]) in (
+            "_json",
+            "_data",
+        ):
+            keywords = {k.arg: k.value for k in node.value.keywords}
+            dump_with.append(eval(ast.unparse(keywords["dump_with"]), fn.__globals__))
+        if isinstance(node, ast.Call) and ast.unparse(node.func).endswith(
+            "_base_client.request"
+        ):
+            keywords = {k.arg: k.value for k in node.keywords}
+            method = keywords["method"].value
+            path = "".join(
+                part.value if isinstance(part, ast.Constant) else f"{{{part.value.id}}}"
+                for part in getattr(keywords["path"], "values", [keywords["path"]])
+            )
+            cast_to = eval(ast.unparse(keywords["cast_to"]), fn.__globals__)
+    return method, path, tuple(dump_with), cast_to
+
+
+def test_table_covers_every_resource_method():
+    for client_cls in (Client, AsyncClient):
+        names = {name for name, _ in _methods(client_cls)}
+        assert names == OPERATIONS.keys() | HELPERS.keys()
+    for sent in HELPERS.values():
+        assert set(sent) <= OPERATIONS.keys()
+
+
+def test_table_matches_resource_methods():
+    for client_cls in (Client, AsyncClient):
+        for name, fn in _methods(client_cls):
+            if name not in HELPERS:
+                assert _declared(fn) == OPERATIONS[name], name
+
+
+def test_operation_name():
+    client = Client(api_key="key")
+    async_client = AsyncClient(api_key="key")
+    assert operation_name(client.doc.deployment.get) == "doc.deployment.get"
+    assert operation_name(async_client.asset.iter_all) == "asset.iter_all"
+    assert operation_name("health.ping") == "health.ping"
@@ -0,0 +1,118 @@
+import asyncio
+import itertools
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.core import paginate
+from local_api_21_py.types import models
+
+ASSET = example_for(models.Asset)
+
+
+class AssetServer:
+    """Serves `page_count` pages of 2 assets, named by page and position."""
+
+    def __init__(self, page_count: int, delay: float = 0.0) -> None:
+        self.page_count = page_count
+        self.delay = delay
+        self.requested: typing.List[int] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _page(self, page: int) -> httpx.Response:
+        results = [{**ASSET, "name": f"{page}-{i}"} for i in range(2)]
+        pagination = {
+            "page": page,
+            "page_count": self.page_count,
+            "page_limit": 2,
+            "total_count": 2 * self.page_count,
+        }
+        return httpx.Response(200, json={"pagination": pagination, "results": results})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        with self._lock:
+            self.requested.append(page)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self._page(page)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        self.requested.append(page)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self._page(page)
+
+
+def test_iterates_all_pages_in_order(mock_client):
+    server = AssetServer(page_count=4)
+    names = [
+        a.name for a in mock_client(server.handler, client_cls=Client).asset.iter_all()
+    ]
+    assert names == [f"{p}-{i}" for p in range(1, 5) for i in range(2)]
+    assert sorted(server.requested) == [1, 2, 3, 4]
+
+
+def test_stopping_early_skips_remaining_pages(mock_client):
+    server = AssetServer(page_count=50)
+    assets = list(
+        itertools.islice(
+            mock_client(server.handler, client_cls=Client).asset.iter_all(), 3
+        )
+    )
+    assert [a.name for a in assets] == ["1-0", "1-1", "2-0"]
+    # page 3 may have been prefetched, nothing beyond it
+    assert max(server.requested) <= 3
+
+
+def test_concurrent_pages_are_bounded(mock_client):
+    server = AssetServer(page_count=12, delay=0.02)
+    names = [
+        a.name
+        for a in mock_client(server.handler, client_cls=Client).asset.iter_all(
+            concurrency=4
+        )
+    ]
+    assert len(names) == 24
+    assert names[-1] == "12-1"
+    assert server.peak == 4
+
+
+def test_unknown_page_count_stops_at_empty_page():
+    pages = {1: [1, 2], 2: [3], 3: []}
+    requested: typing.List[int] = []
+
+    def fetch(page: int) -> typing.List[int]:
+        requested.append(page)
+        return pages[page]
+
+    items = list(paginate(fetch, get_items=lambda p: p, get_page_count=lambda p: None))
+    assert items == [1, 2, 3]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_await_prefetches_next_page(mock_client):
+    server = AssetServer(page_count=3, delay=0.02)
+    client = mock_client(server.async_handler, client_cls=AsyncClient)
+    names = []
+    async for asset in client.asset.iter_all():
+        if asset.name == "1-0":
+            # page 2 is requested while page 1 is being consumed
+            await asyncio.sleep(0)
+            assert 2 in server.requested
+        names.append(asset.name)
+    assert names == [f"{p}-{i}" for p in range(1, 4) for i in range(2)]
@@ -0,0 +1,140 @@
+import time
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.core import PollPolicy, PollTimeout, poll_until
+from local_api_21_py.types import models
+
+DEPLOYMENT = example_for(models.Deployment)
+
+FAST = PollPolicy(initial_delay=0.001, max_delay=0.004, jitter=0, rate_limit=None)
+
+
+class DeploymentServer:
+    """Advances each deployment one status per poll until it completes"""
+
+    STEPS = ["Created", "Building", "Generated", "Complete"]
+
+    def __init__(self, projects: typing.Dict[str, typing.List[str]]) -> None:
+        self.polls = {(p, d): 0 for p, ids in projects.items() for d in ids}
+        self.requests: typing.List[str] = []
+
+    def _deployment(self, key: typing.Tuple[str, str]) -> typing.Dict[str, typing.Any]:
+        step = min(self.polls[key], len(self.STEPS) - 1)
+        self.polls[key] += 1
+        return {**DEPLOYMENT, "id": key[1], "status": self.STEPS[step]}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        parts = path[path.index("/doc_project/") + 1 :].split("/")
+        if len(parts) == 3:
+            self.requests.append(f"list {parts[1]}")
+            keys = [k for k in self.polls if k[0] == parts[1]]
+            return httpx.Response(200, json=[self._deployment(k) for k in keys])
+        self.requests.append(f"get {parts[3]}")
+        return httpx.Response(200, json=self._deployment((parts[1], parts[3])))
+
+
+def test_wait_for_reports_transitions(mock_client):
+    server = DeploymentServer({"docs": ["d1"]})
+    client = mock_client(server.handler, client_cls=Client)
+    seen = []
+    deployment = client.doc.deployment.wait_for(
+        deployment_id="d1",
+        doc_name="docs",
+        policy=FAST,
+        on_status=lambda key, d, previous: seen.append((previous, d.status)),
+    )
+    assert deployment.status == "Complete"
+    assert seen == [
+        (None, "Created"),
+        ("Created", "Building"),
+        ("Building", "Generated"),
+        ("Generated", "Complete"),
+    ]
+    assert server.requests == ["get d1"] * 4
+
+
+def test_wait_for_many_polls_each_project_once_per_round(mock_client):
+    server = DeploymentServer({"a": ["a1", "a2", "a3"], "b": ["b1"]})
+    client = mock_client(server.handler, client_cls=Client)
+    done = client.doc.deployment.wait_for_many(
+        [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")], policy=FAST
+    )
+    assert {k: d.status for k, d in done.items()} == {
+        ("a", "a1"): "Complete",
+        ("a", "a2"): "Complete",
+        ("a", "a3"): "Complete",
+        ("b", "b1"): "Complete",
+    }
+    assert server.requests.count("list a") == 4
+    assert server.requests.count("get b1") == 4
+    assert len(server.requests) == 8
+
+
+def test_backoff_grows_while_unchanged():
+    policy = PollPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=0)
+    assert [policy.delay(n) for n in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_deadline_and_request_budget():
+    def fetch(key: str) -> str:
+        return "Building"
+
+    start = time.monotonic()
+    with pytest.raises(PollTimeout) as exc:
+        poll_until(
+            ["x"],
+            fetch,
+            get_status=lambda s: s,
+            terminal={"Complete"},
+            policy=PollPolicy(initial_delay=0.02, jitter=0, rate_limit=None),
+            timeout=0.05,
+        )
+    assert time.monotonic() - start < 0.2
+    assert exc.value.pending == {"x": "Building"}
+
+    calls = []
+    with pytest.raises(PollTimeout, match="budget"):
+        poll_until(
+            ["x", "y"],
+            lambda key: calls.append(key) or "Building",
+            get_status=lambda s: s,
+            terminal={"Complete"},
+            policy=FAST,
+            max_requests=5,
+        )
+    assert len(calls) == 5
+
+
+def test_rate_limit_is_shared():
+    policy = PollPolicy(initial_delay=0, jitter=0, rate_limit=100, burst=1)
+    start = time.monotonic()
+    poll_until(
+        range(6),
+        lambda key: "Complete",
+        get_status=lambda s: s,
+        terminal={"Complete"},
+        policy=policy,
+    )
+    # six independent targets, one request every 10ms after the first
+    assert time.monotonic() - start >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_many(mock_client):
+    server = DeploymentServer({"a": ["a1", "a2"], "b": ["b1"]})
+    client = mock_client(server.handler, client_cls=AsyncClient)
+    done = await client.doc.deployment.wait_for_many(
+        [("a", "a1"), ("a", "a2"), ("b", "b1")], policy=FAST
+    )
+    assert all(d.status == "Complete" for d in done.values())
+    assert server.requests.count("list a") == 4
+    deployment = await client.doc.deployment.wait_for(
+        deployment_id="b1", doc_name="b", policy=FAST
+    )
+    assert deployment.status == "Complete"
@@ -0,0 +1,64 @@
+import typing
+
+import pydantic
+import pytest
+import typing_extensions
+
+from local_api_21_py.core import (
+    request_adapters,
+    to_encodable,
+    to_form_urlencoded,
+    type_utils,
+)
+from local_api_21_py.types import params
+
+
+def test_to_encodable_primitive_fast_path():
+    """Primitives matching `dump_with` exactly skip validation."""
+    stats = request_adapters.stats()
+
+    assert to_encodable(item="my-project", dump_with=str) == "my-project"
+    assert to_encodable(item=3, dump_with=typing.Union[str, int]) == 3
+    assert (
+        to_encodable(
+            item="Preview",
+            dump_with=typing_extensions.Literal["Preview", "Production"],
+        )
+        == "Preview"
+    )
+
+    assert request_adapters.stats() == stats
+
+
+def test_to_encodable_primitive_falls_back_to_validation():
+    """Coercions and invalid values still go through pydantic."""
+    assert to_encodable(item=True, dump_with=int) == 1
+    with pytest.raises(pydantic.ValidationError):
+        to_encodable(
+            item="Staging",
+            dump_with=typing_extensions.Literal["Preview", "Production"],
+        )
+
+
+def test_to_encodable_serializer_is_cached():
+    """Serializer models compile a single adapter."""
+    item = {"name": "my-asset", "ignored": type_utils.NOT_GIVEN}
+    to_encodable(item=item, dump_with=params._SerializerUpdateAsset)
+    misses = request_adapters.stats()["misses"]
+
+    encoded = to_encodable(item=item, dump_with=params._SerializerUpdateAsset)
+
+    assert encoded == {"name": "my-asset"}
+    assert request_adapters.stats()["misses"] == misses
+
+
+def test_to_form_urlencoded_uses_cached_serializer():
+    """Form encoding validates through the same cached serializer."""
+    encoded = to_form_urlencoded(
+        item={"name": "my-asset"},
+        dump_with=params._SerializerUpdateAsset,
+        style={},
+        explode={},
+    )
+    assert encoded == {"name": "my-asset"}
+    assert params._SerializerUpdateAsset in request_adapters
@@ -0,0 +1,138 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import (
+    ApiError,
+    AsyncBaseClient,
+    RetryPolicy,
+)
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+
+
+class FlakyServer:
+    """Fails with the given responses before answering successfully."""
+
+    def __init__(self, *failures: typing.Union[int, Exception], headers=None) -> None:
+        self.failures = list(failures)
+        self.headers = headers or {}
+        self.calls = 0
+        self.bodies: typing.List[bytes] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.bodies.append(request.read())
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure, headers=self.headers, json={"err": 1})
+        return httpx.Response(200, json={"ok": True})
+
+
+def test_retries_transient_statuses_and_records_metrics(mock_client):
+    """Idempotent requests are retried and attempts are counted."""
+    server = FlakyServer(503, 429)
+    client = mock_client(server.handler, retry=FAST)
+
+    assert client.request(method="GET", path="/", cast_to=typing.Any) == {"ok": True}
+    assert server.calls == 3
+
+    metrics = client.retry_metrics.snapshot()
+    assert metrics["requests"] == 1
+    assert metrics["attempts"] == 3
+    assert metrics["retried_statuses"] == {503: 1, 429: 1}
+
+
+def test_requests_are_not_retried_by_default(mock_client):
+    """Retries are opt-in, per client or per request."""
+    server = FlakyServer(503, 503)
+    client = mock_client(server.handler)
+    with pytest.raises(ApiError):
+        client.request(method="GET", path="/", cast_to=typing.Any)
+    assert server.calls == 1
+
+    opts = {"retry": FAST}
+    assert client.request(
+        method="GET", path="/", cast_to=typing.Any, request_options=opts
+    ) == {"ok": True}
+    assert server.calls == 3
+
+
+def test_exhausted_attempts_raise_api_error(mock_client):
+    server = FlakyServer(502, 502, 502, 502)
+    client = mock_client(server.handler, retry=FAST)
+
+    with pytest.raises(ApiError) as exc:
+        client.request(method="GET", path="/", cast_to=typing.Any)
+    assert exc.value.status_code == 502
+    assert server.calls == 3
+    assert client.retry_metrics.exhausted == 1
+
+
+def test_post_only_retried_when_opted_in(mock_client):
+    """Non-idempotent requests are only resent with retry_non_idempotent."""
+    server = FlakyServer(503, 503)
+    client = mock_client(server.handler, retry=FAST)
+    with pytest.raises(ApiError):
+        client.request(method="POST", path="/", cast_to=typing.Any, json={"a": 1})
+    assert server.calls == 1
+
+    opted_in = RetryPolicy(base_delay=0.001, retry_non_idempotent=True)
+    assert client.request(
+        method="POST",
+        path="/",
+        cast_to=typing.Any,
+        json={"a": 1},
+        request_options={"retry": opted_in},
+    ) == {"ok": True}
+    assert server.calls == 3
+
+
+def test_connect_errors_retried_for_any_method(mock_client):
+    """A request that never reached the server can always be resent."""
+    server = FlakyServer(httpx.ConnectError("refused"))
+    client = mock_client(server.handler, retry=FAST)
+    client.request(method="POST", path="/", cast_to=typing.Any, json={"a": 1})
+    assert server.calls == 2
+    assert client.retry_metrics.retried_errors == {"ConnectError": 1}
+
+
+def test_retry_after_exceeding_deadline_gives_up(mock_client):
+    """A Retry-After longer than the remaining budget fails immediately."""
+    server = FlakyServer(429, headers={"retry-after": "5"})
+    client = mock_client(server.handler, retry=RetryPolicy(deadline=1))
+    with pytest.raises(ApiError):
+        client.request(method="GET", path="/", cast_to=typing.Any)
+    assert server.calls == 1
+    assert client.retry_metrics.deadline_exceeded == 1
+
+
+def test_retry_after_http_date():
+    response = httpx.Response(
+        503, headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert RetryPolicy().retry_after(response) == 0.0
+
+
+def test_file_body_rewound_between_attempts(tmp_path, mock_client):
+    path = tmp_path / "spec.yaml"
+    path.write_bytes(b"openapi: 3.0.0")
+    server = FlakyServer(500)
+    client = mock_client(server.handler, retry=FAST)
+
+    with open(path, "rb") as f:
+        client.request(method="PUT", path="/", cast_to=typing.Any, content=f)
+    assert server.bodies == [b"openapi: 3.0.0", b"openapi: 3.0.0"]
+
+
+@pytest.mark.asyncio
+async def test_await_retries(mock_client):
+    server = FlakyServer(503)
+    client = mock_client(server.handler, client_cls=AsyncBaseClient, retry=FAST)
+    assert await client.request(method="GET", path="/", cast_to=typing.Any) == {
+        "ok": True
+    }
+    assert server.calls == 2
@@ -0,0 +1,140 @@
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from local_api_21_py.core import AsyncBaseClient, SSEDecoder
+
+STREAM = (
+    b": keep-alive\r\n"
+    b'event: progress\r\nid: 1\r\nretry: 1500\r\ndata: {"data": 1}\r\n\r\n'
+    b"data: first line\ndata:second line\n\n"
+    b'id: 3\rdata: {"data": 3}\r\r'
+    b"data: unterminated"
+)
+
+
+class Event(pydantic.BaseModel):
+    data: typing.Any
+
+
+def _decode(chunks: typing.Iterable[bytes]) -> typing.List[typing.Any]:
+    decoder = SSEDecoder()
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return [(e.event, e.data, e.id, e.retry) for e in events]
+
+
+def test_decoder_fields_and_line_endings():
+    """All line endings, comments and event fields are supported."""
+    assert _decode([STREAM]) == [
+        ("progress", '{"data": 1}', "1", 1500),
+        ("message", "first line\nsecond line", "1", 1500),
+        ("message", '{"data": 3}', "3", 1500),
+        ("message", "unterminated", "3", 1500),
+    ]
+
+
+def test_decoder_is_chunking_independent():
+    """Byte-by-byte delivery, including split CRLF pairs, decodes the same."""
+    byte_chunks = [STREAM[i : i + 1] for i in range(len(STREAM))]
+    assert _decode(byte_chunks) == _decode([STREAM])
+
+
+def test_decoder_multibyte_characters_split_across_chunks():
+    """Lines are only decoded once complete."""
+    payload = "data: héllo wörld\n\n".encode()
+    assert _decode([payload[:8], payload[8:]]) == [
+        ("message", "héllo wörld", None, None)
+    ]
+
+
+def test_decoder_skips_empty_data_buffer():
+    """A lone empty `data:` line does not dispatch an event."""
+    assert _decode([b"data:\n\nevent: ping\ndata: \n\ndata: x\n\n"]) == [
+        ("message", "x", None, None)
+    ]
+
+
+def _sse_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        content=iter([STREAM[:20], STREAM[20:61], STREAM[61:]]),
+    )
+
+
+def test_stream_response(mock_client):
+    """StreamResponse yields typed events and tracks the last event id."""
+    client = mock_client(_sse_handler)
+    stream = client.stream_request(method="GET", path="/events", cast_to=Event)
+
+    assert [e.data for e in stream] == [
+        1,
+        "first line\nsecond line",
+        3,
+        "unterminated",
+    ]
+    assert stream.last_event_id == "3"
+    assert stream.retry == 1500
+
+
+class _ExitSpy:
+    def __init__(self, context: typing.Any) -> None:
+        self.context = context
+        self.exits = 0
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.exits += 1
+        self.context.__exit__(*args)
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        self.exits += 1
+        await self.context.__aexit__(*args)
+
+
+def test_stream_context_exits_after_flushed_final_event(mock_client):
+    """The last event has no trailing blank line, the stream is still closed."""
+    client = mock_client(_sse_handler)
+    stream = client.stream_request(method="GET", path="/events", cast_to=Event)
+    spy = stream._context = _ExitSpy(stream._context)
+    events = list(stream)
+    assert events[-1].data == "unterminated"
+    assert spy.exits == 1
+
+
+async def _async_sse_handler(request: httpx.Request) -> httpx.Response:
+    async def chunks():
+        yield STREAM[:33]
+        yield STREAM[33:]
+
+    return httpx.Response(
+        200, headers={"content-type": "text/event-stream"}, content=chunks()
+    )
+
+
+@pytest.mark.asyncio
+async def test_await_stream_response(mock_client):
+    """AsyncStreamResponse decodes events with the shared decoder."""
+    client = mock_client(_async_sse_handler, client_cls=AsyncBaseClient)
+    stream = await client.stream_request(method="GET", path="/events", cast_to=Event)
+
+    assert [e.data async for e in stream] == [
+        1,
+        "first line\nsecond line",
+        3,
+        "unterminated",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_context_exits_after_flushed_final_event(mock_client):
+    client = mock_client(_async_sse_handler, client_cls=AsyncBaseClient)
+    stream = await client.stream_request(method="GET", path="/events", cast_to=Event)
+    spy = stream._context = _ExitSpy(stream._context)
+    events = [e async for e in stream]
+    assert events[-1].data == "unterminated"
+    assert spy.exits == 1
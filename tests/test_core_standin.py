@@ -0,0 +1,63 @@
+import re
+
+import httpx
+import pytest
+
+from local_api_21_py.bench.standin import BASE_URL, StandIn
+from local_api_21_py.core import ApiError, RetryPolicy
+
+
+def test_every_route_serves_a_valid_response():
+    stand_in = StandIn(list_size=2)
+    client = stand_in.client()
+    base = client._base_client
+    assert len(stand_in.routes) > 70
+    for route in stand_in.routes:
+        path = re.sub(r"\{\w+\}", "x", route.path)
+        response = base.httpx_client.request(route.method, f"{BASE_URL}{path}")
+        assert response.status_code in (200, 202, 204), route
+        if route.cast_to is not httpx.Response:
+            base.process_response(response=response, cast_to=route.cast_to)
+    assert sum(stand_in.calls.values()) == len(stand_in.routes)
+
+
+def test_large_variants():
+    stand_in = StandIn(list_size=250, spec_size=256 * 1024)
+    client = stand_in.client()
+    assert len(client.doc.deployment.list(doc_name="docs")) == 250
+    spec = client.api.spec.get_openapi(api_name="api", api_version="latest")
+    assert len(spec.openapi) >= 256 * 1024
+
+
+def test_injected_errors_are_deterministic_and_retried():
+    def run() -> int:
+        stand_in = StandIn(error_rate=0.3, error_statuses=[503], seed=7)
+        client = stand_in.client(retry=RetryPolicy(max_attempts=10, base_delay=0))
+        for _ in range(20):
+            assert client.health.ping().ok
+        return stand_in.injected_errors
+
+    first = run()
+    assert first > 0
+    assert run() == first
+
+    client = StandIn(error_rate=1, error_statuses=[500]).client(
+        retry=RetryPolicy(max_attempts=1)
+    )
+    with pytest.raises(ApiError) as exc:
+        client.health.ping()
+    assert exc.value.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_async_and_asgi():
+    stand_in = StandIn(latency=0.001)
+    client = stand_in.async_client()
+    assert (await client.health.ping()).ok
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=stand_in), base_url=BASE_URL
+    ) as raw:
+        response = await raw.get("/nope")
+        assert response.status_code == 404
+        response = await raw.get("/organization/asset")
+        assert response.json()["pagination"]["page"] == 1
@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.bench.server import LocalServer
+from local_api_21_py.bench.standin import StandIn
+from local_api_21_py.core import ApiError, RawResponse, RetryPolicy
+from local_api_21_py.types import models
+
+
+def test_no_tracing_without_hooks(mock_client):
+    extensions = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        extensions.append(dict(request.extensions))
+        return httpx.Response(200, json={"ok": True})
+
+    client = mock_client(handler, client_cls=Client)
+    assert client.health.ping().ok
+    assert "trace" not in extensions[0]
+
+    seen = []
+    client.timing_hooks.append(seen.append)
+    assert client.health.ping().ok
+    assert "trace" in extensions[1]
+    assert seen[0].operation == "GET /_ping"
+
+
+def test_phases_over_a_socket():
+    seen = []
+    stand_in = StandIn(latency=0.02, list_size=50)
+    with LocalServer(stand_in.handler) as server:
+        client = Client(base_url=server.base_url, timing_hooks=[seen.append])
+        client.doc.deployment.list(doc_name="docs")
+        client.doc.deployment.list(doc_name="docs")
+
+    first, second = seen
+    assert first.path == "/doc_project/docs/deployment"
+    assert first.status_code == 200 and first.attempts == 1
+    assert first.connect > 0 and first.connection_acquire >= first.connect
+    # the second request reuses the kept-alive connection
+    assert second.connect == 0
+    assert second.ttfb >= 0.02
+    assert second.deserialize > 0
+    assert second.total >= sum(
+        v for k, v in second.as_dict().items() if k not in ("total", "connect", "tls")
+    )
+
+
+def test_raw_response_and_failed_requests():
+    stand_in = StandIn(error_rate=0.5, error_statuses=[503], seed=3)
+    seen = []
+    client = stand_in.client(
+        retry=RetryPolicy(max_attempts=5, base_delay=0), timing_hooks=[seen.append]
+    )
+    raw = client.with_raw_response.doc.deployment.get(
+        doc_name="docs", deployment_id="d"
+    )
+    assert isinstance(raw, RawResponse)
+    assert isinstance(raw.parsed, models.Deployment)
+    assert raw.status_code == 200 and raw.http_response.json()["id"]
+    assert raw.timings is seen[-1]
+    assert raw.timings.attempts == stand_in.injected_errors + 1
+    assert client.with_raw_response is client.with_raw_response
+
+    failing = StandIn(error_rate=1, error_statuses=[500]).client(
+        retry=RetryPolicy(max_attempts=1), timing_hooks=[seen.append]
+    )
+    with pytest.raises(ApiError):
+        failing.health.ping()
+    assert seen[-1].status_code == 500
+    assert seen[-1].deserialize == 0
+
+
+@pytest.mark.asyncio
+async def test_async_raw_response():
+    seen = []
+    stand_in = StandIn(latency=0.01)
+    with LocalServer(stand_in.handler) as server:
+        client = AsyncClient(base_url=server.base_url, timing_hooks=[seen.append])
+        raw = await client.with_raw_response.health.ping()
+    assert raw.parsed.ok
+    assert raw.timings is seen[0]
+    assert raw.timings.connect > 0
+    assert raw.timings.ttfb >= 0.01
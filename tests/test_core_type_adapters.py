@@ -0,0 +1,66 @@
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import AsyncClient, Client
+from local_api_21_py.core import TypeAdapterRegistry, from_encodable, response_adapters
+from local_api_21_py.types import models
+
+SDK_GENERATION = {
+    "api_version_id": "3e4666bf-d5e5-4aa7-b8ce-cefe41c7568a",
+    "created_at": "1970-01-01T00:00:00",
+    "language": "python",
+    "name": "my_sdk_py",
+    "successful": True,
+    "version": "0.1.0",
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=[SDK_GENERATION, SDK_GENERATION])
+
+
+def test_registry_builds_adapter_once_per_type():
+    """Equivalent generic aliases share one compiled adapter."""
+    registry = TypeAdapterRegistry()
+    first = registry.get(typing.List[models.SdkGeneration])
+    second = registry.get(typing.List[models.SdkGeneration])
+
+    assert first is second
+    assert registry.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    registry.clear()
+    assert registry.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_from_encodable_union():
+    """Unions are validated and cached like any other type."""
+    load_with = typing.Union[models.HealthPingResponse, str]
+    assert from_encodable(data="pong", load_with=load_with) == "pong"
+    assert load_with in response_adapters
+
+
+def test_process_response_reuses_adapter(mock_client):
+    """Repeated calls do not compile new validators."""
+    client = mock_client(_handler, client_cls=Client)
+    client.sdk.list()
+    misses = response_adapters.stats()["misses"]
+
+    response = client.sdk.list()
+
+    assert response_adapters.stats()["misses"] == misses
+    assert all(isinstance(r, models.SdkGeneration) for r in response)
+
+
+@pytest.mark.asyncio
+async def test_await_process_response_reuses_adapter(mock_client):
+    """Repeated async calls do not compile new validators."""
+    client = mock_client(_handler, client_cls=AsyncClient)
+    await client.sdk.list()
+    misses = response_adapters.stats()["misses"]
+
+    response = await client.sdk.list()
+
+    assert response_adapters.stats()["misses"] == misses
+    assert len(response) == 2
@@ -0,0 +1,131 @@
+import io
+import os
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py.core import (
+    AsyncBaseClient,
+    FileStream,
+    RetryPolicy,
+    to_content,
+)
+
+SPEC = b"openapi: 3.0.0\n" + b"paths: {}\n" * 50_000
+
+
+@pytest.fixture
+def spec_path(tmp_path) -> str:
+    path = tmp_path / "petstore.yaml"
+    path.write_bytes(SPEC)
+    return str(path)
+
+
+class Recorder:
+    def __init__(self, failures: int = 0) -> None:
+        self.requests: typing.List[httpx.Request] = []
+        self.failures = failures
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if len(self.requests) <= self.failures:
+            return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+
+def test_file_stream_chunks_and_replays(spec_path):
+    stream = FileStream(spec_path, chunk_size=64 * 1024)
+    assert stream.size == len(SPEC)
+    chunks = list(stream)
+    assert max(len(c) for c in chunks) == 64 * 1024
+    assert b"".join(chunks) == SPEC
+
+    stream.seek(0)
+    assert stream.read(15) == b"openapi: 3.0.0\n"
+    assert stream.tell() == 15
+    stream.close()
+
+
+def test_file_stream_starts_at_handle_position():
+    handle = io.BytesIO(b"header|body")
+    handle.seek(7)
+    stream = FileStream(handle)
+    assert stream.size == 4
+    assert b"".join(stream) == b"body"
+
+
+@pytest.mark.asyncio
+async def test_pipe_is_unsized_and_sent_chunked(mock_client):
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"openapi: 3.0.0\n")
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        content = to_content(file=pipe)
+        assert isinstance(content, FileStream)
+        assert content.size is None
+
+        recorder = Recorder()
+        client = mock_client(recorder.handler, client_cls=AsyncBaseClient)
+        await client.request(method="POST", path="/spec", cast_to=dict, content=content)
+
+    request = recorder.requests[0]
+    assert "content-length" not in request.headers
+    assert request.headers["transfer-encoding"] == "chunked"
+    assert request.content == b"openapi: 3.0.0\n"
+
+
+def test_to_content_does_not_read_files(spec_path, mock_client):
+    with open(spec_path, "rb") as f:
+        content = to_content(file=("petstore.yaml", f, "application/yaml"))
+        assert isinstance(content, FileStream)
+        assert f.tell() == 0
+
+        recorder = Recorder(failures=1)
+        client = mock_client(
+            recorder.handler, retry=RetryPolicy(base_delay=0, retry_non_idempotent=True)
+        )
+        client.request(method="POST", path="/spec", cast_to=dict, content=content)
+
+    assert [r.content for r in recorder.requests] == [SPEC, SPEC]
+    assert recorder.requests[0].headers["content-length"] == str(len(SPEC))
+
+
+def test_multipart_file_stream(spec_path, mock_client):
+    recorder = Recorder()
+    client = mock_client(recorder.handler)
+    client.request(
+        method="POST",
+        path="/api/petstore/spec",
+        cast_to=dict,
+        data={"version": "1.4.0"},
+        files=[("openapi", FileStream(spec_path))],
+    )
+    body = recorder.requests[0].content
+    assert SPEC in body
+    assert b'filename="petstore.yaml"' in body
+
+
+@pytest.mark.asyncio
+async def test_await_multipart_reads_off_loop_and_replays(spec_path, mock_client):
+    recorder = Recorder(failures=1)
+    client = mock_client(
+        recorder.handler,
+        client_cls=AsyncBaseClient,
+        retry=RetryPolicy(base_delay=0, retry_non_idempotent=True),
+    )
+    with open(spec_path, "rb") as f:
+        await client.request(
+            method="POST",
+            path="/api/petstore/spec",
+            cast_to=dict,
+            data={"version": "1.4.0"},
+            files=[("openapi", f)],
+        )
+
+    first, second = recorder.requests
+    assert first.content == second.content
+    assert SPEC in first.content
+    assert first.headers["content-length"] == str(len(first.content))
+    assert first.headers["content-type"].startswith("multipart/form-data; boundary=")
+    assert "transfer-encoding" not in first.headers
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+import typing
+
+import httpx
+import pytest
+
+from local_api_21_py import Client, warm_up
+from local_api_21_py.bench.fixtures import example_for
+from local_api_21_py.core import request_adapters, response_adapters
+from local_api_21_py.types import models, params
+from local_api_21_py.warm_up import operation_types
+
+
+def test_schemas_are_built_on_warm_up_only():
+    code = (
+        "from local_api_21_py import warm_up\n"
+        "from local_api_21_py.types import models\n"
+        "assert not models.Deployment.__pydantic_complete__\n"
+        "warm_up(['doc.deployment.get'])\n"
+        "assert models.Deployment.__pydantic_complete__\n"
+        "assert not models.Asset.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_operation_types():
+    client = Client(api_key="key")
+    assert operation_types([client.doc.deployment.trigger]) == [
+        params._SerializerNewDeployment,
+        models.Deployment,
+    ]
+    # helpers are followed to the operations they call
+    assert operation_types(["doc.deployment.wait_for", "asset.iter_all"]) == [
+        models.Deployment,
+        models.ListAssetsPage,
+    ]
+    with pytest.raises(ValueError):
+        operation_types(["doc.nope.get"])
+    with pytest.raises(ValueError):
+        operation_types([client.close])
+
+
+def test_container_types_are_warmed_up():
+    assert operation_types(["doc.version.guide.reorder"]) == [
+        typing.List[params._SerializerReorderGuide],
+        typing.List[models.GuideWithChildren],
+    ]
+    assert operation_types(["api.create"]) == [params._SerializerNewApi, models.Api]
+
+    warm_up(["doc.deployment.list", "doc.version.guide.reorder"])
+    assert typing.List[models.Deployment] in response_adapters
+    assert typing.List[models.GuideWithChildren] in response_adapters
+    assert typing.List[params._SerializerReorderGuide] in request_adapters
+
+
+def test_background_warm_up():
+    future = warm_up(["doc.deployment.trigger", "health.ping"], background=True)
+    built = future.result(timeout=10)
+    assert models.HealthPingResponse in built
+    assert models.Deployment in response_adapters
+    assert params._SerializerNewDeployment in request_adapters
+
+
+def test_recursive_guides_without_rebuild_per_call(mock_client):
+    guide = example_for(models.GuideWithChildren)
+    payload = [{**guide, "children": [{**guide, "id": "child", "children": []}]}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=payload)
+
+    client = mock_client(handler, client_cls=Client)
+    guides = client.doc.version.guide.list(doc_name="docs", doc_version="v1")
+    assert isinstance(guides[0].children[0], models.GuideWithChildren)
+    assert guides[0].children[0].id == "child"